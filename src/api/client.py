@@ -3,12 +3,40 @@ POE Stash API client.
 """
 
 import requests
+import threading
 import time
+from collections import deque
 from .auth import AuthProvider
 
+# (hits, period seconds) rules assumed until GGG's X-Rate-Limit headers arrive
+DEFAULT_RATE_LIMITS = ((45, 60),)
+
+# Spacing between requests until the first response has reported the limits
+# and how many hits the server already counted (e.g. from a tab-list fetch)
+MIN_REQUEST_INTERVAL = 1.5
+
+RATE_LIMIT_HEADERS = ("X-Rate-Limit-Account", "X-Rate-Limit-Ip")
+
+
+def _parse_rules(header: str):
+    """(first, second) int pairs from a "a:b:c,a:b:c" rate-limit header."""
+    rules = []
+    for rule in header.split(","):
+        parts = rule.split(":")
+        if len(parts) >= 2 and parts[0].isdigit() and parts[1].isdigit():
+            rules.append((int(parts[0]), int(parts[1])))
+    return rules
+
 
 class PoEClient:
-    """Client for interacting with the Path of Exile stash API."""
+    """
+    Client for interacting with the Path of Exile stash API.
+    
+    Safe to share between threads: each thread gets its own HTTP session,
+    and requests are spaced to stay inside the rate limits the server
+    reports. Until the first response arrives, requests are also kept
+    MIN_REQUEST_INTERVAL apart.
+    """
     
     BASE_URL = "https://www.pathofexile.com"
 
@@ -16,10 +44,23 @@ class PoEClient:
         self.auth_provider = auth_provider
         self.account_name = account_name
         self.league = league
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-        })
+        self._local = threading.local()
+        self.rate_limits = DEFAULT_RATE_LIMITS
+        self._limits_known = False
+        self._request_times = deque()
+        self._blocked_until = 0.0
+        self._rate_lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        """The calling thread's session; requests.Session is not thread-safe."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            session.headers.update({
+                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+            })
+        return session
 
     def get_stash_tab_list(self):
         """
@@ -46,20 +87,81 @@ class PoEClient:
         headers = self.auth_provider.get_headers()
         
         try:
+            self._wait_for_slot()
             response = self.session.get(url, params=params, headers=headers)
             
             if response.status_code == 429:
                 retry_after = int(response.headers.get("Retry-After", 60))
                 print(f"Rate limited! Waiting {retry_after}s...")
                 time.sleep(retry_after)
+                self._wait_for_slot()
                 response = self.session.get(url, params=params, headers=headers)
 
+            self._update_rate_limits(response.headers)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
             print(f"Error fetching stash tab {tab_index}: {e}")
             return None
 
+    def _wait_for_slot(self):
+        """Block until one more request fits inside every rate-limit rule."""
+        while True:
+            with self._rate_lock:
+                now = time.monotonic()
+                longest = max(period for _, period in self.rate_limits)
+                while self._request_times and now - self._request_times[0] >= longest:
+                    self._request_times.popleft()
+                
+                wait = self._blocked_until - now
+                if not self._limits_known and self._request_times:
+                    wait = max(wait, self._request_times[-1] + MIN_REQUEST_INTERVAL - now)
+                for hits, period in self.rate_limits:
+                    recent = [t for t in self._request_times if now - t < period]
+                    if len(recent) >= hits:
+                        # Free once the oldest request that keeps us at the limit expires
+                        wait = max(wait, recent[-hits] + period - now)
+                
+                if wait <= 0:
+                    self._request_times.append(now)
+                    return
+            time.sleep(wait)
+
+    def _update_rate_limits(self, headers):
+        """
+        Adopt the "hits:period:penalty,..." rules GGG sends with each response.
+        
+        The first response's "-State" headers ("hits:period:restricted")
+        also seed the request history with hits the server counted before
+        this client existed, and honour any active restriction.
+        """
+        rules = []
+        for key in RATE_LIMIT_HEADERS:
+            rules.extend(_parse_rules(headers.get(key, "")))
+        
+        with self._rate_lock:
+            if rules:
+                self.rate_limits = tuple(rules)
+            if self._limits_known or not rules:
+                return
+            self._limits_known = True
+            
+            now = time.monotonic()
+            extra = 0
+            for key in RATE_LIMIT_HEADERS:
+                for rule in headers.get(key + "-State", "").split(","):
+                    parts = rule.split(":")
+                    if len(parts) < 3 or not all(p.isdigit() for p in parts[:3]):
+                        continue
+                    hits, period, restricted = (int(p) for p in parts[:3])
+                    local = sum(1 for t in self._request_times if now - t < period)
+                    extra = max(extra, hits - local)
+                    if restricted:
+                        self._blocked_until = max(self._blocked_until, now + restricted)
+            
+            # Counted as just made, so they expire no earlier than the server's
+            self._request_times.extend([now] * extra)
+
     def get_first_stash_tab(self):
         return self.get_stash_items(0)
 
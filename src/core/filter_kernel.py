@@ -0,0 +1,46 @@
+"""
+Compiled row filter for ScanColumns.
+
+Optional: needs numba. Without it ScanColumns.mask uses plain NumPy ops.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+if HAS_NUMBA:
+    @njit(cache=True)
+    def _contains(sorted_ids, value):
+        """Membership test on a sorted id array (no tuples or sets in nopython mode)."""
+        if sorted_ids.size == 0:
+            return False
+        i = np.searchsorted(sorted_ids, value)
+        return i < sorted_ids.size and sorted_ids[i] == value
+
+    @njit(cache=True)
+    def filter_mask(profits, types, rewards, tiers,
+                    excl_types, excl_rewards, excl_tiers,
+                    incl_types, incl_rewards, incl_tiers,
+                    min_profit):
+        """
+        One pass over the columns with ScanColumns.mask's semantics:
+        an include match always passes, otherwise the profit threshold
+        must pass and no exclusion may match. Id arrays must be sorted.
+        """
+        n = profits.shape[0]
+        out = np.empty(n, dtype=np.bool_)
+        for i in range(n):
+            if (_contains(incl_types, types[i]) or _contains(incl_rewards, rewards[i])
+                    or _contains(incl_tiers, tiers[i])):
+                out[i] = True
+            else:
+                out[i] = (profits[i] >= min_profit
+                          and not _contains(excl_types, types[i])
+                          and not _contains(excl_rewards, rewards[i])
+                          and not _contains(excl_tiers, tiers[i]))
+        return out
@@ -1,185 +1,106 @@
 """
-Filtering rules engine for item evaluation.
+Item filtering: filter config reading and vectorised scan masks.
 """
 
 from typing import List, Dict, Any
 
+import numpy as np
 
-class FilterRule:
-    """Base class for filter rules."""
-    
-    def check(self, item: Dict[str, Any], context: Dict[str, Any]) -> bool:
-        """
-        Returns True if the item passes this specific rule.
-        Context can contain pricing info, global config, etc.
-        """
-        return True
+from .filter_kernel import HAS_NUMBA
+if HAS_NUMBA:
+    from .filter_kernel import filter_mask
 
 
-class ValueRule(FilterRule):
-    """Filter by minimum profit value."""
-    
-    def __init__(self, min_profit: float):
-        self.min_profit = min_profit
-
-    def check(self, item: Dict[str, Any], context: Dict[str, Any]) -> bool:
-        profit = context.get('profit', 0)
-        return profit >= self.min_profit
+FILTER_LIST_KEYS = (
+    "excluded_types", "included_types",
+    "excluded_rewards", "included_rewards",
+    "excluded_tiers", "included_tiers",
+)
 
 
-class EncounterRule(FilterRule):
-    """Handles encounter type exclusions only. Inclusions are handled as overrides."""
-    
-    def __init__(self, excluded_types: List[str] = None):
-        self.excluded_types = set(excluded_types) if excluded_types else set()
+def read_filter_config(cfg: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    The filter settings from a config dict, read once: min_profit plus
+    each list as a frozenset (empty if unset).
+    """
+    filters = {"min_profit": cfg.get("min_profit", 20)}
+    for key in FILTER_LIST_KEYS:
+        filters[key] = frozenset(cfg.get(key) or ())
+    return filters
 
-    def check(self, item: Dict[str, Any], context: Dict[str, Any]) -> bool:
-        enc_type = item.get('type')
-        if enc_type in self.excluded_types:
-            return False
-        return True
 
-
-class EncounterIncludeOverride(FilterRule):
-    """Override rule: if encounter type is in included list, always highlight."""
+class ScanColumns:
+    """
+    Parsed scan items packed into parallel NumPy columns.
     
-    def __init__(self, included_types: List[str] = None):
-        self.included_types = set(included_types) if included_types else set()
-
-    def check(self, item: Dict[str, Any], context: Dict[str, Any]) -> bool:
-        if not self.included_types:
-            return False
-        enc_type = item.get('type')
-        return enc_type in self.included_types
-
-
-class MonsterLifeRule(FilterRule):
-    """Handles monster life exclusions only. Inclusions are handled as overrides."""
+    Re-filtering a finished scan (slider drags, filter edits) then becomes a
+    few vectorised compares instead of a Python loop over the items. Row i
+    belongs to the i-th item the columns were built from. Type and reward
+    names are interned to small ints.
+    """
     
-    def __init__(self, excluded_pcts: List[int] = None):
-        self.excluded_pcts = set(excluded_pcts) if excluded_pcts else set()
-
-    def check(self, item: Dict[str, Any], context: Dict[str, Any]) -> bool:
-        life_pct = item.get('monster_life_pct', 0)
-        if life_pct in self.excluded_pcts:
-            return False
-        return True
-
-
-class MonsterLifeIncludeOverride(FilterRule):
-    """Override rule: if monster life % is in included list, always highlight."""
-    
-    def __init__(self, included_pcts: List[int] = None):
-        self.included_pcts = set(included_pcts) if included_pcts else set()
-
-    def check(self, item: Dict[str, Any], context: Dict[str, Any]) -> bool:
-        if not self.included_pcts:
-            return False
-        life_pct = item.get('monster_life_pct', 0)
-        return life_pct in self.included_pcts
-
-
-class RewardRule(FilterRule):
-    """Handles reward exclusions only. Inclusions are handled as overrides."""
-    
-    def __init__(self, excluded_rewards: List[str] = None):
-        self.excluded_rewards = set(excluded_rewards) if excluded_rewards else set()
-
-    def check(self, item: Dict[str, Any], context: Dict[str, Any]) -> bool:
-        rew_name = item.get('reward')
-        if rew_name in self.excluded_rewards:
-            return False
-        return True
-
-
-class RewardIncludeOverride(FilterRule):
-    """Override rule: if reward is in included list, always highlight (bypass other filters)."""
+    def __init__(self, parsed_items: List[Dict[str, Any]]):
+        self.type_ids = {}
+        self.reward_ids = {}
+        
+        n = len(parsed_items)
+        self.profits = np.empty(n, dtype=np.float64)
+        self.types = np.empty(n, dtype=np.int32)
+        self.rewards = np.empty(n, dtype=np.int32)
+        self.tiers = np.empty(n, dtype=np.int16)
+        
+        for i, parsed in enumerate(parsed_items):
+            self.profits[i] = parsed.get('_net_profit_chaos', 0.0)
+            self.types[i] = self.type_ids.setdefault(parsed.get('type'), len(self.type_ids))
+            self.rewards[i] = self.reward_ids.setdefault(parsed.get('reward'), len(self.reward_ids))
+            self.tiers[i] = parsed.get('monster_life_pct', 0)
     
-    def __init__(self, included_rewards: List[str] = None):
-        self.included_rewards = set(included_rewards) if included_rewards else set()
-
-    def check(self, item: Dict[str, Any], context: Dict[str, Any]) -> bool:
-        if not self.included_rewards:
-            return False
-        rew_name = item.get('reward')
-        return rew_name in self.included_rewards
-
-
-class TierRule(FilterRule):
-    """Override rule for always highlighting specific tiers."""
+    def __len__(self):
+        return len(self.profits)
     
-    def __init__(self, always_highlight_tiers: List[int]):
-        self.always_highlight_tiers = set(always_highlight_tiers)
-
-    def check(self, item: Dict[str, Any], context: Dict[str, Any]) -> bool:
-        return item.get('monster_life_pct', 0) in self.always_highlight_tiers
-
-
-class GenericWhitelistBlacklistRule(FilterRule):
-    """Generic rule that can whitelist or blacklist any field."""
+    @staticmethod
+    def _ids(names, interned: Dict[Any, int]) -> np.ndarray:
+        """Sorted ids of the names seen in this scan; names never seen cannot match."""
+        return np.unique(np.array([interned[n] for n in names or () if n in interned], dtype=np.int32))
     
-    def __init__(self, field_extractor, whitelist: List[str] = None, blacklist: List[str] = None):
-        self.field_extractor = field_extractor
-        self.whitelist = set(whitelist) if whitelist else set()
-        self.blacklist = set(blacklist) if blacklist else set()
-
-    def check(self, item: Dict[str, Any], context: Dict[str, Any]) -> bool:
-        val = self.field_extractor(item)
-        
-        # Blacklist: If match, FAIL
-        if val in self.blacklist:
-            return False
-            
-        # Whitelist: If whitelist exists AND val NOT in it, FAIL
-        if self.whitelist and val not in self.whitelist:
-            return False
-            
-        return True
-
-
-class FilteringRuleEngine:
-    """Engine for evaluating items against multiple filter rules."""
+    @staticmethod
+    def _tiers(tiers) -> np.ndarray:
+        """Sorted tier array from any iterable (lists from the dialog, frozensets from read_filter_config)."""
+        return np.unique(np.fromiter((int(t) for t in tiers or ()), dtype=np.int16))
     
-    def __init__(self):
-        self.rules = []
-        self.overrides = []  # Rules that if passed, immediately accept the item
-
-    def add_rule(self, rule: FilterRule):
-        self.rules.append(rule)
-
-    def add_override(self, rule: FilterRule):
-        self.overrides.append(rule)
-
-    def evaluate(self, item: Dict[str, Any], price_fetcher) -> bool:
+    def mask(self, config: Dict[str, Any]) -> np.ndarray:
         """
-        Determines if an item should be highlighted.
-        Calculates profit first and adds to context.
+        Boolean mask of the rows to highlight under config: any include
+        matches, or the profit threshold passes and no exclusion matches.
         """
-        # 1. Calculate Value
-        sac_name = item.get('sacrifice')
-        sac_qty = item.get('sacrifice_count', 1)
-        rew_name = item.get('reward')
-        rew_qty = item.get('reward_count', 1)
+        min_profit = float(config.get("min_profit", 20))
+        excl_types = self._ids(config.get("excluded_types"), self.type_ids)
+        excl_rewards = self._ids(config.get("excluded_rewards"), self.reward_ids)
+        excl_tiers = self._tiers(config.get("excluded_tiers"))
+        incl_types = self._ids(config.get("included_types"), self.type_ids)
+        incl_rewards = self._ids(config.get("included_rewards"), self.reward_ids)
+        incl_tiers = self._tiers(config.get("included_tiers"))
         
-        sac_price = price_fetcher.get_price(sac_name) * sac_qty
-        rew_price = price_fetcher.get_price(rew_name) * rew_qty
+        if HAS_NUMBA:
+            return filter_mask(self.profits, self.types, self.rewards, self.tiers,
+                               excl_types, excl_rewards, excl_tiers,
+                               incl_types, incl_rewards, incl_tiers,
+                               min_profit)
         
-        profit = rew_price - sac_price
+        passed = self.profits >= min_profit
         
-        context = {
-            'profit': profit,
-            'sac_price': sac_price,
-            'rew_price': rew_price
-        }
-
-        # 2. Check Overrides first - if any override passes, accept immediately
-        for rule in self.overrides:
-            if rule.check(item, context):
-                return True
-
-        # 3. Check Standard Rules - all must pass
-        for rule in self.rules:
-            if not rule.check(item, context):
-                return False
-
-        return True
+        if excl_types.size:
+            passed &= ~np.isin(self.types, excl_types)
+        if excl_rewards.size:
+            passed &= ~np.isin(self.rewards, excl_rewards)
+        if excl_tiers.size:
+            passed &= ~np.isin(self.tiers, excl_tiers)
+        
+        if incl_types.size:
+            passed |= np.isin(self.types, incl_types)
+        if incl_rewards.size:
+            passed |= np.isin(self.rewards, incl_rewards)
+        if incl_tiers.size:
+            passed |= np.isin(self.tiers, incl_tiers)
+        
+        return passed
@@ -37,19 +37,8 @@ class UltimatumParser:
 
             elif 'Requires Sacrifice' in name:
                 if len(values) >= 1:
-                    sac_name = values[0][0]
-                    sac_qty = 1
-                    
-                    if len(values) >= 2:
-                        qty_str = values[1][0]
-                        if qty_str.startswith('x'):
-                            try:
-                                sac_qty = int(qty_str[1:])
-                            except ValueError:
-                                pass
-                    
-                    result['sacrifice'] = self._normalize_name(sac_name)
-                    result['sacrifice_count'] = sac_qty
+                    result['sacrifice'] = self._normalize_name(values[0][0])
+                    result['sacrifice_count'] = self._parse_qty(values)
 
             elif 'Reward' in name:
                 if values:
@@ -59,20 +48,14 @@ class UltimatumParser:
                         result['reward'] = result['sacrifice']
                         result['reward_count'] = result['sacrifice_count'] * 2
                     else:
-                        rew_qty = 1
-                        if len(values) >= 2:
-                            qty_str = values[1][0]
-                            if qty_str.startswith('x'):
-                                try:
-                                    rew_qty = int(qty_str[1:])
-                                except ValueError:
-                                    pass
-                        
                         result['reward'] = self._normalize_name(rew_text)
-                        result['reward_count'] = rew_qty
+                        result['reward_count'] = self._parse_qty(values)
 
         explicit_mods = item_data.get('explicitMods', [])
         for mod in explicit_mods:
+            # Substring test first; the regex only runs on the life mod itself
+            if "Monster Life" not in mod:
+                continue
             life_match = self.RE_MONSTER_LIFE.search(mod)
             if life_match:
                 result['monster_life_pct'] = int(life_match.group(1))
@@ -80,6 +63,15 @@ class UltimatumParser:
 
         return result
 
+    @staticmethod
+    def _parse_qty(values: list) -> int:
+        """Quantity from a property's second value ("x3"), defaulting to 1."""
+        if len(values) >= 2:
+            qty_str = values[1][0]
+            if qty_str.startswith('x') and qty_str[1:].isdecimal():
+                return int(qty_str[1:])
+        return 1
+
     def _normalize_name(self, name: str) -> str:
         """Normalizes item names for price lookup."""
         if name.endswith(" Orbs"):
@@ -120,3 +120,14 @@ class NinjaPriceFetcher:
     def get_price(self, item_name: str) -> float:
         return self.prices.get(item_name, 0.0)
 
+    def get_prices(self, item_names) -> dict:
+        """Prices for many names at once, 0.0 for unknown ones."""
+        prices = self.prices
+        return {name: prices.get(name, 0.0) for name in item_names}
+
+    def compute_profit(self, parsed: dict) -> float:
+        """Chaos value of a parsed ultimatum's reward minus its sacrifice."""
+        rew_price = self.get_price(parsed.get('reward')) * parsed.get('reward_count', 1)
+        sac_price = self.get_price(parsed.get('sacrifice')) * parsed.get('sacrifice_count', 1)
+        return rew_price - sac_price
+
@@ -4,6 +4,7 @@ Manages the Node.js trade sniper as a subprocess.
 """
 
 import os
+import shutil
 import subprocess
 import threading
 from PyQt6.QtCore import QObject, pyqtSignal
@@ -31,6 +32,7 @@ class TradeService(QObject):
         self.process = None
         self.output_thread = None
         self._running = False
+        self._commands = {}  # Executable name -> resolved path (or None)
     
     @property
     def is_running(self) -> bool:
@@ -40,21 +42,35 @@ class TradeService(QObject):
         """Get the path to the trade monitor script."""
         return os.path.join(self.service_dir, "trade_monitor.js")
     
-    def check_dependencies(self) -> tuple:
-        """Check if Node.js and npm are available."""
-        try:
-            result = subprocess.run("node --version", capture_output=True, text=True, shell=True)
-            node_version = result.stdout.strip() if result.returncode == 0 else None
-        except Exception:
-            node_version = None
+    def resolve_command(self, name: str):
+        """
+        Resolve an executable on PATH once (e.g. npm -> ...\\npm.cmd).
         
+        Running the absolute path with shell=False avoids starting cmd.exe
+        for every call. Returns None if not found; a miss is re-checked next
+        time in case it was just installed.
+        """
+        path = self._commands.get(name)
+        if path is None:
+            path = shutil.which(name)
+            if path:
+                self._commands[name] = path
+        return path
+    
+    def _command_version(self, name: str):
+        """Return `<name> --version` output, or None if unavailable."""
+        path = self.resolve_command(name)
+        if not path:
+            return None
         try:
-            result = subprocess.run("npm --version", capture_output=True, text=True, shell=True)
-            npm_version = result.stdout.strip() if result.returncode == 0 else None
+            result = subprocess.run([path, "--version"], capture_output=True, text=True)
+            return result.stdout.strip() if result.returncode == 0 else None
         except Exception:
-            npm_version = None
-        
-        return (node_version, npm_version)
+            return None
+    
+    def check_dependencies(self) -> tuple:
+        """Check if Node.js and npm are available."""
+        return (self._command_version("node"), self._command_version("npm"))
     
     def install_dependencies(self):
         """Install npm dependencies."""
@@ -62,15 +78,19 @@ class TradeService(QObject):
             self.log_output.emit("Error: package.json not found in trade_service/")
             return False
         
+        npm_cmd = self.resolve_command("npm")
+        if not npm_cmd:
+            self.log_output.emit("Error: npm not found. Please install Node.js.")
+            return False
+        
         self.log_output.emit("Installing npm dependencies...")
         
         try:
             result = subprocess.run(
-                "npm install",
+                [npm_cmd, "install"],
                 cwd=self.service_dir,
                 capture_output=True,
-                text=True,
-                shell=True  # Use shell to access PATH
+                text=True
             )
             
             if result.returncode == 0:
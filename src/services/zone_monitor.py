@@ -3,15 +3,20 @@ Zone monitoring service - watches Client.txt for zone changes.
 """
 
 import os
-import threading
-import time
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QObject, QFileSystemWatcher, QTimer, pyqtSignal
+
+# Fallback poll in case the OS coalesces or drops change notifications
+# (Windows can defer them while PoE keeps Client.txt open)
+FALLBACK_POLL_MS = 250  # Zone changes show up within a quarter second even unwatched
 
 
 class ZoneMonitor(QObject):
     """
     Monitors the POE Client.txt log file to detect zone changes.
     Emits signals when the player enters a new zone.
+    
+    New lines are read when QFileSystemWatcher reports the file changed,
+    so the monitor is idle between log writes. Must live on the GUI thread.
     """
     
     zone_changed = pyqtSignal(str)  # Emits zone name
@@ -21,7 +26,14 @@ class ZoneMonitor(QObject):
         self.log_path = log_path
         self.current_zone = "Unknown"
         self.running = False
-        self._thread = None
+        self._log_offset = 0
+        self._partial = b""
+        
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._on_file_changed)
+        
+        self._poll_timer = QTimer(self)
+        self._poll_timer.timeout.connect(self._read_new_lines)
     
     def set_log_path(self, path: str):
         """Set the path to Client.txt."""
@@ -33,45 +45,66 @@ class ZoneMonitor(QObject):
             print(f"ZoneMonitor: Log path not found: {self.log_path}")
             return False
         
+        # Only lines written from now on matter
+        self._log_offset = os.path.getsize(self.log_path)
+        self._partial = b""
+        
         self.running = True
-        self._thread = threading.Thread(target=self._monitor_loop, daemon=True)
-        self._thread.start()
+        self._watcher.addPath(self.log_path)
+        self._poll_timer.start(FALLBACK_POLL_MS)
         print(f"ZoneMonitor: Monitoring {self.log_path}")
         return True
     
     def stop(self):
         """Stop monitoring."""
         self.running = False
-        if self._thread:
-            self._thread.join(timeout=2.0)
-            self._thread = None
+        self._poll_timer.stop()
+        if self._watcher.files():
+            self._watcher.removePaths(self._watcher.files())
     
-    def _monitor_loop(self):
-        """Background thread that tails the log file."""
+    def _on_file_changed(self, path: str):
+        """Handle a change notification for Client.txt."""
+        # Some writers replace the file, which drops it from the watcher
+        if path not in self._watcher.files() and os.path.exists(path):
+            self._watcher.addPath(path)
+        self._read_new_lines()
+    
+    def _read_new_lines(self):
+        """Read bytes appended since the last read and parse complete lines."""
+        if not self.running:
+            return
+        
         try:
-            with open(self.log_path, 'r', encoding='utf-8', errors='ignore') as f:
-                # Seek to end of file
-                f.seek(0, 2)
-                
-                while self.running:
-                    line = f.readline()
-                    if not line:
-                        time.sleep(0.1)
-                        continue
-                    
-                    # Check for zone entry
-                    if ": You have entered" in line:
-                        try:
-                            parts = line.split(": You have entered ")
-                            if len(parts) > 1:
-                                zone = parts[1].strip().rstrip('.')
-                                if zone != self.current_zone:
-                                    self.current_zone = zone
-                                    self.zone_changed.emit(zone)
-                        except Exception:
-                            pass
-        except Exception as e:
+            size = os.path.getsize(self.log_path)
+            if size == self._log_offset:
+                return
+            if size < self._log_offset:
+                # Log was truncated or rotated
+                self._log_offset = 0
+                self._partial = b""
+            
+            with open(self.log_path, 'rb') as f:
+                f.seek(self._log_offset)
+                chunk = f.read()
+            self._log_offset += len(chunk)
+        except OSError as e:
             print(f"ZoneMonitor Error: {e}")
+            return
+        
+        lines = (self._partial + chunk).split(b"\n")
+        self._partial = lines.pop()  # Incomplete trailing line, if any
+        
+        for raw in lines:
+            line = raw.decode('utf-8', errors='ignore')
+            
+            # Check for zone entry
+            if ": You have entered" in line:
+                parts = line.split(": You have entered ")
+                if len(parts) > 1:
+                    zone = parts[1].strip().rstrip('.')
+                    if zone != self.current_zone:
+                        self.current_zone = zone
+                        self.zone_changed.emit(zone)
     
     def get_current_zone(self) -> str:
         """Get the current zone name."""
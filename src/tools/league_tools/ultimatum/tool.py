@@ -2,38 +2,88 @@
 Ultimatum Helper Tool - Scan stash tabs for profitable Inscribed Ultimatums.
 """
 
+import threading
 import time
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import numpy as np
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, 
     QPushButton, QSlider, QTextEdit, QMessageBox
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QRect
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal, QRect
 
 from tools.base_tool import BaseTool
 from api.auth import SessionAuthProvider
 from api.client import PoEClient
 from core.valuation import NinjaPriceFetcher
 from core.parser import UltimatumParser
-from core.filters import (
-    FilteringRuleEngine, ValueRule, 
-    EncounterRule, EncounterIncludeOverride,
-    RewardRule, RewardIncludeOverride,
-    MonsterLifeRule, MonsterLifeIncludeOverride
-)
+from core.filters import ScanColumns, read_filter_config
 from ui.components.stash_selector import StashTabSelector
 from ui.components.filter_dialog import FilterConfigDialog
 from utils.logger import DebugLogger
 
+# Stash tabs fetched concurrently; PoEClient still enforces the rate limits
+FETCH_WORKERS = 4
+
+# Reward as (reward_name, reward_count, sacrifice_name, sacrifice_count); the
+# parser always sets all four keys, so this builds the tuple in one C call
+_reward_key = itemgetter('reward', 'reward_count', 'sacrifice', 'sacrifice_count')
+
+# poe.ninja prices move over minutes, so scans and re-filters share a fetcher
+PRICE_CACHE_TTL = 600
+_PRICE_CACHE = {}  # league -> (monotonic fetch time, NinjaPriceFetcher)
+_PRICE_CACHE_LOCK = threading.Lock()
+
+# Quiet time after the last slider tick before re-filtering
+PROFIT_DEBOUNCE_MS = 100
+
+# Log lines arriving within this window are appended together
+LOG_FLUSH_MS = 100
+
+
+def _get_price_fetcher(league: str) -> NinjaPriceFetcher:
+    """Return a price fetcher for the league, fetching again once the cached one is stale."""
+    with _PRICE_CACHE_LOCK:
+        cached = _PRICE_CACHE.get(league)
+        if cached and time.monotonic() - cached[0] < PRICE_CACHE_TTL:
+            return cached[1]
+        
+        price_fetcher = NinjaPriceFetcher(league)
+        price_fetcher.fetch_all_prices()
+        
+        # Only the prices are needed from here on
+        try:
+            price_fetcher.session.close()
+        except Exception:
+            pass
+        del price_fetcher.session
+        
+        _PRICE_CACHE[league] = (time.monotonic(), price_fetcher)
+        return price_fetcher
+
 
-class ScanWorker(QThread):
-    """Background worker for scanning stash tabs."""
+class ScanWorkerSignals(QObject):
+    """Signals for ScanWorker (a QRunnable cannot carry its own)."""
     
     log_signal = pyqtSignal(str)
-    result_signal = pyqtSignal(list, dict, list, object)
+    result_signal = pyqtSignal(dict, list, object, object)
     progress_signal = pyqtSignal(int, int)
+    finished = pyqtSignal()
+
+
+class ScanWorker(QRunnable):
+    """
+    Background job for scanning stash tabs.
+    
+    Runs on QThreadPool.globalInstance(), so repeat scans reuse a pooled
+    thread instead of starting a new one. Connect to .signals.
+    """
 
     def __init__(self, session_id, account, league, config, tab_indices, debug_mode=False):
         super().__init__()
+        self.setAutoDelete(False)  # The widget keeps a reference
+        self.signals = ScanWorkerSignals()
         self.session_id = session_id
         self.account = account
         self.league = league
@@ -43,131 +93,127 @@ class ScanWorker(QThread):
         DebugLogger.set_enabled(debug_mode)
 
     def run(self):
-        self.log_signal.emit("Initializing API Client...")
+        try:
+            self.scan()
+        finally:
+            self.signals.finished.emit()
+
+    def scan(self):
+        self.signals.log_signal.emit("Initializing API Client...")
         DebugLogger.log("Scan started.", "Worker")
         
         auth = SessionAuthProvider(self.session_id)
         client = PoEClient(auth, self.account, self.league)
 
-        self.log_signal.emit("Fetching Prices...")
-        price_fetcher = NinjaPriceFetcher(self.league)
-        price_fetcher.fetch_all_prices()
+        self.signals.log_signal.emit("Fetching Prices...")
+        price_fetcher = _get_price_fetcher(self.league)
         DebugLogger.log(f"Prices fetched: {len(price_fetcher.prices)} items.", "Prices")
 
         parser = UltimatumParser()
-        engine = FilteringRuleEngine()
-        
-        min_profit = self.config.get("min_profit", 20)
-        engine.add_rule(ValueRule(min_profit=min_profit))
-        
-        # Exclusion rules (standard rules - all must pass)
-        if self.config.get("excluded_types"):
-            engine.add_rule(EncounterRule(excluded_types=self.config.get("excluded_types")))
-
-        if self.config.get("excluded_rewards"):
-            engine.add_rule(RewardRule(excluded_rewards=self.config.get("excluded_rewards")))
-            
-        if self.config.get("excluded_tiers"):
-            engine.add_rule(MonsterLifeRule(excluded_pcts=self.config.get("excluded_tiers")))
-        
-        # Include overrides (if any match, item is highlighted regardless of other rules)
-        if self.config.get("included_types"):
-            engine.add_override(EncounterIncludeOverride(included_types=self.config.get("included_types")))
-
-        if self.config.get("included_rewards"):
-            engine.add_override(RewardIncludeOverride(included_rewards=self.config.get("included_rewards")))
-            
-        if self.config.get("included_tiers"):
-            engine.add_override(MonsterLifeIncludeOverride(included_pcts=self.config.get("included_tiers")))
 
-        all_highlights = []
-        all_parsed_items = []
+        parsed_by_tab = {}
+        profit_by_reward = {}
         found_stats = {
             'types': set(),
             'rewards': set(),
             'tiers': set()
         }
         
-        total_found = 0
         total_tabs = len(self.tab_indices)
 
-        self.log_signal.emit(f"Scanning {total_tabs} tabs...")
+        self.signals.log_signal.emit(f"Scanning {total_tabs} tabs...")
         DebugLogger.log(f"Scanning tabs: {self.tab_indices}", "Worker")
 
-        for i, tab_idx in enumerate(self.tab_indices):
-            self.log_signal.emit(f"Fetching Tab Index {tab_idx} ({i+1}/{total_tabs})...")
-            
-            if i > 0:
-                time.sleep(1.5) 
-            
-            data = client.get_stash_items(tab_idx)
-            if not data or 'items' not in data:
-                self.log_signal.emit(f"Failed to fetch tab {tab_idx}.")
-                DebugLogger.log(f"Failed fetch for tab {tab_idx}", "API")
-                continue
-            
-            is_quad = data.get('quadLayout', False)
-            items = data.get('items', [])
-            DebugLogger.log(f"Tab {tab_idx} contains {len(items)} items. Quad: {is_quad}", "API")
+        # The client spaces requests to GGG's rate limits, so a few tabs can be
+        # in flight while this thread parses the ones that already arrived
+        with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+            futures = {pool.submit(client.get_stash_items, tab_idx): tab_idx
+                       for tab_idx in self.tab_indices}
             
-            for item in items:
-                parsed = parser.parse_item(item)
-                if parsed:
-                    found_stats['types'].add(parsed.get('type', 'Unknown'))
-                    # Store reward as tuple: (reward_name, reward_count, sacrifice_name, sacrifice_count)
-                    reward_tuple = (
-                        parsed.get('reward', 'Unknown'),
-                        parsed.get('reward_count', 1),
-                        parsed.get('sacrifice', None),
-                        parsed.get('sacrifice_count', 1)
-                    )
-                    found_stats['rewards'].add(reward_tuple)
-                    found_stats['tiers'].add(parsed.get('monster_life_pct', 0))
-                    
-                    all_parsed_items.append({
-                        'parsed': parsed,
-                        'item': item,
-                        'tab_index': tab_idx,
-                        'is_quad': is_quad
-                    })
-
-                    if engine.evaluate(parsed, price_fetcher):
-                        DebugLogger.log("-> Highlighted (Passed Filters)", "Engine")
+            for done, future in enumerate(as_completed(futures), 1):
+                # Popped so neither the dict nor the future keeps the tab's JSON alive
+                tab_idx = futures.pop(future)
+                self.signals.log_signal.emit(f"Fetched Tab Index {tab_idx} ({done}/{total_tabs})")
+                
+                data = future.result()
+                del future
+                if not data or 'items' not in data:
+                    self.signals.log_signal.emit(f"Failed to fetch tab {tab_idx}.")
+                    if DebugLogger.enabled:
+                        DebugLogger.log(f"Failed fetch for tab {tab_idx}", "API")
+                    self.signals.progress_signal.emit(done, total_tabs)
+                    continue
+                
+                is_quad = data.get('quadLayout', False)
+                items = data.get('items', [])
+                del data  # Tab metadata etc. is not needed past this point
+                if DebugLogger.enabled:
+                    DebugLogger.log(f"Tab {tab_idx} contains {len(items)} items. Quad: {is_quad}", "API")
+                
+                tab_parsed = parsed_by_tab[tab_idx] = []
+                
+                for item in items:
+                    parsed = parser.parse_item(item)
+                    if parsed:
+                        # Prices are fixed for this scan, so re-filters only compare a float;
+                        # ultimatums sharing a reward/sacrifice pair are priced once
+                        reward_key = _reward_key(parsed)
+                        profit = profit_by_reward.get(reward_key)
+                        if profit is None:
+                            profit = profit_by_reward[reward_key] = price_fetcher.compute_profit(parsed)
+                        parsed['_net_profit_chaos'] = profit
+                        found_stats['types'].add(parsed.get('type', 'Unknown'))
+                        found_stats['rewards'].add(reward_key)
+                        found_stats['tiers'].add(parsed.get('monster_life_pct', 0))
                         
-                        all_highlights.append({
+                        # Keep only the placement of the raw item; the rest of its
+                        # JSON (mods, properties, icons) is already parsed
+                        parsed.pop('original_item', None)
+                        tab_parsed.append({
+                            'parsed': parsed,
+                            'item': {
+                                'x': item['x'],
+                                'y': item['y'],
+                                'w': item.get('w', 1),
+                                'h': item.get('h', 1),
+                            },
                             'tab_index': tab_idx,
-                            'x': item['x'], 
-                            'y': item['y'], 
-                            'w': item.get('w', 1), 
-                            'h': item.get('h', 1),
-                            'name': parsed.get('reward', 'Unknown'),
                             'is_quad': is_quad
                         })
-                        total_found += 1
 
-            self.progress_signal.emit(i+1, total_tabs)
+                self.signals.progress_signal.emit(done, total_tabs)
+
+        # Tabs finish in any order; report them in the order they were selected
+        all_parsed_items = []
+        for tab_idx in self.tab_indices:
+            all_parsed_items.extend(parsed_by_tab.get(tab_idx, ()))
+
+        # Column form of the same items for fast re-filtering on the GUI thread
+        columns = ScanColumns([entry['parsed'] for entry in all_parsed_items])
 
-        self.log_signal.emit(f"Scan Complete. Found {total_found} items.")
+        # Highlights themselves are built by the widget's re-filter
+        total_found = int(np.count_nonzero(columns.mask(self.config)))
+        self.signals.log_signal.emit(f"Scan Complete. Found {total_found} items.")
         DebugLogger.log(f"Scan complete. Total found: {total_found}", "Worker")
-        
-        if hasattr(price_fetcher, 'session'):
-            try:
-                price_fetcher.session.close()
-            except:
-                pass
-            del price_fetcher.session
 
-        self.result_signal.emit(all_highlights, found_stats, all_parsed_items, price_fetcher)
+        self.signals.result_signal.emit(found_stats, all_parsed_items, columns, price_fetcher)
 
 
-class TabListWorker(QThread):
-    """Fetches list of tabs only."""
+class TabListWorkerSignals(QObject):
+    """Signals for TabListWorker."""
     
     finished_signal = pyqtSignal(list)
     error_signal = pyqtSignal(str)
+    finished = pyqtSignal()
+
+
+class TabListWorker(QRunnable):
+    """Fetches list of tabs only, on the global thread pool."""
 
     def __init__(self, session_id, account, league):
         super().__init__()
+        self.setAutoDelete(False)
+        self.signals = TabListWorkerSignals()
         self.session_id = session_id
         self.account = account
         self.league = league
@@ -177,9 +223,11 @@ class TabListWorker(QThread):
             auth = SessionAuthProvider(self.session_id)
             client = PoEClient(auth, self.account, self.league)
             tabs = client.get_stash_tab_list()
-            self.finished_signal.emit(tabs)
+            self.signals.finished_signal.emit(tabs)
         except Exception as e:
-            self.error_signal.emit(str(e))
+            self.signals.error_signal.emit(str(e))
+        finally:
+            self.signals.finished.emit()
 
 
 class UltimatumWidget(QWidget):
@@ -194,6 +242,8 @@ class UltimatumWidget(QWidget):
         self.cached_scan_data = None
         self.price_fetcher = None
         self.found_stats = {'types': set(), 'rewards': set(), 'tiers': set()}
+        self.scan_columns = None
+        self.filter_dialog = None  # Built on first open, then reused
         
         self.setup_ui()
     
@@ -252,6 +302,12 @@ class UltimatumWidget(QWidget):
         self.profit_label = QLabel(f"{self.profit_slider.value()}c")
         self.profit_slider.valueChanged.connect(self.on_profit_slider_changed)
         
+        # A drag emits a value per tick; re-filter once it settles
+        self._profit_debounce = QTimer(self)
+        self._profit_debounce.setSingleShot(True)
+        self._profit_debounce.setInterval(PROFIT_DEBOUNCE_MS)
+        self._profit_debounce.timeout.connect(self.apply_filters_and_update)
+        
         profit_layout = QHBoxLayout()
         profit_layout.addWidget(self.profit_slider)
         profit_layout.addWidget(self.profit_label)
@@ -273,16 +329,31 @@ class UltimatumWidget(QWidget):
         self.log_area.setMaximumHeight(150)
         layout.addWidget(self.log_area)
         
+        # Scan logs arrive in bursts; append them once per flush
+        self._log_buffer = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(LOG_FLUSH_MS)
+        self._log_timer.timeout.connect(self._flush_log)
+        
         layout.addStretch()
 
     def log(self, message):
-        self.log_area.append(message)
+        self._log_buffer.append(message)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self):
+        """Append buffered log lines with a single QTextEdit update."""
+        if self._log_buffer:
+            self.log_area.append("\n".join(self._log_buffer))
+            self._log_buffer.clear()
 
     def on_profit_slider_changed(self, value):
         self.profit_label.setText(f"{value}c")
         self.ultimatum_config["min_profit"] = value
         if self.cached_scan_data:
-            self.apply_filters_and_update()
+            self._profit_debounce.start()
 
     def fetch_tab_list(self):
         session_id = self.sess_id_input.text().strip()
@@ -297,10 +368,11 @@ class UltimatumWidget(QWidget):
         self.log("Fetching tab list...")
         
         self.tab_worker = TabListWorker(session_id, account, league)
-        self.tab_worker.finished_signal.connect(self.on_tabs_fetched)
-        self.tab_worker.error_signal.connect(lambda e: self.log(f"Error: {e}"))
-        self.tab_worker.finished.connect(lambda: self.fetch_tabs_btn.setEnabled(True))
-        self.tab_worker.start()
+        signals = self.tab_worker.signals
+        signals.finished_signal.connect(self.on_tabs_fetched)
+        signals.error_signal.connect(lambda e: self.log(f"Error: {e}"))
+        signals.finished.connect(lambda: self.fetch_tabs_btn.setEnabled(True))
+        QThreadPool.globalInstance().start(self.tab_worker)
 
     def on_tabs_fetched(self, tabs):
         self.log(f"Fetched {len(tabs)} tabs.")
@@ -319,90 +391,63 @@ class UltimatumWidget(QWidget):
         
         self.scan_btn.setEnabled(False)
         
-        scan_config = {
-            "min_profit": self.ultimatum_config.get("min_profit", 20),
-            "excluded_types": self.ultimatum_config.get("excluded_types", []),
-            "included_types": self.ultimatum_config.get("included_types", []),
-            "excluded_rewards": self.ultimatum_config.get("excluded_rewards", []),
-            "included_rewards": self.ultimatum_config.get("included_rewards", []),
-            "excluded_tiers": self.ultimatum_config.get("excluded_tiers", []),
-            "included_tiers": self.ultimatum_config.get("included_tiers", []),
-        }
+        scan_config = read_filter_config(self.ultimatum_config)
         
         # Use global debug mode
         debug_mode = self.config.get("debug_mode", False)
         self.worker = ScanWorker(session_id, account, league, scan_config, selected_indices, debug_mode)
-        self.worker.log_signal.connect(self.log)
-        self.worker.result_signal.connect(self.on_scan_result)
-        self.worker.finished.connect(lambda: self.scan_btn.setEnabled(True))
-        self.worker.start()
+        signals = self.worker.signals
+        signals.log_signal.connect(self.log)
+        signals.result_signal.connect(self.on_scan_result)
+        signals.finished.connect(lambda: self.scan_btn.setEnabled(True))
+        QThreadPool.globalInstance().start(self.worker)
 
-    def on_scan_result(self, highlights, stats, all_items, price_fetcher):
+    def on_scan_result(self, stats, all_items, columns, price_fetcher):
         self.cached_scan_data = all_items
+        self.scan_columns = columns
         self.price_fetcher = price_fetcher
         self.found_stats = stats
-        self.overlay_update.emit(highlights)
+        if all_items:
+            self.apply_filters_and_update()
+        else:
+            self.overlay_update.emit([])
 
     def apply_filters_and_update(self):
         if not self.cached_scan_data:
             return
 
-        engine = FilteringRuleEngine()
-        min_profit = self.ultimatum_config.get("min_profit", 20)
-        engine.add_rule(ValueRule(min_profit=min_profit))
-        
-        # Exclusion rules (standard rules - all must pass)
-        if self.ultimatum_config.get("excluded_types"):
-            engine.add_rule(EncounterRule(excluded_types=self.ultimatum_config.get("excluded_types")))
-
-        if self.ultimatum_config.get("excluded_rewards"):
-            engine.add_rule(RewardRule(excluded_rewards=self.ultimatum_config.get("excluded_rewards")))
-            
-        if self.ultimatum_config.get("excluded_tiers"):
-            engine.add_rule(MonsterLifeRule(excluded_pcts=self.ultimatum_config.get("excluded_tiers")))
-        
-        # Include overrides (if any match, item is highlighted regardless of other rules)
-        if self.ultimatum_config.get("included_types"):
-            engine.add_override(EncounterIncludeOverride(included_types=self.ultimatum_config.get("included_types")))
-
-        if self.ultimatum_config.get("included_rewards"):
-            engine.add_override(RewardIncludeOverride(included_rewards=self.ultimatum_config.get("included_rewards")))
-            
-        if self.ultimatum_config.get("included_tiers"):
-            engine.add_override(MonsterLifeIncludeOverride(included_pcts=self.ultimatum_config.get("included_tiers")))
-
-        if not self.price_fetcher:
-            self.price_fetcher = NinjaPriceFetcher(self.league_input.text().strip())
-            self.price_fetcher.fetch_all_prices()
-
         valid_highlights = []
         
-        for item_data in self.cached_scan_data:
+        # Row i of the columns is cached_scan_data[i]
+        for i in np.flatnonzero(self.scan_columns.mask(self.ultimatum_config)):
+            item_data = self.cached_scan_data[i]
             parsed = item_data['parsed']
             raw_item = item_data['item']
-            tab_idx = item_data['tab_index']
-            is_quad = item_data['is_quad']
-            
-            if engine.evaluate(parsed, self.price_fetcher):
-                valid_highlights.append({
-                    'tab_index': tab_idx,
-                    'x': raw_item['x'], 
-                    'y': raw_item['y'], 
-                    'w': raw_item.get('w', 1), 
-                    'h': raw_item.get('h', 1),
-                    'name': parsed.get('reward', 'Unknown'),
-                    'is_quad': is_quad
-                })
+            valid_highlights.append({
+                'tab_index': item_data['tab_index'],
+                'x': raw_item['x'], 
+                'y': raw_item['y'], 
+                'w': raw_item.get('w', 1), 
+                'h': raw_item.get('h', 1),
+                'name': parsed.get('reward', 'Unknown'),
+                'is_quad': item_data['is_quad']
+            })
         
         self.overlay_update.emit(valid_highlights)
 
     def open_filter_dialog(self):
-        dlg = FilterConfigDialog(
-            self, 
-            self.found_stats, 
-            self.ultimatum_config,
-            self.price_fetcher
-        )
+        dlg = self.filter_dialog
+        if dlg is None:
+            dlg = self.filter_dialog = FilterConfigDialog(
+                self, 
+                self.found_stats, 
+                self.ultimatum_config,
+                self.price_fetcher
+            )
+        else:
+            # Drop edits left over from a cancelled open, then patch in the latest scan
+            dlg.load_config(self.ultimatum_config)
+            dlg.update_found_data(self.found_stats, self.price_fetcher)
         if dlg.exec():
             updates = dlg.get_config_updates()
             self.ultimatum_config.update(updates)
@@ -413,6 +458,7 @@ class UltimatumWidget(QWidget):
     def clear_overlay(self):
         self.overlay_update.emit([])
         self.cached_scan_data = None
+        self.scan_columns = None
         self.log("Overlay cleared.")
 
     def get_credentials(self):
@@ -2,8 +2,12 @@
 OCR Scanner for League Vision tool.
 """
 
+import os
 import re
+import hashlib
+import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 import cv2
 import numpy as np
 import pytesseract
@@ -13,6 +17,35 @@ from PyQt6.QtWidgets import QApplication
 from .vision_core import VisionCore
 from utils.logger import DebugLogger
 
+# ASCII-only lowering table, so fixed keyword tests run against a bytes
+# buffer lowered in a single bytes.translate pass
+_TO_LOWER = bytes(c | 0x20 if 0x41 <= c <= 0x5A else c for c in range(256))
+
+# Keywords that mark a Syndicate board/card on screen
+_SYNDICATE_KEYWORDS = (b"transportation", b"fortification", b"research", b"intervention",
+                       b"execute", b"interrogate", b"imprisoned", b"intelligence")
+
+# Syndicate house/rank patterns used to read a member's current house
+_HOUSES = "Transportation|Fortification|Research|Intervention"
+_RANKS = "Member|Leader|Captain|Sergeant|Lieutenant"
+_INTEL_RE = re.compile(rf"\+\d+\s+({_HOUSES})\s+Intelligence", re.IGNORECASE)
+_RANK_HOUSE_RE = re.compile(rf"({_RANKS}).{{0,10}}({_HOUSES})", re.IGNORECASE)
+_HOUSE_RANK_RE = re.compile(rf"({_HOUSES}).{{0,10}}({_RANKS})", re.IGNORECASE)
+_MOVES_TO_RE = re.compile(rf"moves to.{{0,10}}({_HOUSES})", re.IGNORECASE)
+
+
+# Threshold/colour variants OCR'd side by side on the syndicate board
+SYNDICATE_OCR_PASSES = 4
+
+# Minimum gap between status batches sent to the GUI
+STATUS_FLUSH_MS = 50
+
+
+def _lower_bytes(text: str) -> bytes:
+    """Encode text to bytes lowered via _TO_LOWER (non-latin-1 chars become '?')."""
+    return text.encode("latin-1", "replace").translate(_TO_LOWER)
+
+
 try:
     import win32gui
     HAS_WIN32 = True
@@ -20,10 +53,43 @@ except ImportError:
     HAS_WIN32 = False
 
 try:
-    import keyboard
-    HAS_KEYBOARD = True
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+try:
+    import xxhash
+    HAS_XXHASH = True
 except ImportError:
-    HAS_KEYBOARD = False
+    HAS_XXHASH = False
+
+
+def _build_automaton(entries):
+    """
+    Compile (keyword, payload) pairs into an Aho-Corasick automaton.
+    
+    A keyword listed more than once (e.g. as both context and bad mod)
+    keeps every payload; the automaton stores them as a tuple.
+    """
+    payloads = {}
+    for keyword, payload in entries:
+        if keyword:
+            payloads.setdefault(keyword.lower(), []).append(payload)
+    
+    automaton = ahocorasick.Automaton()
+    for word, word_payloads in payloads.items():
+        automaton.add_word(word, tuple(word_payloads))
+    automaton.make_automaton()
+    return automaton
+
+
+def _iter_matches(automaton, text_lower: str):
+    """Yield payloads of all keywords found in text_lower, in text order."""
+    if len(automaton) == 0:
+        return
+    for _, word_payloads in automaton.iter(text_lower):
+        yield from word_payloads
 
 
 class ScanResult:
@@ -40,22 +106,28 @@ class ScannerWorker(QThread):
     """Background worker that continuously scans the screen."""
     
     result_signal = pyqtSignal(object)  # Emits ScanResult
-    status_signal = pyqtSignal(str)  # Status updates
+    status_batch_signal = pyqtSignal(list)  # Status lines, coalesced per STATUS_FLUSH_MS
     mode_signal = pyqtSignal(str)  # Emits current scan mode (mouse/center)
     debug_rect_signal = pyqtSignal(int, int, int, int, str)  # x, y, w, h, color
     debug_box_signal = pyqtSignal(int, int, int, int, str)  # For keyword highlight boxes
     clear_debug_signal = pyqtSignal()  # Clear all debug boxes
     stop_requested_signal = pyqtSignal()  # Emitted when hotkey pressed
     
-    def __init__(self, config: dict):
+    def __init__(self, config: dict, vision: VisionCore = None):
         super().__init__()
         self.config = config
         self.running = False
         self.paused = False
         self.current_zone = "Unknown"
+        self._in_hideout = False  # Cached on set_zone; read every frame
         self.tooltip_side_mode = 0
         self.manual_override = None  # For manual mode toggle
         
+        # Status lines waiting for the next batch emit; set up first so
+        # warnings raised during __init__ can be queued too
+        self._status_buf = []
+        self._status_flushed_at = 0.0
+        
         # Debug mode
         self.debug_mode = config.get("debug_mode", False)
         DebugLogger.set_enabled(self.debug_mode)
@@ -67,18 +139,67 @@ class ScannerWorker(QThread):
         self.in_syndicate_board = False
         self.syndicate_board_last_seen = 0
         
-        # Initialize vision
+        # Frame-skip cache: offset -> (capture hash, threshold hash, result, found, syndicate).
+        # Keyed by offset because mouse mode alternates between two regions.
+        self._frame_cache = {}
+        self._frame_reused = False
+        
+        # Grayscale/threshold arrays reused frame to frame (same region size)
+        self._gray_buf = None
+        self._thresh_buf = None
+        
+        # Scan interval multiplier, grows while the screen stays idle
+        self._idle_skip = 1
+        
+        # Essence/Ritual keywords, paired with their lowercase form
+        self._active_keywords = []
+        for feature in ("essence", "ritual"):
+            feature_cfg = config.get(feature, {})
+            if feature_cfg.get("enabled", False):
+                self._active_keywords.extend((kw, kw.lower()) for kw in feature_cfg.get("keywords", []))
+        
+        # Altar rewards worth highlighting, lowest (best) tier first
+        altar_cfg = config.get("eldritch_altars", {})
+        min_tier = altar_cfg.get("min_tier_to_highlight", 1)
+        self._altar_tiers = sorted(
+            (int(tier_str), [(reward, reward.lower()) for reward in rewards])
+            for tier_str, rewards in altar_cfg.get("tiers", {}).items()
+            if int(tier_str) <= min_tier
+        )
+        
+        # Keyword automata for single-pass mod matching (None -> plain loops)
+        self._map_automaton = None
+        self._altar_automaton = None
+        if HAS_AHOCORASICK:
+            self._build_automata()
+        
+        # Initialize vision (shared instance keeps the window handle/rect cache warm)
         resolution_config = config.get("resolution_override")
-        self.vision = VisionCore(resolution_config=resolution_config)
+        if vision is None:
+            vision = VisionCore(resolution_config=resolution_config)
+        else:
+            vision.resolution_config = resolution_config
+        self.vision = vision
         
         # Setup Tesseract - check if it exists
         tesseract_path = config.get("tesseract_path", "C:/Program Files/Tesseract-OCR/tesseract.exe")
-        import os
         if not os.path.exists(tesseract_path):
-            self.status_signal.emit(f"WARNING: Tesseract not found at {tesseract_path}")
+            self.status(f"WARNING: Tesseract not found at {tesseract_path}")
             DebugLogger.log(f"Tesseract not found at {tesseract_path}", "Vision")
         pytesseract.pytesseract.tesseract_cmd = tesseract_path
         
+        # Reused image file handed to Tesseract (created in run())
+        self._ocr_tmp_path = None
+        
+        # OpenCV transparent API for the syndicate board filters (opt-in)
+        self._use_opencl = bool(config.get("use_opencl", False)) and cv2.ocl.haveOpenCL()
+        if self._use_opencl:
+            cv2.ocl.setUseOpenCL(True)
+        
+        # Parallel syndicate passes, each with its own image file (created in run())
+        self._ocr_pool = None
+        self._pool_tmp_paths = []
+        
         # Clear debug log on start
         if self.debug_mode:
             try:
@@ -87,37 +208,33 @@ class ScannerWorker(QThread):
             except:
                 pass
             DebugLogger.log(f"Scanner initialized. Tesseract: {tesseract_path}", "Vision")
-        
-        # Setup hotkey (Shift+Esc to stop)
-        self.hotkey_id = None
-        if HAS_KEYBOARD:
-            try:
-                self.hotkey_id = keyboard.add_hotkey("shift+esc", self._on_stop_hotkey)
-                DebugLogger.log("Hotkey registered: Shift+Esc to stop scanner", "Vision")
-            except Exception as e:
-                DebugLogger.log(f"Failed to register hotkey: {e}", "Vision")
     
-    def _on_stop_hotkey(self):
-        """Called when stop hotkey is pressed."""
-        self.status_signal.emit("Shift+Esc pressed - stopping scanner...")
-        self.stop_requested_signal.emit()
-        self.stop()
+    def _build_automata(self):
+        """Compile the map and altar keyword lists from config."""
+        map_cfg = self.config.get("map_check", {})
+        self._map_automaton = _build_automaton(
+            [(ctx, ("context", ctx)) for ctx in map_cfg.get("required_context", [])] +
+            [(mod, ("bad", mod)) for mod in map_cfg.get("bad_mods", [])]
+        )
+        
+        altar_cfg = self.config.get("eldritch_altars", {})
+        altar_entries = [
+            (reward, (tier, reward))
+            for tier, rewards in self._altar_tiers
+            for reward, _ in rewards
+        ]
+        altar_entries.extend((mod, ("bad", mod)) for mod in altar_cfg.get("bad_mods", []))
+        self._altar_automaton = _build_automaton(altar_entries)
     
     def set_zone(self, zone: str):
         """Update the current zone."""
         self.current_zone = zone
+        self._in_hideout = "Hideout" in zone
+        self._frame_cache.clear()
     
     def stop(self):
         """Stop the scanner."""
         self.running = False
-        
-        # Remove hotkey
-        if HAS_KEYBOARD and self.hotkey_id is not None:
-            try:
-                keyboard.remove_hotkey(self.hotkey_id)
-                self.hotkey_id = None
-            except:
-                pass
     
     def pause(self):
         """Pause scanning."""
@@ -147,7 +264,7 @@ class ScannerWorker(QThread):
         # Mouse mode: Hideout (for map tooltip reading)
         # Center mode: Maps, acts, and other zones (for in-game mechanics)
         # Unknown defaults to center since most gameplay happens in maps
-        if "Hideout" in self.current_zone:
+        if self._in_hideout:
             return "mouse"
         return "center"
     
@@ -176,121 +293,224 @@ class ScannerWorker(QThread):
         if self.debug_mode:
             DebugLogger.log(f"Scanner started in {initial_strategy.upper()} mode (Zone: {self.current_zone})", "Vision")
         
-        while self.running:
-            if self.paused or not self.is_poe_focused():
-                time.sleep(0.5)
-                continue
+        tmp_paths = []
+        for _ in range(SYNDICATE_OCR_PASSES + 1):
+            fd, path = tempfile.mkstemp(prefix="poe_vision_", suffix=".png")
+            os.close(fd)
+            tmp_paths.append(path)
+        self._ocr_tmp_path = tmp_paths[0]
+        self._pool_tmp_paths = tmp_paths[1:]
+        
+        # Each pass is its own tesseract.exe, so threads are enough to use every core
+        self._ocr_pool = ThreadPoolExecutor(
+            max_workers=min(SYNDICATE_OCR_PASSES, os.cpu_count() or 1),
+            thread_name_prefix="vision_ocr"
+        )
+        
+        # The pool and temp files are released even if capture or OCR raises
+        try:
+            while self.running:
+                self.flush_status()
             
-            strategy = self.get_active_strategy()
+                if self.paused or not self.is_poe_focused():
+                    # The window may be moved/resized while it is in the background
+                    self.vision.invalidate_rect()
+                    time.sleep(0.5)
+                    continue
             
-            if strategy != last_strategy:
-                self.mode_signal.emit(strategy.upper())
-                last_strategy = strategy
+                strategy = self.get_active_strategy()
             
-            if strategy == "mouse":
-                interval_ms = self.config.get("scan_interval_mouse", 100)
-            else:
-                interval_ms = self.config.get("scan_interval_center", 500)
+                if strategy != last_strategy:
+                    self.mode_signal.emit(strategy.upper())
+                    last_strategy = strategy
             
-            start_time = time.time()
+                if strategy == "mouse":
+                    interval_ms = self.config.get("scan_interval_mouse", 100)
+                else:
+                    interval_ms = self.config.get("scan_interval_center", 500)
+            
+                start_time = time.time()
             
-            # Get scan region
-            rect = self.vision.get_window_rect()
-            region = None
+                # Get scan region
+                rect = self.vision.get_window_rect()
+                region = None
             
-            if rect:
-                # Check if we should use expanded syndicate board region
-                # Stay in syndicate mode for 3 seconds after last detection
-                use_syndicate_region = (
-                    self.in_syndicate_board and 
-                    (time.time() - self.syndicate_board_last_seen) < 3.0
-                )
+                if rect:
+                    # Check if we should use expanded syndicate board region
+                    # Stay in syndicate mode for 3 seconds after last detection
+                    use_syndicate_region = (
+                        self.in_syndicate_board and 
+                        (time.time() - self.syndicate_board_last_seen) < 3.0
+                    )
                 
-                if use_syndicate_region:
-                    # Expanded region for syndicate board - cover almost full screen
-                    # Leave small margins for UI elements
-                    region = {
-                        "top": int(rect["top"] + (rect["height"] * 0.05)),
-                        "left": int(rect["left"] + (rect["width"] * 0.05)),
-                        "width": int(rect["width"] * 0.90),
-                        "height": int(rect["height"] * 0.85)
-                    }
-                elif strategy == "mouse" and HAS_WIN32:
-                    mx, my = win32gui.GetCursorPos()
-                    h_cfg = self.config.get("scan_region_hover", {
-                        "width": 600, "height": 800, 
-                        "x_offset": 50, "y_offset": -100
-                    })
+                    if use_syndicate_region:
+                        # Expanded region for syndicate board - cover almost full screen
+                        # Leave small margins for UI elements
+                        region = {
+                            "top": int(rect["top"] + (rect["height"] * 0.05)),
+                            "left": int(rect["left"] + (rect["width"] * 0.05)),
+                            "width": int(rect["width"] * 0.90),
+                            "height": int(rect["height"] * 0.85)
+                        }
+                    elif strategy == "mouse" and HAS_WIN32:
+                        mx, my = win32gui.GetCursorPos()
+                        h_cfg = self.config.get("scan_region_hover", {
+                            "width": 600, "height": 800, 
+                            "x_offset": 50, "y_offset": -100
+                        })
                     
-                    w = h_cfg.get("width", 600)
-                    h = h_cfg.get("height", 800)
+                        w = h_cfg.get("width", 600)
+                        h = h_cfg.get("height", 800)
                     
-                    if self.tooltip_side_mode == 0:
-                        x = mx + h_cfg.get("x_offset", 50)
-                    else:
-                        x = mx + h_cfg.get("x_offset_right", -100)
+                        if self.tooltip_side_mode == 0:
+                            x = mx + h_cfg.get("x_offset", 50)
+                        else:
+                            x = mx + h_cfg.get("x_offset_right", -100)
                     
-                    y = my + h_cfg.get("y_offset", -100)
+                        y = my + h_cfg.get("y_offset", -100)
                     
-                    # Clamp to screen - get actual screen size dynamically
-                    screen = QApplication.primaryScreen()
-                    if screen:
-                        screen_w = screen.size().width()
-                        screen_h = screen.size().height()
-                    else:
-                        screen_w = 1920
-                        screen_h = 1080
-                    x = max(0, min(x, screen_w - w))
-                    y = max(0, min(y, screen_h - h))
+                        # Clamp to screen - get actual screen size dynamically
+                        screen = QApplication.primaryScreen()
+                        if screen:
+                            screen_w = screen.size().width()
+                            screen_h = screen.size().height()
+                        else:
+                            screen_w = 1920
+                            screen_h = 1080
+                        x = max(0, min(x, screen_w - w))
+                        y = max(0, min(y, screen_h - h))
                     
-                    region = {"top": int(y), "left": int(x), "width": int(w), "height": int(h)}
-                else:
-                    r_config = self.config.get("scan_region", {
-                        "x_offset": 0.2, "y_offset": 0.1,
-                        "width_pct": 0.6, "height_pct": 0.8
-                    })
-                    region = {
-                        "top": int(rect["top"] + (rect["height"] * r_config.get("y_offset", 0.1))),
-                        "left": int(rect["left"] + (rect["width"] * r_config.get("x_offset", 0.2))),
-                        "width": int(rect["width"] * r_config.get("width_pct", 0.6)),
-                        "height": int(rect["height"] * r_config.get("height_pct", 0.8))
-                    }
+                        region = {"top": int(y), "left": int(x), "width": int(w), "height": int(h)}
+                    else:
+                        r_config = self.config.get("scan_region", {
+                            "x_offset": 0.2, "y_offset": 0.1,
+                            "width_pct": 0.6, "height_pct": 0.8
+                        })
+                        region = {
+                            "top": int(rect["top"] + (rect["height"] * r_config.get("y_offset", 0.1))),
+                            "left": int(rect["left"] + (rect["width"] * r_config.get("x_offset", 0.2))),
+                            "width": int(rect["width"] * r_config.get("width_pct", 0.6)),
+                            "height": int(rect["height"] * r_config.get("height_pct", 0.8))
+                        }
             
-            if region:
-                # Clear previous debug boxes
-                if self.debug_mode:
-                    self.clear_debug_signal.emit()
+                if region:
+                    # Clear previous debug boxes
+                    if self.debug_mode:
+                        self.clear_debug_signal.emit()
                     
-                    # Yellow for center mode, cyan for mouse/hideout mode
-                    debug_color = "cyan" if (strategy == "mouse" or "Hideout" in self.current_zone) else "yellow"
-                    self.debug_rect_signal.emit(
-                        region["left"], region["top"], 
-                        region["width"], region["height"],
-                        debug_color
-                    )
+                        # Yellow for center mode, cyan for mouse/hideout mode
+                        debug_color = "cyan" if (strategy == "mouse" or self._in_hideout) else "yellow"
+                        self.debug_rect_signal.emit(
+                            region["left"], region["top"], 
+                            region["width"], region["height"],
+                            debug_color
+                        )
                 
-                img = self.vision.capture_region(region)
-                if img is not None:
-                    # Pass region_offset for debug box positioning
-                    region_offset = (region["left"], region["top"])
-                    found = self.process_image(img, region_offset=region_offset)
+                    # Only the syndicate board's colour filters need a BGR frame
+                    img = self.vision.capture_region(region, grayscale=not use_syndicate_region)
+                    if img is not None:
+                        # Pass region_offset for debug box positioning
+                        region_offset = (region["left"], region["top"])
+                        found = self.process_image(img, region_offset=region_offset)
+                    
+                        if strategy == "mouse" and not found:
+                            self.tooltip_side_mode = 1 - self.tooltip_side_mode
                     
-                    if strategy == "mouse" and not found:
-                        self.tooltip_side_mode = 1 - self.tooltip_side_mode
+                        # Back off while nothing changes, snap back on any change
+                        if not found and self._frame_reused:
+                            self._idle_skip = min(self._idle_skip * 2, 5)
+                        else:
+                            self._idle_skip = 1
             
-            # Timing
-            elapsed = time.time() - start_time
-            sleep_time = max(0, (interval_ms / 1000.0) - elapsed)
-            time.sleep(sleep_time)
+                # Timing - idle back-off never stretches the interval past idle_max_ms
+                idle_max_ms = self.config.get("scan_interval_idle_max", 500)
+                interval_ms = max(interval_ms, min(interval_ms * self._idle_skip, idle_max_ms))
+                elapsed = time.time() - start_time
+                sleep_time = max(0, (interval_ms / 1000.0) - elapsed)
+                time.sleep(sleep_time)
+        
+            self.flush_status(force=True)
+        finally:
+            # Pool first: its passes write to the temp files removed below
+            self._ocr_pool.shutdown(wait=True)
+            self._ocr_pool = None
+            for path in tmp_paths:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self._ocr_tmp_path = None
+            self._pool_tmp_paths = []
+    
+    def status(self, message: str):
+        """Queue a status line for the GUI (sent by flush_status)."""
+        self._status_buf.append(message)
+    
+    def flush_status(self, force: bool = False):
+        """
+        Emit queued status lines as one batch.
+        
+        The scan loop has no event loop to drive a QTimer, so it calls this
+        every iteration and lines go out at most once per STATUS_FLUSH_MS.
+        """
+        if not self._status_buf:
+            return
+        now = time.time()
+        if not force and (now - self._status_flushed_at) * 1000 < STATUS_FLUSH_MS:
+            return
+        batch, self._status_buf = self._status_buf, []
+        self._status_flushed_at = now
+        self.status_batch_signal.emit(batch)
+    
+    def ocr_data(self, img, tmp_path=None) -> dict:
+        """
+        Run Tesseract image_to_data on a single-channel image.
+        
+        pytesseract would PNG-encode every frame at default compression into
+        a fresh temp file; instead the frame is written uncompressed to one
+        reused file and its path is passed through. Concurrent callers pass
+        their own tmp_path.
+        """
+        tmp_path = tmp_path or self._ocr_tmp_path
+        if tmp_path is None:
+            return pytesseract.image_to_data(img, output_type=pytesseract.Output.DICT)
+        cv2.imwrite(tmp_path, img, [cv2.IMWRITE_PNG_COMPRESSION, 0])
+        return pytesseract.image_to_data(tmp_path, output_type=pytesseract.Output.DICT)
     
     def process_image(self, img, region_offset=None) -> bool:
-        """Process captured image through OCR and check modules."""
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+        """
+        Process captured image through OCR and check modules.
+        
+        Accepts either a BGR frame or an already-grayscale one; colour is only
+        used by the syndicate board filters.
+        """
+        # An unchanged capture at this spot skips thresholding as well as OCR
+        capture_hash = self.frame_hash(img)
+        cached = self._frame_cache.get(region_offset)
+        if cached is not None and cached[0] == capture_hash:
+            return self.reuse_cached_frame(cached)
+        
+        if img.ndim == 2:
+            gray = img
+            img = None
+        else:
+            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY, dst=self.reuse_buffer("_gray_buf", img.shape[:2]))
         thresh_val = self.config.get("ocr_threshold", 70)
-        _, thresh = cv2.threshold(gray, thresh_val, 255, cv2.THRESH_BINARY)
+        _, thresh = cv2.threshold(gray, thresh_val, 255, cv2.THRESH_BINARY,
+                                  dst=self.reuse_buffer("_thresh_buf", gray.shape))
+        
+        # Background noise that thresholds away still counts as the same frame
+        frame_hash = self.frame_hash(thresh)
+        if cached is not None and cached[1] == frame_hash:
+            self._frame_cache[region_offset] = (capture_hash,) + cached[1:]
+            return self.reuse_cached_frame(cached)
+        self._frame_reused = False
+        
+        # Tesseract cost scales with area, so drop the empty margins
+        thresh, crop_x, crop_y = self.crop_to_content(thresh)
         
         try:
-            data = pytesseract.image_to_data(thresh, output_type=pytesseract.Output.DICT)
+            data = self.ocr_data(thresh)
         except Exception as e:
             if self.debug_mode:
                 DebugLogger.log(f"OCR Error: {e}", "Vision")
@@ -298,28 +518,31 @@ class ScannerWorker(QThread):
         
         # Filter out empty strings and low-confidence results
         full_text = " ".join([t for t in data['text'] if t.strip()])
-        full_text_lower = full_text.lower()
-        in_hideout = "Hideout" in self.current_zone
-        n_boxes = len(data['text'])
+        text_bytes = _lower_bytes(full_text)
+        in_hideout = self._in_hideout
         
-        # Calculate offset for debug boxes
-        scan_offset_x = region_offset[0] if region_offset else 0
-        scan_offset_y = region_offset[1] if region_offset else 0
+        # Calculate offset for debug boxes (box coords are relative to the crop)
+        scan_offset_x = (region_offset[0] if region_offset else 0) + crop_x
+        scan_offset_y = (region_offset[1] if region_offset else 0) + crop_y
         
         # Check for Syndicate Board/Card context - use enhanced OCR if detected
-        syndicate_keywords = ["transportation", "fortification", "research", "intervention", 
-                             "execute", "interrogate", "imprisoned", "intelligence"]
-        is_syndicate_context = any(kw in full_text_lower for kw in syndicate_keywords)
+        is_syndicate_context = any(kw in text_bytes for kw in _SYNDICATE_KEYWORDS)
         
         if is_syndicate_context:
             # Mark that we're in syndicate board mode - this will expand the scan region
             self.in_syndicate_board = True
             self.syndicate_board_last_seen = time.time()
             
-            # Re-process with enhanced filtering for syndicate board
+            # Re-process with enhanced filtering for syndicate board, unless
+            # the first pass already read a member and their house
             # The syndicate board has specific colors we can target
-            data, full_text, n_boxes = self.process_syndicate_ocr(img, gray)
-            full_text_lower = full_text.lower()
+            if not self.has_syndicate_details(data, full_text):
+                data, full_text, _ = self.process_syndicate_ocr(img, gray)
+                text_bytes = _lower_bytes(full_text)
+                
+                # Syndicate OCR runs on the uncropped frame
+                scan_offset_x -= crop_x
+                scan_offset_y -= crop_y
             
             if self.debug_mode:
                 DebugLogger.log("Syndicate board detected - using expanded scan region", "Vision")
@@ -327,42 +550,33 @@ class ScannerWorker(QThread):
         # Debug: Log OCR output
         if self.debug_mode and full_text.strip():
             DebugLogger.log(f"OCR Text: {full_text[:500]}", "Vision")
-            self.status_signal.emit(f"[DEBUG OCR] {full_text[:200]}...")
+            self.status(f"[DEBUG OCR] {full_text[:200]}...")
+        
+        # Canonicalize OCR words once for all the per-box loops below
+        words_lower = [w.strip().lower() for w in data['text']]
         
         # Check modules
         results = []
         
         # Essence/Ritual keywords - with debug boxes
-        if not in_hideout:
-            active_keywords = []
-            
-            ess_cfg = self.config.get("essence", {})
-            if ess_cfg.get("enabled", False):
-                active_keywords.extend(ess_cfg.get("keywords", []))
-            
-            rit_cfg = self.config.get("ritual", {})
-            if rit_cfg.get("enabled", False):
-                active_keywords.extend(rit_cfg.get("keywords", []))
-            
-            if active_keywords:
-                for i in range(n_boxes):
-                    word = data['text'][i].strip()
-                    if len(word) < 3:
-                        continue
-                    word_lower = word.lower()
-                    for keyword in active_keywords:
-                        if keyword.lower() in word_lower:
-                            results.append(ScanResult(f"FOUND: {keyword}", "green"))
-                            # Draw RED debug box around found keyword
-                            if self.debug_mode:
-                                x, y, w, h = data['left'][i], data['top'][i], data['width'][i], data['height'][i]
-                                self.debug_box_signal.emit(
-                                    scan_offset_x + x, scan_offset_y + y, w, h, "red"
-                                )
+        if not in_hideout and self._active_keywords:
+            for i, word_lower in enumerate(words_lower):
+                if len(word_lower) < 3:
+                    continue
+                for keyword, keyword_lower in self._active_keywords:
+                    if keyword_lower in word_lower:
+                        results.append(ScanResult(f"FOUND: {keyword}", "green"))
+                        # Draw RED debug box around found keyword
+                        if self.debug_mode:
+                            x, y, w, h = data['left'][i], data['top'][i], data['width'][i], data['height'][i]
+                            self.debug_box_signal.emit(
+                                scan_offset_x + x, scan_offset_y + y, w, h, "red"
+                            )
         
         # Syndicate Check (uses re-processed data if syndicate card detected)
         if not in_hideout:
-            syndicate_result = self.check_syndicate(data, full_text, scan_offset_x, scan_offset_y)
+            syndicate_result = self.check_syndicate(data, full_text, scan_offset_x, scan_offset_y,
+                                                    words_lower=words_lower, text_bytes=text_bytes)
             if syndicate_result:
                 results.append(syndicate_result)
         
@@ -384,73 +598,169 @@ class ScannerWorker(QThread):
             if exp_result:
                 results.append(exp_result)
         
+        first_result = results[0] if results else None
+        
+        # Map context without alerts still counts as "found something"
+        found = (
+            first_result is not None or
+            b"map tier" in text_bytes or
+            b"item class: maps" in text_bytes
+        )
+        
+        # Cursor movement keeps producing new offsets, so keep the cache small
+        if len(self._frame_cache) >= 8:
+            self._frame_cache.clear()
+        self._frame_cache[region_offset] = (capture_hash, frame_hash, first_result, found, is_syndicate_context)
+        
         # Emit first result
-        if results:
-            self.result_signal.emit(results[0])
-            return True
+        if first_result:
+            self.result_signal.emit(first_result)
         
-        # Check if we found map context even without alerts (still counts as "found something")
-        if "map tier" in full_text.lower() or "item class: maps" in full_text.lower():
-            return True
+        return found
+    
+    def reuse_cached_frame(self, cached) -> bool:
+        """Replay a cached outcome for an unchanged frame. Returns its found flag."""
+        self._frame_reused = True
+        _, _, cached_result, cached_found, cached_syndicate = cached
+        if cached_syndicate:
+            self.syndicate_board_last_seen = time.time()
+        if cached_result:
+            self.result_signal.emit(cached_result)
+        return cached_found
+    
+    def reuse_buffer(self, attr: str, shape):
+        """Return the uint8 buffer stored on attr, reallocating only if the shape changed."""
+        buf = getattr(self, attr)
+        if buf is None or buf.shape != shape:
+            buf = np.empty(shape, np.uint8)
+            setattr(self, attr, buf)
+        return buf
+    
+    @staticmethod
+    def crop_to_content(thresh, padding: int = 8, min_shrink: float = 0.3):
+        """
+        Crop a thresholded frame to the bounding box of its bright pixels.
         
-        return False
+        Returns (image, x0, y0). The frame is returned untouched unless the
+        crop removes at least min_shrink of its area.
+        """
+        cols = np.flatnonzero(thresh.any(axis=0))
+        rows = np.flatnonzero(thresh.any(axis=1))
+        if cols.size == 0 or rows.size == 0:
+            return thresh, 0, 0
+        
+        height, width = thresh.shape[:2]
+        x0 = max(0, int(cols[0]) - padding)
+        x1 = min(width, int(cols[-1]) + 1 + padding)
+        y0 = max(0, int(rows[0]) - padding)
+        y1 = min(height, int(rows[-1]) + 1 + padding)
+        
+        if (x1 - x0) * (y1 - y0) > (1.0 - min_shrink) * width * height:
+            return thresh, 0, 0
+        return thresh[y0:y1, x0:x1], x0, y0
+    
+    @staticmethod
+    def frame_hash(thresh):
+        """
+        Exact 64-bit hash of a thresholded frame.
+        
+        An exact hash never reuses the result of a different tooltip that
+        happens to have a similar layout. xxh3 hashes a full frame in well
+        under a millisecond; blake2b is the slower stdlib fallback.
+        """
+        if HAS_XXHASH:
+            return xxhash.xxh3_64_intdigest(thresh)
+        return hashlib.blake2b(thresh, digest_size=8).digest()
+    
+    def has_syndicate_details(self, data: dict, full_text: str) -> bool:
+        """Check if OCR output already names a tracked member and a house."""
+        goals = self.config.get("syndicate_goals", {})
+        if not goals:
+            return False
+        
+        words = {w.strip().lower() for w in data['text']}
+        if not any(member.lower() in words for member in goals):
+            return False
+        
+        return any(
+            pattern.search(full_text)
+            for pattern in (_INTEL_RE, _RANK_HOUSE_RE, _HOUSE_RANK_RE, _MOVES_TO_RE)
+        )
     
     def process_syndicate_ocr(self, img, gray):
         """
         Enhanced OCR processing specifically for the syndicate board.
         Uses multiple color filters and thresholds to better detect text.
+        The color filters are skipped when img is None (grayscale capture).
         """
         all_texts = []
         best_data = None
         best_text = ""
         best_count = 0
         
-        # Convert to HSV for color filtering
-        hsv = cv2.cvtColor(img, cv2.COLOR_BGR2HSV)
+        # The board region is nearly full-screen; with OpenCL the filters run
+        # on the GPU and only the finished masks are downloaded for OCR
+        src_gray = cv2.UMat(gray) if self._use_opencl else gray
         
         # Method 1: Standard grayscale with lower threshold (for white/light text)
-        _, thresh1 = cv2.threshold(gray, 50, 255, cv2.THRESH_BINARY)
+        _, thresh1 = cv2.threshold(src_gray, 50, 255, cv2.THRESH_BINARY)
         
         # Method 2: Higher threshold for darker backgrounds
-        _, thresh2 = cv2.threshold(gray, 100, 255, cv2.THRESH_BINARY)
+        _, thresh2 = cv2.threshold(src_gray, 100, 255, cv2.THRESH_BINARY)
         
         # Method 3: Adaptive threshold (good for varying lighting)
-        thresh3 = cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, 
+        thresh3 = cv2.adaptiveThreshold(src_gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, 
                                         cv2.THRESH_BINARY, 11, 2)
         
-        # Method 4: Filter for golden/yellow text (member names on cards)
-        # Yellow/gold hue range: roughly 15-35
-        lower_gold = np.array([15, 80, 80])
-        upper_gold = np.array([35, 255, 255])
-        gold_mask = cv2.inRange(hsv, lower_gold, upper_gold)
-        
-        # Method 5: Filter for white/cream text (card text)
-        lower_white = np.array([0, 0, 180])
-        upper_white = np.array([180, 50, 255])
-        white_mask = cv2.inRange(hsv, lower_white, upper_white)
-        
-        # Method 6: Filter for red text (house names like "Transportation")
-        lower_red1 = np.array([0, 100, 100])
-        upper_red1 = np.array([10, 255, 255])
-        lower_red2 = np.array([160, 100, 100])
-        upper_red2 = np.array([180, 255, 255])
-        red_mask = cv2.inRange(hsv, lower_red1, upper_red1) | cv2.inRange(hsv, lower_red2, upper_red2)
-        
-        # Combine color masks
-        combined_color = cv2.bitwise_or(gold_mask, white_mask)
-        combined_color = cv2.bitwise_or(combined_color, red_mask)
-        
         # Process each threshold method
         thresh_methods = [
             ("low_thresh", thresh1),
             ("high_thresh", thresh2),
             ("adaptive", thresh3),
-            ("color_filter", combined_color),
         ]
         
-        for method_name, thresh_img in thresh_methods:
+        if img is not None:
+            # Convert to HSV for color filtering
+            hsv = cv2.cvtColor(cv2.UMat(img) if self._use_opencl else img, cv2.COLOR_BGR2HSV)
+            
+            # Method 4: Filter for golden/yellow text (member names on cards)
+            # Yellow/gold hue range: roughly 15-35
+            lower_gold = np.array([15, 80, 80])
+            upper_gold = np.array([35, 255, 255])
+            gold_mask = cv2.inRange(hsv, lower_gold, upper_gold)
+            
+            # Method 5: Filter for white/cream text (card text)
+            lower_white = np.array([0, 0, 180])
+            upper_white = np.array([180, 50, 255])
+            white_mask = cv2.inRange(hsv, lower_white, upper_white)
+            
+            # Method 6: Filter for red text (house names like "Transportation")
+            lower_red1 = np.array([0, 100, 100])
+            upper_red1 = np.array([10, 255, 255])
+            lower_red2 = np.array([160, 100, 100])
+            upper_red2 = np.array([180, 255, 255])
+            red_mask = cv2.bitwise_or(cv2.inRange(hsv, lower_red1, upper_red1),
+                                      cv2.inRange(hsv, lower_red2, upper_red2))
+            
+            # Combine color masks
+            combined_color = cv2.bitwise_or(gold_mask, white_mask)
+            combined_color = cv2.bitwise_or(combined_color, red_mask)
+            thresh_methods.append(("color_filter", combined_color))
+        
+        if self._use_opencl:
+            thresh_methods = [(name, mask.get()) for name, mask in thresh_methods]
+        
+        # Passes are independent, so submit them all before collecting any
+        futures = None
+        if self._ocr_pool is not None:
+            futures = [
+                self._ocr_pool.submit(self.ocr_data, thresh_img, tmp_path)
+                for (_, thresh_img), tmp_path in zip(thresh_methods, self._pool_tmp_paths)
+            ]
+        
+        for i, (method_name, thresh_img) in enumerate(thresh_methods):
             try:
-                data = pytesseract.image_to_data(thresh_img, output_type=pytesseract.Output.DICT)
+                data = futures[i].result() if futures else self.ocr_data(thresh_img)
                 text = " ".join([t for t in data['text'] if t.strip()])
                 all_texts.append(text)
                 
@@ -475,7 +785,7 @@ class ScannerWorker(QThread):
         if best_data is None:
             # Fallback to simple threshold
             _, thresh_fallback = cv2.threshold(gray, 70, 255, cv2.THRESH_BINARY)
-            best_data = pytesseract.image_to_data(thresh_fallback, output_type=pytesseract.Output.DICT)
+            best_data = self.ocr_data(thresh_fallback)
             combined_text = " ".join([t for t in best_data['text'] if t.strip()])
         
         n_boxes = len(best_data['text'])
@@ -493,35 +803,45 @@ class ScannerWorker(QThread):
                 DebugLogger.log("Map check disabled", "MapSafety")
             return None
         
-        # Check context - must see one of these keywords to know we're looking at a map
-        context_found = False
         required_contexts = cfg.get("required_context", [])
+        text_lower = text.lower()
+        context = None
+        bad_mod = None
+        
+        if self._map_automaton is not None:
+            # Single pass finds both the context and the first bad mod
+            for kind, keyword in _iter_matches(self._map_automaton, text_lower):
+                if kind == "context" and context is None:
+                    context = keyword
+                elif kind == "bad" and bad_mod is None:
+                    bad_mod = keyword
+                if context and bad_mod:
+                    break
+        else:
+            context = next((ctx for ctx in required_contexts if ctx.lower() in text_lower), None)
+            if context:
+                bad_mod = next((mod for mod in cfg.get("bad_mods", []) if mod.lower() in text_lower), None)
         
-        for ctx in required_contexts:
-            if ctx.lower() in text.lower():
-                context_found = True
-                if self.debug_mode:
-                    DebugLogger.log(f"Context found: '{ctx}'", "MapSafety")
-                break
-        
-        if not context_found:
+        # Check context - must see one of these keywords to know we're looking at a map
+        if context is None:
             if self.debug_mode and text.strip():
                 DebugLogger.log(f"No map context found. Looking for: {required_contexts}", "MapSafety")
             return None
         
+        if self.debug_mode:
+            DebugLogger.log(f"Context found: '{context}'", "MapSafety")
+        
         # Check bad mods
-        bad_mods = cfg.get("bad_mods", [])
-        for mod in bad_mods:
-            if mod.lower() in text.lower():
-                if self.debug_mode:
-                    DebugLogger.log(f"DANGEROUS MOD FOUND: {mod}", "MapSafety")
-                btn_rect = self.config.get("map_device_button", {})
-                return ScanResult(
-                    f"UNSAFE MAP: {mod.upper()}", 
-                    "red", 
-                    is_blocking=True,
-                    blocker_rect=btn_rect
-                )
+        if bad_mod:
+            if self.debug_mode:
+                DebugLogger.log(f"DANGEROUS MOD FOUND: {bad_mod}", "MapSafety")
+            btn_rect = self.config.get("map_device_button", {})
+            return ScanResult(
+                f"UNSAFE MAP: {bad_mod.upper()}", 
+                "red", 
+                is_blocking=True,
+                blocker_rect=btn_rect
+            )
         
         if self.debug_mode:
             DebugLogger.log("Map is safe", "MapSafety")
@@ -533,28 +853,29 @@ class ScannerWorker(QThread):
         if not cfg.get("enabled"):
             return None
         
-        # Check bad mods first
-        for mod in cfg.get("bad_mods", []):
-            if mod.lower() in text.lower():
-                return ScanResult(f"DANGER: {mod.upper()}", "red")
-        
-        # Check tiers
-        min_tier = cfg.get("min_tier_to_highlight", 1)
-        tiers = cfg.get("tiers", {})
-        
+        text_lower = text.lower()
         found_tier = 99
         found_reward = None
         
-        for tier_str, rewards in tiers.items():
-            tier = int(tier_str)
-            if tier > min_tier:
-                continue
+        if self._altar_automaton is not None:
+            # Single pass over the text: any bad mod wins, else lowest tier
+            for tier, keyword in _iter_matches(self._altar_automaton, text_lower):
+                if tier == "bad":
+                    return ScanResult(f"DANGER: {keyword.upper()}", "red")
+                if tier < found_tier:
+                    found_tier = tier
+                    found_reward = keyword
+        else:
+            # Check bad mods first
+            for mod in cfg.get("bad_mods", []):
+                if mod.lower() in text_lower:
+                    return ScanResult(f"DANGER: {mod.upper()}", "red")
             
-            for reward in rewards:
-                if reward.lower() in text.lower():
-                    if tier < found_tier:
-                        found_tier = tier
-                        found_reward = reward
+            # Check tiers, best first - the first hit is the answer
+            for tier, rewards in self._altar_tiers:
+                for reward, reward_lower in rewards:
+                    if reward_lower in text_lower:
+                        return ScanResult(f"ALTAR T{tier}: {reward}", "green")
         
         if found_reward:
             return ScanResult(f"ALTAR T{found_tier}: {found_reward}", "green")
@@ -582,25 +903,29 @@ class ScannerWorker(QThread):
         
         return None
     
-    def check_syndicate(self, data: dict, full_text: str, off_x: int = 0, off_y: int = 0):
+    def check_syndicate(self, data: dict, full_text: str, off_x: int = 0, off_y: int = 0,
+                        words_lower: list = None, text_bytes: bytes = None):
         """Check for syndicate member interactions and provide guidance."""
         goals = self.config.get("syndicate_goals", {})
         if not goals:
             return None
         
-        full_text_lower = full_text.lower()
+        if words_lower is None:
+            words_lower = [w.strip().lower() for w in data['text']]
+        if text_bytes is None:
+            text_bytes = _lower_bytes(full_text)
         
         # Check if we're in a syndicate interaction context
         # Can be: execute/interrogate buttons, OR syndicate-specific keywords
-        has_buttons = "execute" in full_text_lower or "interrogate" in full_text_lower or "release" in full_text_lower
+        has_buttons = b"execute" in text_bytes or b"interrogate" in text_bytes or b"release" in text_bytes
         has_syndicate_context = (
-            "intelligence" in full_text_lower or 
-            "imprisoned" in full_text_lower or
-            "rank" in full_text_lower or
-            "transportation" in full_text_lower or
-            "fortification" in full_text_lower or
-            "research" in full_text_lower or
-            "intervention" in full_text_lower
+            b"intelligence" in text_bytes or 
+            b"imprisoned" in text_bytes or
+            b"rank" in text_bytes or
+            b"transportation" in text_bytes or
+            b"fortification" in text_bytes or
+            b"research" in text_bytes or
+            b"intervention" in text_bytes
         )
         
         is_syndicate_card = has_buttons or has_syndicate_context
@@ -616,17 +941,17 @@ class ScannerWorker(QThread):
         # Debug: Draw PURPLE boxes around Rank/House keywords
         if self.debug_mode:
             for i in range(n_boxes):
-                w_text = data['text'][i].lower().strip()
+                w_text = words_lower[i]
                 if w_text in ["sergeant", "lieutenant", "captain", "leader", "member", 
                               "transportation", "fortification", "research", "intervention"]:
                     x, y, w, h = data['left'][i], data['top'][i], data['width'][i], data['height'][i]
                     self.debug_box_signal.emit(off_x + x, off_y + y, w, h, "purple")
         
-        if "captain" in full_text.lower() or "leader" in full_text.lower():
+        if b"captain" in text_bytes or b"leader" in text_bytes:
             detected_rank = 3
-        elif "lieutenant" in full_text.lower():
+        elif b"lieutenant" in text_bytes:
             detected_rank = 2
-        elif "sergeant" in full_text.lower():
+        elif b"sergeant" in text_bytes:
             detected_rank = 1
         
         best_result = None
@@ -634,14 +959,15 @@ class ScannerWorker(QThread):
         current_member_name = None
         candidates_log = []
         
+        goals_lower = [(member, member.lower(), goal) for member, goal in goals.items()]
+        
         for i in range(n_boxes):
-            word = data['text'][i].strip()
-            if not word:
+            word_lower = words_lower[i]
+            if not word_lower:
                 continue
-            word_lower = word.lower()
             
-            for member, goal in goals.items():
-                if member.lower() == word_lower:
+            for member, member_lower, goal in goals_lower:
+                if member_lower == word_lower:
                     current_member_name = member
                     found_member = f"{member} -> {goal.upper()}"
                     
@@ -652,11 +978,11 @@ class ScannerWorker(QThread):
                     
                     # Get available actions
                     actions = []
-                    if "execute" in full_text.lower(): actions.append("EXECUTE")
-                    if "interrogate" in full_text.lower(): actions.append("INTERROGATE")
-                    if "bargain" in full_text.lower(): actions.append("BARGAIN")
-                    if "betray" in full_text.lower(): actions.append("BETRAY")
-                    if "release" in full_text.lower(): actions.append("RELEASE")
+                    if b"execute" in text_bytes: actions.append("EXECUTE")
+                    if b"interrogate" in text_bytes: actions.append("INTERROGATE")
+                    if b"bargain" in text_bytes: actions.append("BARGAIN")
+                    if b"betray" in text_bytes: actions.append("BETRAY")
+                    if b"release" in text_bytes: actions.append("RELEASE")
                     
                     result_msg = f"{found_member} | {', '.join(actions)}"
                     result_color = "cyan"
@@ -673,28 +999,28 @@ class ScannerWorker(QThread):
                     intel_match_str = "None"
                     
                     # Method 1: Look for "+X [House] Intelligence"
-                    intel_match = re.search(r"\+\d+\s+(Transportation|Fortification|Research|Intervention)\s+Intelligence", full_text, re.IGNORECASE)
+                    intel_match = _INTEL_RE.search(full_text)
                     if intel_match:
                         current_house = intel_match.group(1).title()
                         intel_match_str = current_house
                     
                     # Method 2: Try "Rank House" pattern
                     if not current_house:
-                        rank_house_match = re.search(r"(Member|Leader|Captain|Sergeant|Lieutenant).{0,10}(Transportation|Fortification|Research|Intervention)", full_text, re.IGNORECASE)
+                        rank_house_match = _RANK_HOUSE_RE.search(full_text)
                         if rank_house_match:
                             current_house = rank_house_match.group(2).title()
                         else:
-                            house_rank_match = re.search(r"(Transportation|Fortification|Research|Intervention).{0,10}(Member|Leader|Captain|Sergeant|Lieutenant)", full_text, re.IGNORECASE)
+                            house_rank_match = _HOUSE_RANK_RE.search(full_text)
                             if house_rank_match:
                                 current_house = house_rank_match.group(1).title()
                     
                     # Check for "moves to" pattern (Rank 0 / unassigned members)
-                    move_match = re.search(r"moves to.{0,10}(Transportation|Fortification|Research|Intervention)", full_text, re.IGNORECASE)
+                    move_match = _MOVES_TO_RE.search(full_text)
                     
                     if move_match:
                         target_house = move_match.group(1).title()
                         if target_house.lower() != goal.lower():
-                            if "release" in full_text.lower():
+                            if b"release" in text_bytes:
                                 result_msg = f"{found_member} | RELEASE (Keep Free)"
                                 result_color = "green"
                             else:
@@ -707,7 +1033,7 @@ class ScannerWorker(QThread):
                     
                     elif current_house:
                         if current_house.lower() != goal.lower():
-                            if "interrogate" in full_text.lower():
+                            if b"interrogate" in text_bytes:
                                 result_msg = f"{found_member} | INTERROGATE (Remove from {current_house})"
                                 result_color = "green"
                             else:
@@ -715,10 +1041,10 @@ class ScannerWorker(QThread):
                                 result_color = "orange"
                         else:
                             # Correct house
-                            if "execute" in full_text.lower():
+                            if b"execute" in text_bytes:
                                 result_msg = f"{found_member} | EXECUTE (Rank Up in {current_house})"
                                 result_color = "green"
-                            elif "release" in full_text.lower():
+                            elif b"release" in text_bytes:
                                 result_msg = f"{found_member} | RELEASE (Stay in {current_house})"
                                 result_color = "green"
                             else:
@@ -0,0 +1,89 @@
+"""
+Keyword template matching for fixed-vocabulary detection.
+
+Renders each keyword once in the game font and locates it with
+cv2.matchTemplate, which is far cheaper than a full OCR pass.
+"""
+
+import os
+import numpy as np
+import cv2
+
+try:
+    from PIL import Image, ImageDraw, ImageFont
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+
+# Fontin SmallCaps is the PoE tooltip font; installed system-wide by some users
+DEFAULT_FONT_PATHS = [
+    "C:/Windows/Fonts/Fontin-SmallCaps.ttf",
+    "C:/Windows/Fonts/FontinSmallCaps.otf",
+]
+
+MATCH_THRESHOLD = 0.8
+
+
+class KeywordTemplates:
+    """Pre-rendered, pre-thresholded keyword bitmaps."""
+
+    def __init__(self, keywords, font_path=None, font_sizes=(16, 18, 20, 22), thresh_val=70):
+        self.keywords = tuple(keywords)
+        self.thresh_val = thresh_val
+        self.templates = []  # (keyword, uint8 template)
+
+        font_path = font_path or next((p for p in DEFAULT_FONT_PATHS if os.path.exists(p)), None)
+        if not HAS_PIL or not font_path or not os.path.exists(font_path):
+            return
+
+        for size in font_sizes:
+            font = ImageFont.truetype(font_path, size)
+            for keyword in self.keywords:
+                tmpl = self.render(keyword, font)
+                if tmpl is not None:
+                    self.templates.append((keyword, tmpl))
+
+    def render(self, keyword: str, font):
+        """Render white-on-black text and threshold it like a capture."""
+        left, top, right, bottom = font.getbbox(keyword)
+        if right <= left or bottom <= top:
+            return None
+
+        canvas = Image.new("L", (right - left + 4, bottom - top + 4), 0)
+        ImageDraw.Draw(canvas).text((2 - left, 2 - top), keyword, fill=255, font=font)
+        _, tmpl = cv2.threshold(np.asarray(canvas), self.thresh_val, 255, cv2.THRESH_BINARY)
+        return tmpl
+
+    def is_available(self) -> bool:
+        return bool(self.templates)
+
+    def matches(self, keywords, thresh_val: int) -> bool:
+        """True if these templates were built for the given keywords/threshold."""
+        return self.keywords == tuple(keywords) and self.thresh_val == thresh_val
+
+    def find(self, thresh):
+        """
+        Locate keywords in a thresholded capture.
+
+        Returns {keyword: [(x, y), ...]} with one point per hit cluster.
+        """
+        found = {}
+        height, width = thresh.shape[:2]
+
+        for keyword, tmpl in self.templates:
+            th, tw = tmpl.shape
+            if th > height or tw > width:
+                continue
+
+            res = cv2.matchTemplate(thresh, tmpl, cv2.TM_CCOEFF_NORMED)
+            hits = np.argwhere(res > MATCH_THRESHOLD)
+            if not len(hits):
+                continue
+
+            points = found.setdefault(keyword, [])
+            for y, x in hits:
+                # Neighbouring pixels of one occurrence all score high
+                if all(abs(x - px) > tw // 2 or abs(y - py) > th // 2 for px, py in points):
+                    points.append((int(x), int(y)))
+
+        return found
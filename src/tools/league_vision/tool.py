@@ -3,15 +3,276 @@ League Vision Tool - OCR-based screen scanning for league mechanics.
 """
 
 import os
+import re
+import time
+import hashlib
+from collections import OrderedDict, deque
+import cv2
+import numpy as np
+import pytesseract
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QTextEdit, QGroupBox, QCheckBox, QFileDialog, QMessageBox
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal
+from PyQt6.QtGui import QTextCursor
 
 from tools.base_tool import BaseTool
 from tools.league_vision.scanner import ScannerWorker, ScanResult
+from tools.league_vision.templates import KeywordTemplates
+from tools.league_vision.vision_core import VisionCore
 from services.zone_monitor import ZoneMonitor
+from utils.hotkey import GlobalHotkey, MOD_SHIFT, VK_ESCAPE
+
+try:
+    import xxhash
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
+
+try:
+    import tesserocr
+    from PIL import Image
+    HAS_TESSEROCR = True
+except ImportError:
+    HAS_TESSEROCR = False
+
+# Number of distinct captures whose Test OCR text is remembered
+OCR_CACHE_SIZE = 64
+
+# Scanner sub-configs filled in when missing from league_vision. Tuples keep
+# the shared defaults immutable; each entry is copied before use.
+_DEFAULT_SUBCONFIG = {
+    "map_check": {},
+    "essence": {"keywords": ("Misery", "Envy", "Dread", "Scorn")},
+    "ritual": {"keywords": ("Opulent", "Apocalyptic", "Glacial", "Volatile")},
+    "eldritch_altars": {},
+    "expedition": {},
+}
+
+# Sub-config -> checkbox attribute controlling its "enabled" flag
+_FEATURE_CHECKBOXES = {
+    "map_check": "chk_map_safety",
+    "essence": "chk_essence",
+    "ritual": "chk_ritual",
+    "eldritch_altars": "chk_altars",
+    "expedition": "chk_expedition",
+}
+
+# Above this many text blocks, OCR the whole capture in one call instead
+MAX_OCR_REGIONS = 6
+
+
+class OcrTestWorker(QThread):
+    """Captures the PoE window once and runs OCR on it, off the GUI thread."""
+    
+    log_signal = pyqtSignal(str)
+    
+    def __init__(self, vision: VisionCore, vision_config: dict, ocr_cache: OrderedDict, buffers: dict,
+                 tess_api=None, templates=None):
+        super().__init__()
+        self.vision = vision  # Owned by the widget, keeps the PoE window handle
+        self.vision_config = vision_config
+        self.ocr_cache = ocr_cache  # Shared with the widget, one worker at a time
+        self.buffers = buffers  # Reused gray/threshold arrays, also shared
+        self.tess_api = tess_api  # In-process tesserocr API, created on first use
+        self.templates = templates  # KeywordTemplates, rebuilt when keywords change
+    
+    def log(self, message: str):
+        self.log_signal.emit(message)
+    
+    def run(self):
+        tesseract_path = self.vision_config.get("tesseract_path", "C:/Program Files/Tesseract-OCR/tesseract.exe")
+        pytesseract.pytesseract.tesseract_cmd = tesseract_path
+        
+        vision = self.vision
+        rect = vision.get_window_rect()
+        
+        if not rect:
+            self.log("ERROR: Could not find Path of Exile window")
+            return
+        
+        self.log(f"Window found: {rect}")
+        
+        # Capture center region
+        region = {
+            "top": int(rect["top"] + (rect["height"] * 0.1)),
+            "left": int(rect["left"] + (rect["width"] * 0.2)),
+            "width": int(rect["width"] * 0.6),
+            "height": int(rect["height"] * 0.8)
+        }
+        
+        # Capture and threshold into buffers reused across tests (reallocated on resize)
+        dims = (region["height"], region["width"])
+        if self.buffers.get("dims") != dims:
+            self.buffers["dims"] = dims
+            self.buffers["gray"] = np.empty(dims, np.uint8)
+            self.buffers["thresh"] = np.empty(dims, np.uint8)
+        
+        # Single-channel capture; Test OCR never needs colour, and the green
+        # channel is close enough for its diagnostic thresholding
+        if vision.capture_region_into(self.buffers["gray"], region, green_only=True) is None:
+            self.log("ERROR: Failed to capture screen")
+            return
+        gray = self.buffers["gray"]
+        
+        self.log(f"Captured region: {region}")
+        
+        thresh_val = self.vision_config.get("ocr_threshold", 70)
+        _, thresh = cv2.threshold(gray, thresh_val, 255, cv2.THRESH_BINARY, dst=self.buffers["thresh"])
+        
+        # Fixed keywords are found by template matching. OCR still runs so the
+        # diagnostic shows the text, but its keyword search skips what templates cover.
+        template_hit = self.match_templates(thresh, thresh_val)
+        
+        try:
+            # OCR only the detected text blocks; cost scales with pixel count
+            regions = self.find_text_regions(thresh)
+            if not regions or len(regions) > MAX_OCR_REGIONS:
+                regions = [(0, 0, thresh.shape[1], thresh.shape[0])]
+            
+            texts = []
+            for x0, y0, x1, y1 in regions:
+                block_text = self.cached_ocr(thresh[y0:y1, x0:x1], thresh_val, tesseract_path).strip()
+                if block_text:
+                    texts.append(block_text)
+            text = "\n".join(texts)
+            
+            self.log("=== OCR RESULT ===")
+            self.log(text[:1000] if len(text) > 1000 else text)
+            self.log("=== END OCR ===")
+            
+            # Check for keywords; bad mods were already reported by the template pass
+            map_check = self.vision_config.get("map_check", {})
+            if not template_hit:
+                for mod in self.find_keywords(map_check.get("bad_mods", []), text):
+                    self.log(f"FOUND BAD MOD: {mod}")
+            
+            for ctx in self.find_keywords(map_check.get("required_context", []), text):
+                self.log(f"FOUND CONTEXT: {ctx}")
+                    
+        except Exception as e:
+            self.log(f"OCR Error: {e}")
+    
+    @staticmethod
+    def find_keywords(keywords, text: str) -> list:
+        """
+        Return the keywords present in text (case-insensitive), in config order.
+        
+        One alternation regex scans the text once instead of lowering and
+        searching it per keyword; re caches the compiled pattern between tests.
+        """
+        if not keywords:
+            return []
+        pattern = re.compile("|".join(re.escape(kw) for kw in keywords), re.IGNORECASE)
+        seen = {m.group(0).lower() for m in pattern.finditer(text)}
+        return [kw for kw in keywords if kw.lower() in seen]
+    
+    def template_keywords(self) -> list:
+        """Bad mods plus enabled essence/ritual keywords."""
+        keywords = list(self.vision_config.get("map_check", {}).get("bad_mods", []))
+        for key in ("essence", "ritual"):
+            section = self.vision_config.get(key, {})
+            if section.get("enabled", True):
+                keywords.extend(section.get("keywords", []))
+        return keywords
+    
+    def match_templates(self, thresh, thresh_val: int) -> bool:
+        """Log template hits for fixed keywords. Returns True if any were found."""
+        keywords = self.template_keywords()
+        if self.templates is None or not self.templates.matches(keywords, thresh_val):
+            self.templates = KeywordTemplates(
+                keywords,
+                font_path=self.vision_config.get("template_font"),
+                thresh_val=thresh_val
+            )
+        
+        if not self.templates.is_available():
+            return False
+        
+        found = self.templates.find(thresh)
+        if not found:
+            return False
+        
+        bad_mods = set(self.vision_config.get("map_check", {}).get("bad_mods", []))
+        self.log("=== TEMPLATE MATCHES ===")
+        for keyword, points in found.items():
+            label = "FOUND BAD MOD" if keyword in bad_mods else "FOUND KEYWORD"
+            self.log(f"{label}: {keyword} ({len(points)}x)")
+        self.log("=== END MATCHES ===")
+        return True
+    
+    @staticmethod
+    def find_text_regions(thresh, padding: int = 6, line_gap: int = 12):
+        """
+        Find text blocks in a thresholded capture.
+        
+        Detection runs on a half-size copy: glyphs are smeared into blobs,
+        blob boxes that overlap vertically are merged into bands, and the
+        bands are scaled back up. Returns full-resolution (x0, y0, x1, y1).
+        """
+        small = cv2.resize(thresh, (0, 0), fx=0.5, fy=0.5, interpolation=cv2.INTER_NEAREST)
+        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (15, 3))
+        blobs = cv2.dilate(small, kernel)
+        contours, _ = cv2.findContours(blobs, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        
+        rects = [cv2.boundingRect(c) for c in contours]
+        rects = [r for r in rects if r[2] >= 8 and r[3] >= 4]  # Drop specks
+        
+        bands = []
+        for x, y, w, h in sorted(rects, key=lambda r: r[1]):
+            if bands and y <= bands[-1][3] + line_gap // 2:
+                bx0, by0, bx1, by1 = bands[-1]
+                bands[-1] = (min(bx0, x), by0, max(bx1, x + w), max(by1, y + h))
+            else:
+                bands.append((x, y, x + w, y + h))
+        
+        height, width = thresh.shape[:2]
+        return [
+            (max(0, x0 * 2 - padding), max(0, y0 * 2 - padding),
+             min(width, x1 * 2 + padding), min(height, y1 * 2 + padding))
+            for x0, y0, x1, y1 in bands
+        ]
+    
+    def cached_ocr(self, thresh, thresh_val: int, tesseract_path: str) -> str:
+        """OCR a thresholded capture, reusing the text for identical captures."""
+        if HAS_XXHASH:
+            digest = xxhash.xxh3_128(thresh.tobytes())
+        else:
+            digest = hashlib.blake2b(thresh.tobytes(), digest_size=16)
+        digest.update(f"{thresh.shape}|{thresh_val}|{tesseract_path}".encode())
+        key = digest.digest()
+        
+        cached = self.ocr_cache.get(key)
+        if cached is not None:
+            self.ocr_cache.move_to_end(key)
+            return cached[0]
+        
+        text = self.ocr_image(thresh, tesseract_path)
+        self.ocr_cache[key] = (text, time.time())
+        if len(self.ocr_cache) > OCR_CACHE_SIZE:
+            self.ocr_cache.popitem(last=False)
+        return text
+    
+    def ocr_image(self, thresh, tesseract_path: str) -> str:
+        """
+        OCR an image with the in-process tesserocr API when available.
+        
+        Keeping the API (and its language model) loaded avoids starting
+        tesseract.exe for every test; falls back to pytesseract otherwise.
+        """
+        if self.tess_api is None and HAS_TESSEROCR:
+            tessdata = os.path.join(os.path.dirname(tesseract_path), "tessdata")
+            try:
+                self.tess_api = tesserocr.PyTessBaseAPI(path=tessdata, psm=tesserocr.PSM.AUTO)
+            except RuntimeError as e:
+                self.log(f"tesserocr unavailable ({e}), using pytesseract")
+        
+        if self.tess_api is None:
+            return pytesseract.image_to_string(thresh)
+        
+        self.tess_api.SetImage(Image.fromarray(thresh))
+        return self.tess_api.GetUTF8Text()
 
 
 class LeagueVisionWidget(QWidget):
@@ -24,7 +285,33 @@ class LeagueVisionWidget(QWidget):
         self.overlay = overlay
         
         self.scanner = None
+        self._retired_scanners = set()  # Stopped workers still finishing a scan pass
         self.zone_monitor = None
+        self.ocr_worker = None
+        self._vision = VisionCore(backend=self.vision_config.get("capture_backend", "mss"))
+        
+        # Test OCR results: capture hash -> (text, timestamp), oldest first
+        self._ocr_cache = OrderedDict()
+        self._ocr_buffers = {}
+        self._tess_api = None
+        self._keyword_templates = None
+        
+        # Log lines are buffered and appended in one go per timer tick. While
+        # the tab is hidden they just accumulate (oldest dropped past the
+        # block cap) and are flushed on showEvent.
+        self._log_buf = deque(maxlen=500)
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.timeout.connect(self._flush_log)
+        
+        # Scanner config is rebuilt only after a setting changes
+        self._config_epoch = 0
+        self._cached_epoch = None
+        self._cached_config = None
+        
+        # Shift+Esc stops the scanner even while PoE has focus
+        self.stop_hotkey = GlobalHotkey(MOD_SHIFT, VK_ESCAPE, self)
+        self.stop_hotkey.activated.connect(self.on_stop_hotkey)
         
         self.setup_ui()
         self.setup_zone_monitor()
@@ -95,6 +382,12 @@ class LeagueVisionWidget(QWidget):
         self.chk_syndicate.setChecked(len(self.vision_config.get("syndicate_goals", {})) > 0)
         features_layout.addWidget(self.chk_syndicate)
         
+        # Feature toggles are written to vision_config so ConfigManager.save persists them
+        for key, attr in _FEATURE_CHECKBOXES.items():
+            getattr(self, attr).toggled.connect(
+                lambda checked, key=key: self._set_feature_enabled(key, checked))
+        self.chk_syndicate.stateChanged.connect(self._bump_config_epoch)
+        
         layout.addWidget(features_group)
         
         # Debug tools (debug mode is controlled globally via Settings menu)
@@ -151,6 +444,8 @@ class LeagueVisionWidget(QWidget):
         self.log_area = QTextEdit()
         self.log_area.setReadOnly(True)
         self.log_area.setMaximumHeight(150)
+        self.log_area.document().setMaximumBlockCount(500)
+        self.log_area.setUndoRedoEnabled(False)  # Append-only; no undo history to grow
         layout.addWidget(self.log_area)
         
         layout.addStretch()
@@ -172,7 +467,47 @@ class LeagueVisionWidget(QWidget):
         self.log(f"Zone changed: {zone}")
     
     def log(self, message: str):
-        self.log_area.append(message)
+        self.log_batch((message,))
+    
+    def log_batch(self, messages):
+        """Queue several log lines for the next flush."""
+        self._log_buf.extend(messages)
+        if self.isVisible() and not self._log_timer.isActive():
+            self._log_timer.start(50)
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._flush_log()
+    
+    def _flush_log(self):
+        """Append buffered log lines with a single insert."""
+        if not self._log_buf:
+            return
+        
+        text = "\n".join(self._log_buf)
+        self._log_buf.clear()
+        
+        # Only follow new lines if the user hasn't scrolled up (small slack for rounding)
+        scrollbar = self.log_area.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum() - 4
+        
+        cursor = QTextCursor(self.log_area.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        if not self.log_area.document().isEmpty():
+            text = "\n" + text
+        cursor.insertText(text)
+        
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+    
+    def _bump_config_epoch(self, *_):
+        """Invalidate the cached scanner config."""
+        self._config_epoch += 1
+    
+    def _set_feature_enabled(self, key: str, enabled: bool):
+        """Store a feature checkbox in vision_config and invalidate the scanner config."""
+        self.vision_config.setdefault(key, {})["enabled"] = enabled
+        self._bump_config_epoch()
     
     def browse_log_path(self):
         """Browse for Client.txt file."""
@@ -184,6 +519,7 @@ class LeagueVisionWidget(QWidget):
         )
         if path:
             self.vision_config["client_log_path"] = path
+            self._bump_config_epoch()
             self.log_path_label.setText(path)
             self.log(f"Client log path set: {path}")
             
@@ -227,6 +563,7 @@ class LeagueVisionWidget(QWidget):
             }
             
             self.vision_config["map_device_button"] = rect
+            self._bump_config_epoch()
             self.log(f"Map device button calibrated: {rect}")
             QMessageBox.information(self, "Calibration Complete", 
                                   f"Button position saved!\nRect: {rect}")
@@ -234,6 +571,7 @@ class LeagueVisionWidget(QWidget):
     def set_debug_mode(self, enabled: bool):
         """Set debug mode (called from main window global toggle)."""
         self.vision_config["debug_mode"] = enabled
+        self._bump_config_epoch()
         self.log(f"Debug mode {'enabled' if enabled else 'disabled'}")
         if enabled:
             self.log("OCR output will be logged to debug.log and shown in log area")
@@ -243,95 +581,53 @@ class LeagueVisionWidget(QWidget):
             self.scanner.debug_mode = enabled
     
     def test_ocr(self):
-        """Perform a single OCR test and show results."""
-        import cv2
-        import pytesseract
-        from tools.league_vision.vision_core import VisionCore
-        
-        tesseract_path = self.vision_config.get("tesseract_path", "C:/Program Files/Tesseract-OCR/tesseract.exe")
-        pytesseract.pytesseract.tesseract_cmd = tesseract_path
-        
-        vision = VisionCore()
-        rect = vision.get_window_rect()
-        
-        if not rect:
-            self.log("ERROR: Could not find Path of Exile window")
+        """Run a single OCR test in the background and show results."""
+        if self.ocr_worker and self.ocr_worker.isRunning():
             return
         
-        self.log(f"Window found: {rect}")
-        
-        # Capture center region
-        region = {
-            "top": int(rect["top"] + (rect["height"] * 0.1)),
-            "left": int(rect["left"] + (rect["width"] * 0.2)),
-            "width": int(rect["width"] * 0.6),
-            "height": int(rect["height"] * 0.8)
-        }
-        
-        img = vision.capture_region(region)
-        if img is None:
-            self.log("ERROR: Failed to capture screen")
-            return
-        
-        self.log(f"Captured region: {region}")
-        
-        # Process OCR
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        thresh_val = self.vision_config.get("ocr_threshold", 70)
-        _, thresh = cv2.threshold(gray, thresh_val, 255, cv2.THRESH_BINARY)
-        
-        try:
-            text = pytesseract.image_to_string(thresh)
-            self.log("=== OCR RESULT ===")
-            self.log(text[:1000] if len(text) > 1000 else text)
-            self.log("=== END OCR ===")
-            
-            # Check for keywords
-            bad_mods = self.vision_config.get("map_check", {}).get("bad_mods", [])
-            for mod in bad_mods:
-                if mod.lower() in text.lower():
-                    self.log(f"FOUND BAD MOD: {mod}")
-            
-            contexts = self.vision_config.get("map_check", {}).get("required_context", [])
-            for ctx in contexts:
-                if ctx.lower() in text.lower():
-                    self.log(f"FOUND CONTEXT: {ctx}")
-                    
-        except Exception as e:
-            self.log(f"OCR Error: {e}")
+        self.ocr_preview_btn.setEnabled(False)
+        self.ocr_worker = OcrTestWorker(
+            self._vision, self.vision_config.copy(), self._ocr_cache, self._ocr_buffers,
+            self._tess_api, self._keyword_templates
+        )
+        self.ocr_worker.log_signal.connect(self.log)
+        self.ocr_worker.finished.connect(self.on_ocr_test_finished)
+        self.ocr_worker.start()
+    
+    def on_ocr_test_finished(self):
+        """Re-enable Test OCR once the worker is done."""
+        self._tess_api = self.ocr_worker.tess_api
+        self._keyword_templates = self.ocr_worker.templates
+        self.ocr_preview_btn.setEnabled(True)
+        self.ocr_worker = None
 
     def get_scanner_config(self):
-        """Build scanner config from current settings."""
+        """Build scanner config from current settings, reusing it until one changes."""
+        debug_mode = self.config.get("debug_mode", False)
+        cache_key = (self._config_epoch, debug_mode)
+        if self._cached_epoch == cache_key:
+            return self._cached_config
+        
         config = self.vision_config.copy()
         
         # Use global debug mode from main config
-        config["debug_mode"] = self.config.get("debug_mode", False)
-        
-        # Update enabled states from checkboxes
-        if "map_check" not in config:
-            config["map_check"] = {}
-        config["map_check"]["enabled"] = self.chk_map_safety.isChecked()
-        
-        if "essence" not in config:
-            config["essence"] = {"keywords": ["Misery", "Envy", "Dread", "Scorn"]}
-        config["essence"]["enabled"] = self.chk_essence.isChecked()
+        config["debug_mode"] = debug_mode
         
-        if "ritual" not in config:
-            config["ritual"] = {"keywords": ["Opulent", "Apocalyptic", "Glacial", "Volatile"]}
-        config["ritual"]["enabled"] = self.chk_ritual.isChecked()
-        
-        if "eldritch_altars" not in config:
-            config["eldritch_altars"] = {}
-        config["eldritch_altars"]["enabled"] = self.chk_altars.isChecked()
-        
-        if "expedition" not in config:
-            config["expedition"] = {}
-        config["expedition"]["enabled"] = self.chk_expedition.isChecked()
+        # Update enabled states from checkboxes. The copy above is shallow, so the
+        # scanner gets its own copy of each sub-config; vision_config is kept in
+        # sync by _set_feature_enabled.
+        for key, default in _DEFAULT_SUBCONFIG.items():
+            checkbox = getattr(self, _FEATURE_CHECKBOXES[key])
+            section = dict(config.get(key) or default)
+            section["enabled"] = checkbox.isChecked()
+            config[key] = section
         
         # Syndicate - if disabled, clear the goals so scanner skips it
         if not self.chk_syndicate.isChecked():
             config["syndicate_goals"] = {}
         
+        self._cached_epoch = cache_key
+        self._cached_config = config
         return config
     
     def toggle_scanner(self):
@@ -339,10 +635,14 @@ class LeagueVisionWidget(QWidget):
         if self.scanner and self.scanner.isRunning():
             return
         
+        # A worker that exited on its own (e.g. crashed) is released before replacing it
+        if self.scanner:
+            self.release_scanner()
+        
         config = self.get_scanner_config()
-        self.scanner = ScannerWorker(config)
+        self.scanner = ScannerWorker(config, vision=self._vision)
         self.scanner.result_signal.connect(self.on_scan_result)
-        self.scanner.status_signal.connect(self.log)
+        self.scanner.status_batch_signal.connect(self.log_batch, Qt.ConnectionType.QueuedConnection)
         self.scanner.mode_signal.connect(self.on_mode_changed)
         
         # Connect debug signals to overlay
@@ -360,6 +660,9 @@ class LeagueVisionWidget(QWidget):
         
         self.scanner.start()
         
+        if not self.stop_hotkey.register():
+            self.log("WARNING: Could not register Shift+Esc stop hotkey")
+        
         # Show overlay for debug visualization
         if self.overlay and config.get("debug_mode"):
             self.overlay.show()
@@ -371,10 +674,12 @@ class LeagueVisionWidget(QWidget):
     
     def stop_scanner(self):
         """Stop the scanner."""
+        self.stop_hotkey.unregister()
+        
         if self.scanner:
             self.scanner.stop()
             self.scanner.wait(2000)
-            self.scanner = None
+            self.release_scanner()
         
         # Clear debug rect
         if self.overlay:
@@ -387,6 +692,35 @@ class LeagueVisionWidget(QWidget):
         self.stop_btn.setEnabled(False)
         self.log("Scanner stopped.")
     
+    def release_scanner(self):
+        """
+        Disconnect the scanner's signals and schedule the worker for deletion.
+        
+        A worker still inside an OCR pass (wait() timed out) is kept alive
+        and deleted once its thread actually finishes; deleting a running
+        QThread aborts the process.
+        """
+        for signal in (self.scanner.result_signal, self.scanner.status_batch_signal,
+                       self.scanner.mode_signal, self.scanner.debug_rect_signal,
+                       self.scanner.debug_box_signal, self.scanner.clear_debug_signal,
+                       self.scanner.stop_requested_signal):
+            try:
+                signal.disconnect()
+            except TypeError:
+                pass  # Nothing connected (debug signals are only wired in debug mode)
+        
+        scanner, self.scanner = self.scanner, None
+        if scanner.isRunning():
+            self._retired_scanners.add(scanner)
+            scanner.finished.connect(lambda: self._delete_retired_scanner(scanner))
+        else:
+            scanner.deleteLater()
+    
+    def _delete_retired_scanner(self, scanner):
+        """Delete a released worker once its thread has exited."""
+        self._retired_scanners.discard(scanner)
+        scanner.deleteLater()
+    
     def on_debug_rect(self, x: int, y: int, w: int, h: int, color: str):
         """Handle debug rect from scanner."""
         if self.overlay:
@@ -402,6 +736,12 @@ class LeagueVisionWidget(QWidget):
         if self.overlay:
             self.overlay.clear_debug()
     
+    def on_stop_hotkey(self):
+        """Handle the global Shift+Esc hotkey."""
+        if self.scanner:
+            self.log("Shift+Esc pressed - stopping scanner...")
+            self.scanner.stop_requested_signal.emit()
+    
     def on_scanner_stop_requested(self):
         """Handle stop hotkey from scanner."""
         self.stop_scanner()
@@ -440,13 +780,26 @@ class LeagueVisionWidget(QWidget):
     
     def cleanup(self):
         """Clean up resources."""
+        self.stop_hotkey.unregister()
+        
+        if self.ocr_worker:
+            self.ocr_worker.wait(5000)
+            self._tess_api = self.ocr_worker.tess_api
+        
+        if self._tess_api:
+            self._tess_api.End()
+            self._tess_api = None
+        
         if self.scanner:
             self.scanner.stop()
             self.scanner.wait(2000)
+            self.release_scanner()
         
         if self.zone_monitor:
             self.zone_monitor.stop()
         
+        self._vision.close()
+        
         if self.overlay:
             self.overlay.clear_blockers()
 
@@ -2,6 +2,8 @@
 Vision core for screen capture and window detection.
 """
 
+import time
+import threading
 import mss
 import numpy as np
 import cv2
@@ -13,19 +15,51 @@ except ImportError:
     HAS_WIN32 = False
     print("Warning: win32gui not found. Window detection may not work.")
 
+try:
+    import dxcam
+    HAS_DXCAM = True
+except ImportError:
+    HAS_DXCAM = False
+
+# Seconds a window rect is reused before GetWindowRect is called again
+RECT_CACHE_TTL = 0.5
+
 
 class VisionCore:
-    """Core vision functionality for screen capture."""
+    """
+    Core vision functionality for screen capture.
+    
+    One instance is shared by Test OCR and the scanner, so the window
+    handle and rect found by either are reused by both.
+    """
     
-    def __init__(self, window_title="Path of Exile", resolution_config=None):
+    def __init__(self, window_title="Path of Exile", resolution_config=None, backend="mss",
+                 ring_size=3):
         self.window_title = window_title
         self.hwnd = None
         self.resolution_config = resolution_config
         
+        # Optional DXGI Desktop Duplication capture (primary monitor only)
+        self.backend = backend if backend == "dxcam" and HAS_DXCAM else "mss"
+        self._cam = None
+        self._cam_lock = threading.Lock()
+        self._cam_last = None  # (region tuple, frame): dxcam returns None for unchanged screens
+        self._rect = None
+        self._rect_time = 0.0
+        
+        # mss grabbers hold per-thread GDI handles, so each capturing thread
+        # gets its own (plus its own rings of output buffers)
+        self.ring_size = max(1, ring_size)
+        self._local = threading.local()
+        self._grabbers = []
+        self._grabbers_lock = threading.Lock()
+        
     def find_window(self):
-        """Finds the PoE window and stores its handle."""
+        """Finds the PoE window and stores its handle, reusing it while still valid."""
         if not HAS_WIN32:
             return False
+        if self.hwnd and win32gui.IsWindow(self.hwnd):
+            return True
         self.hwnd = win32gui.FindWindow(None, self.window_title)
         return self.hwnd is not None and self.hwnd != 0
 
@@ -39,30 +73,185 @@ class VisionCore:
                 "height": self.resolution_config["height"]
             }
 
+        # Within the TTL no Win32 calls at all; find_window re-validates the handle
+        now = time.monotonic()
+        if self._rect is not None and now - self._rect_time < RECT_CACHE_TTL:
+            return self._rect
+
+        self._rect = None
         if not self.find_window():
             return None
 
         try:
             rect = win32gui.GetWindowRect(self.hwnd)
             x, y, w, h = rect[0], rect[1], rect[2] - rect[0], rect[3] - rect[1]
-            return {"top": y, "left": x, "width": w, "height": h}
+            self._rect = {"top": y, "left": x, "width": w, "height": h}
+            self._rect_time = now
+            return self._rect
         except Exception as e:
             print(f"Error getting window rect: {e}")
             return None
 
-    def capture_region(self, region=None):
-        """Captures a region of the screen."""
+    def invalidate_rect(self):
+        """Forget the cached window rect, e.g. after the window may have moved."""
+        self._rect = None
+
+    def capture_region(self, region=None, grayscale=False, green_only=False):
+        """
+        Captures a region of the screen.
+        
+        Returns a BGR image, or a single-channel luma image when grayscale is
+        set. Either comes from a ring of ring_size buffers per thread, so it
+        stays valid for the next ring_size - 1 captures of the same size made
+        by that thread; copy it if it has to outlive that.
+        With green_only the single-channel image is just the green channel,
+        which skips the weighted pass but loses red text; only use it where
+        that is acceptable.
+        """
+        if region is None:
+            region = self.get_window_rect()
+            if region is None:
+                return None
+        
+        frame = self._grab(region)
+        if grayscale:
+            gray = self._thread_buffer("gray_buf", frame.shape[:2])
+            self._to_gray(frame, gray, green_only)
+            return gray
+        if frame.shape[2] == 3:
+            return frame
+        
+        # Dropping alpha is a pure channel copy, no colour conversion needed
+        bgr = self._thread_buffer("bgr_buf", frame.shape[:2] + (3,))
+        cv2.mixChannels([frame], [bgr], [0, 0, 1, 1, 2, 2])
+        return bgr
+    
+    def capture_region_into(self, dst, region=None, green_only=False):
+        """
+        Capture straight into a caller-owned buffer.
+        
+        dst is (h, w) uint8 for grayscale (luma, or the green channel with
+        green_only) or (h, w, 3) for BGR and must match the region size. The
+        grab is written into dst directly, skipping the thread's ring.
+        Returns a memoryview over dst, or None if there is no window to
+        capture.
+        """
         if region is None:
             region = self.get_window_rect()
             if region is None:
                 return None
         
-        with mss.mss() as sct:
-            screenshot = sct.grab(region)
+        frame = self._grab(region)
+        if frame.shape[:2] != dst.shape[:2]:
+            raise ValueError(f"capture is {frame.shape[:2]}, buffer is {dst.shape[:2]}")
+        
+        if dst.ndim == 2:
+            self._to_gray(frame, dst, green_only)
+        elif frame.shape[2] == 3:
+            np.copyto(dst, frame)
+        else:
+            cv2.mixChannels([frame], [dst], [0, 0, 1, 1, 2, 2])
+        return dst.data
+    
+    @staticmethod
+    def _to_gray(frame, dst, green_only=False):
+        """Write a BGR/BGRA frame into dst as luma, or as its green channel."""
+        if green_only:
+            np.copyto(dst, frame[:, :, 1])
+        else:
+            code = cv2.COLOR_BGR2GRAY if frame.shape[2] == 3 else cv2.COLOR_BGRA2GRAY
+            cv2.cvtColor(frame, code, dst=dst)
+    
+    def _grab(self, region):
+        """Grab a region as a BGR frame (dxcam) or a BGRA view over mss's bytes."""
+        if self.backend == "dxcam":
+            frame = self._grab_dxcam(region)
+            if frame is not None:
+                return frame
+        
+        local = self._local
+        sct = getattr(local, "sct", None)
+        if sct is None:
+            sct = local.sct = mss.mss()
+            with self._grabbers_lock:
+                self._grabbers.append(sct)
+        
+        screenshot = sct.grab(region)
+        
+        # View over mss's BGRA bytes (no copy)
+        h, w = screenshot.height, screenshot.width
+        return np.frombuffer(screenshot.raw, dtype=np.uint8).reshape(h, w, 4)
+    
+    def _thread_buffer(self, name: str, shape):
+        """
+        Next output buffer from the calling thread's ring, reallocated only on resize.
+        
+        The tooltip and centre regions keep the same size frame after frame,
+        so steady-state captures allocate nothing.
+        """
+        ring = getattr(self._local, name, None)
+        if ring is None or ring[0].shape != shape:
+            ring = [np.empty(shape, dtype=np.uint8) for _ in range(self.ring_size)]
+            setattr(self._local, name, ring)
+            setattr(self._local, name + "_idx", 0)
+        
+        idx = getattr(self._local, name + "_idx")
+        setattr(self._local, name + "_idx", (idx + 1) % len(ring))
+        return ring[idx]
+    
+    def _grab_dxcam(self, region):
+        """
+        Grab a BGR frame through dxcam, or None to fall back to mss.
+        
+        dxcam regions are relative to the primary output, so anything
+        outside it (second monitor) goes through mss instead.
+        """
+        box = (region["left"], region["top"],
+               region["left"] + region["width"], region["top"] + region["height"])
+        
+        with self._cam_lock:
+            if self._cam is None:
+                try:
+                    self._cam = dxcam.create(output_color="BGR")
+                except Exception as e:
+                    print(f"dxcam unavailable, using mss: {e}")
+                    self.backend = "mss"
+                    return None
+            
+            if box[0] < 0 or box[1] < 0 or box[2] > self._cam.width or box[3] > self._cam.height:
+                return None
+            
+            frame = self._cam.grab(region=box)
+            if frame is None:
+                # Nothing new on screen since the last grab
+                if self._cam_last and self._cam_last[0] == box:
+                    return self._cam_last[1]
+                return None
+            
+            # Hashing and OpenCV dst buffers downstream need C-contiguous frames
+            frame = np.ascontiguousarray(frame)
+            self._cam_last = (box, frame)
+            return frame
+    
+    def close(self):
+        """Release the capture resources created by capture_region."""
+        with self._grabbers_lock:
+            grabbers, self._grabbers = self._grabbers, []
+        for sct in grabbers:
+            try:
+                sct.close()
+            except Exception:
+                pass
+        self._local = threading.local()
         
-        img = np.array(screenshot)
-        img = cv2.cvtColor(img, cv2.COLOR_BGRA2BGR)
-        return img
+        with self._cam_lock:
+            if self._cam is not None:
+                try:
+                    self._cam.release()
+                except Exception:
+                    pass
+                self._cam = None
+                self._cam_last = None
 
     def get_mouse_tooltip_region(self, width=400, height=200):
         """Calculates a region around the mouse cursor."""
@@ -3,18 +3,74 @@ Trade Sniper Tool - Control panel for trade automation service.
 """
 
 import os
+import time
 import socket
-import subprocess
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QTextEdit, QGroupBox, QCheckBox, QSpinBox, QMessageBox
+    QPlainTextEdit, QGroupBox, QCheckBox, QSpinBox, QMessageBox
 )
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QProcess, QThread, QTimer, pyqtSignal
 
 from tools.base_tool import BaseTool
 from services.trade_service import TradeService
 
 
+# Status label colours, selected through the "state" dynamic property so the
+# stylesheet is parsed once instead of on every status change
+STATUS_QSS = """
+QLabel[state="ok"] { color: #66ff66; }
+QLabel[state="warn"] { color: #ffaa66; }
+QLabel[state="error"] { color: #ff6666; }
+QLabel#serviceStatus { font-size: 14px; }
+"""
+
+# Common Brave install locations (a "brave_path" in trade_sniper config wins)
+BRAVE_CANDIDATES = [
+    r"C:\Program Files\BraveSoftware\Brave-Browser\Application\brave.exe",
+    r"C:\Program Files (x86)\BraveSoftware\Brave-Browser\Application\brave.exe",
+    os.path.expandvars(r"%LOCALAPPDATA%\BraveSoftware\Brave-Browser\Application\brave.exe"),
+]
+
+# Dedicated Brave profile, kept next to the Node service (<project>/trade_service)
+BRAVE_PROFILE_DIR = os.path.abspath(os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "trade_service", "brave-profile"
+))
+
+# npm install is killed if it hasn't finished by then
+NPM_INSTALL_TIMEOUT_MS = 120000
+
+# Brave status poll interval while the state is changing / once it is stable
+BRAVE_POLL_FAST_MS = 2000
+BRAVE_POLL_SLOW_MS = 30000
+BRAVE_STABLE_TICKS = 3
+
+# A successful probe is trusted this long before the port is checked again.
+# Kept to the fast interval: a longer cache would let a slow-mode tick show a
+# closed Brave as connected for up to a poll plus the cache lifetime.
+BRAVE_STATUS_CACHE_SECS = BRAVE_POLL_FAST_MS / 1000
+
+
+class BraveProbeWorker(QThread):
+    """Checks the Brave debug port off the GUI thread."""
+    
+    result_signal = pyqtSignal(bool)
+    
+    def run(self):
+        self.result_signal.emit(self.is_brave_debug_running())
+    
+    @staticmethod
+    def is_brave_debug_running() -> bool:
+        """Check if something is listening on port 9222 (Brave debug port)."""
+        try:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.settimeout(0.5)
+            result = sock.connect_ex(('127.0.0.1', 9222))
+            sock.close()
+            return result == 0
+        except:
+            return False
+
+
 class TradeSniperWidget(QWidget):
     """Main widget for Trade Sniper tool."""
     
@@ -23,6 +79,21 @@ class TradeSniperWidget(QWidget):
         self.config = config
         self.trade_config = config.get("trade_sniper", {})
         
+        # Service output is queued and appended in one block per timer tick
+        self._log_queue = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.timeout.connect(self._flush_log)
+        
+        self._deps_cache = None  # (node_modules mtime, state)
+        self.npm_process = None
+        self._install_partial = b""  # npm output line still waiting for its newline
+        self.brave_probe = None
+        self._brave_exe = None
+        self.brave_running = False
+        self._brave_seen_at = 0.0
+        self._brave_stable_ticks = 0
+        
         self.service = TradeService()
         self.service.status_changed.connect(self.on_status_changed)
         self.service.log_output.connect(self.log)
@@ -31,12 +102,14 @@ class TradeSniperWidget(QWidget):
         self.check_setup()
         self.check_brave_status()
         
-        # Periodically check Brave status every 5 seconds
-        self.brave_check_timer = QTimer()
+        # Poll Brave status: quickly while it changes, slowly once it settles
+        self.brave_check_timer = QTimer(self)
         self.brave_check_timer.timeout.connect(self.check_brave_status)
-        self.brave_check_timer.start(5000)
+        self.brave_check_timer.start(BRAVE_POLL_FAST_MS)
     
     def setup_ui(self):
+        self.setStyleSheet(STATUS_QSS)
+        
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(12)
@@ -52,7 +125,8 @@ class TradeSniperWidget(QWidget):
         
         # Status
         self.status_label = QLabel("Status: Stopped")
-        self.status_label.setStyleSheet("font-size: 14px; color: #ff6666;")
+        self.status_label.setObjectName("serviceStatus")
+        self.set_state(self.status_label, "error")
         layout.addWidget(self.status_label)
         
         # Requirements
@@ -76,7 +150,7 @@ class TradeSniperWidget(QWidget):
         req_layout.addLayout(deps_row)
         
         self.brave_status = QLabel("Brave: Not Running")
-        self.brave_status.setStyleSheet("color: #ff6666;")
+        self.set_state(self.brave_status, "error")
         req_layout.addWidget(self.brave_status)
         
         # Launch Brave button
@@ -137,21 +211,32 @@ class TradeSniperWidget(QWidget):
         
         # Log Area
         layout.addWidget(QLabel("Service Output:"))
-        self.log_area = QTextEdit()
+        self.log_area = QPlainTextEdit()
         self.log_area.setReadOnly(True)
+        self.log_area.setMaximumBlockCount(1000)
+        self.log_area.setUndoRedoEnabled(False)  # Append-only; no undo history to grow
         layout.addWidget(self.log_area, 1)
     
+    @staticmethod
+    def set_state(label: QLabel, state: str):
+        """Switch a status label's colour ("ok", "warn" or "error")."""
+        if label.property("state") == state:
+            return
+        label.setProperty("state", state)
+        label.style().unpolish(label)
+        label.style().polish(label)
+    
     def check_setup(self):
         """Check if Node.js is available."""
         node_ver, npm_ver = self.service.check_dependencies()
         
         if node_ver:
             self.node_status.setText(f"Node.js: {node_ver} (OK)")
-            self.node_status.setStyleSheet("color: #66ff66;")
+            self.set_state(self.node_status, "ok")
             self.node_ok = True
         else:
             self.node_status.setText("Node.js: NOT FOUND - Please install Node.js")
-            self.node_status.setStyleSheet("color: #ff6666;")
+            self.set_state(self.node_status, "error")
             self.node_ok = False
         
         # Check npm dependencies (this will also call update_start_button_state)
@@ -162,115 +247,205 @@ class TradeSniperWidget(QWidget):
         all_ok = getattr(self, 'node_ok', False) and getattr(self, 'deps_ok', False)
         self.start_btn.setEnabled(all_ok)
     
-    def check_npm_dependencies(self):
-        """Check if npm dependencies are installed."""
+    def get_npm_dependency_state(self) -> str:
+        """
+        Return "installed", "incomplete" or "missing" for the service's node_modules.
+        
+        npm touches node_modules whenever it adds or removes a package, so the
+        puppeteer-core probe is only repeated when the directory mtime changes.
+        """
         node_modules_path = os.path.join(self.service.service_dir, "node_modules")
+        try:
+            mtime = os.stat(node_modules_path).st_mtime
+        except OSError:
+            self._deps_cache = None
+            return "missing"
+        
+        if self._deps_cache and self._deps_cache[0] == mtime:
+            return self._deps_cache[1]
+        
         puppeteer_path = os.path.join(node_modules_path, "puppeteer-core")
+        state = "installed" if os.path.exists(puppeteer_path) else "incomplete"
+        self._deps_cache = (mtime, state)
+        return state
+    
+    def check_npm_dependencies(self):
+        """Check if npm dependencies are installed."""
+        state = self.get_npm_dependency_state()
         
-        if os.path.exists(puppeteer_path):
+        if state == "installed":
             self.deps_status.setText("Dependencies: Installed (OK)")
-            self.deps_status.setStyleSheet("color: #66ff66;")
+            self.set_state(self.deps_status, "ok")
             self.install_deps_btn.hide()
             self.deps_ok = True
-        elif os.path.exists(node_modules_path):
+        elif state == "incomplete":
             # node_modules exists but puppeteer-core might be missing
             self.deps_status.setText("Dependencies: Incomplete")
-            self.deps_status.setStyleSheet("color: #ffaa66;")
+            self.set_state(self.deps_status, "warn")
             self.install_deps_btn.show()
             self.deps_ok = False
         else:
             self.deps_status.setText("Dependencies: NOT INSTALLED")
-            self.deps_status.setStyleSheet("color: #ff6666;")
+            self.set_state(self.deps_status, "error")
             self.install_deps_btn.show()
             self.deps_ok = False
         
         self.update_start_button_state()
     
     def install_dependencies(self):
-        """Install npm dependencies."""
+        """Install npm dependencies in the background."""
+        if self.npm_process is not None:
+            return
+        
         self.install_deps_btn.setEnabled(False)
         self.install_deps_btn.setText("Installing...")
         self.deps_status.setText("Dependencies: Installing...")
-        self.deps_status.setStyleSheet("color: #ffaa66;")
+        self.set_state(self.deps_status, "warn")
         self.log("Installing npm dependencies...")
         self.log(f"Working directory: {self.service.service_dir}")
         
-        # Run npm install using shell=True to access PATH
-        try:
-            result = subprocess.run(
-                "npm install",
-                cwd=self.service.service_dir,
-                capture_output=True,
-                text=True,
-                timeout=120,
-                shell=True  # Use shell to access PATH
-            )
-            
-            if result.returncode == 0:
-                self.log("Dependencies installed successfully!")
-                if result.stdout:
-                    self.log(result.stdout)
-                self.check_npm_dependencies()
-            else:
-                self.log(f"npm install failed:")
-                if result.stderr:
-                    self.log(result.stderr)
-                if result.stdout:
-                    self.log(result.stdout)
-                self.deps_status.setText("Dependencies: INSTALL FAILED")
-                self.deps_status.setStyleSheet("color: #ff6666;")
-        except subprocess.TimeoutExpired:
-            self.log("npm install timed out after 120 seconds")
+        npm_cmd = self.service.resolve_command("npm")
+        if not npm_cmd:
+            self.log("npm not found on PATH - please install Node.js")
+            self.set_state(self.deps_status, "error")
+            self.deps_status.setText("Dependencies: NPM NOT FOUND")
+            self.install_deps_btn.setEnabled(True)
+            self.install_deps_btn.setText("Install")
+            return
+        
+        # Run npm as a QProcess so the UI keeps painting while it works
+        self._install_partial = b""
+        self.npm_process = QProcess(self)
+        self.npm_process.setWorkingDirectory(self.service.service_dir)
+        self.npm_process.setProcessChannelMode(QProcess.ProcessChannelMode.MergedChannels)
+        self.npm_process.readyReadStandardOutput.connect(self._on_install_output)
+        self.npm_process.finished.connect(self._on_install_finished)
+        self.npm_process.errorOccurred.connect(self._on_install_error)
+        self.npm_process.start(npm_cmd, ["install"])
+        
+        process = self.npm_process
+        QTimer.singleShot(NPM_INSTALL_TIMEOUT_MS, lambda: self._on_install_timeout(process))
+    
+    def _on_install_output(self):
+        """Stream npm output into the log as it arrives, one complete line at a time."""
+        lines = (self._install_partial + bytes(self.npm_process.readAllStandardOutput())).split(b"\n")
+        self._install_partial = lines.pop()  # Incomplete trailing line, if any
+        self._log_install_lines(lines)
+    
+    def _log_install_lines(self, lines):
+        """Log decoded npm output lines, skipping blank ones."""
+        for raw in lines:
+            line = raw.decode("utf-8", errors="replace").rstrip("\r")
+            if line.strip():
+                self.log(line)
+    
+    def _on_install_finished(self, exit_code: int, exit_status):
+        """Handle npm install completing (or being killed on timeout)."""
+        if self.npm_process is None:
+            return
+        # Whatever is left, including a last line without a newline
+        self._on_install_output()
+        self._log_install_lines([self._install_partial])
+        self._install_partial = b""
+        
+        timed_out = self.npm_process.property("timed_out")
+        self.npm_process.deleteLater()
+        self.npm_process = None
+        
+        if timed_out:
+            self.log(f"npm install timed out after {NPM_INSTALL_TIMEOUT_MS // 1000} seconds")
             self.deps_status.setText("Dependencies: INSTALL TIMEOUT")
-            self.deps_status.setStyleSheet("color: #ff6666;")
-        except Exception as e:
-            self.log(f"Error installing dependencies: {e}")
-            self.deps_status.setText("Dependencies: ERROR")
-            self.deps_status.setStyleSheet("color: #ff6666;")
+            self.set_state(self.deps_status, "error")
+        elif exit_status == QProcess.ExitStatus.NormalExit and exit_code == 0:
+            self.log("Dependencies installed successfully!")
+            self.check_npm_dependencies()
+        else:
+            self.log(f"npm install failed (exit code {exit_code})")
+            self.deps_status.setText("Dependencies: INSTALL FAILED")
+            self.set_state(self.deps_status, "error")
         
         self.install_deps_btn.setEnabled(True)
         self.install_deps_btn.setText("Install")
     
+    def _on_install_error(self, error):
+        """Handle npm failing to start at all."""
+        if self.npm_process is None or error != QProcess.ProcessError.FailedToStart:
+            return
+        self.log(f"Error installing dependencies: {self.npm_process.errorString()}")
+        self.npm_process.deleteLater()
+        self.npm_process = None
+        self.deps_status.setText("Dependencies: ERROR")
+        self.set_state(self.deps_status, "error")
+        self.install_deps_btn.setEnabled(True)
+        self.install_deps_btn.setText("Install")
+    
+    def _on_install_timeout(self, process: QProcess):
+        """Kill npm install if that same run is still going after the timeout."""
+        if process is self.npm_process and process.state() != QProcess.ProcessState.NotRunning:
+            process.setProperty("timed_out", True)
+            process.kill()
+    
     def check_brave_status(self):
-        """Check if Brave is running with remote debugging on port 9222."""
-        if self.is_brave_debug_running():
+        """Start a background check for Brave's remote debugging port."""
+        if self.brave_probe and self.brave_probe.isRunning():
+            return
+        
+        # A recent success is good enough; only re-probe early while down.
+        # It still counts as a poll that saw no change, so the back-off proceeds.
+        if self.brave_running and time.time() - self._brave_seen_at < BRAVE_STATUS_CACHE_SECS:
+            self._brave_state_held()
+            return
+        
+        self.brave_probe = BraveProbeWorker()
+        self.brave_probe.result_signal.connect(self.on_brave_status)
+        self.brave_probe.start()
+    
+    def on_brave_status(self, running: bool):
+        """Update the Brave status from a probe result."""
+        # Back off once the state has held for a few polls; speed up on change
+        if running == self.brave_running:
+            self._brave_state_held()
+        else:
+            self._brave_stable_ticks = 0
+            self.brave_check_timer.setInterval(BRAVE_POLL_FAST_MS)
+        
+        self.brave_running = running
+        if running:
+            self._brave_seen_at = time.time()
+        
+        if running:
             self.brave_status.setText("Brave: Connected (Debug Mode)")
-            self.brave_status.setStyleSheet("color: #66ff66;")
+            self.set_state(self.brave_status, "ok")
             self.launch_brave_btn.setText("Brave Already Running")
             self.launch_brave_btn.setEnabled(False)
         else:
             self.brave_status.setText("Brave: Not Running")
-            self.brave_status.setStyleSheet("color: #ff6666;")
+            self.set_state(self.brave_status, "error")
             self.launch_brave_btn.setText("1. Launch Brave (Debug Mode)")
             self.launch_brave_btn.setEnabled(True)
             self.launch_brave_btn.setStyleSheet("background-color: #2a5a7a; font-weight: bold; padding: 8px;")
     
-    def is_brave_debug_running(self) -> bool:
-        """Check if something is listening on port 9222 (Brave debug port)."""
-        try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(0.5)
-            result = sock.connect_ex(('127.0.0.1', 9222))
-            sock.close()
-            return result == 0
-        except:
-            return False
+    def _brave_state_held(self):
+        """Count a poll with an unchanged Brave state; slow polling after a few."""
+        self._brave_stable_ticks += 1
+        if self._brave_stable_ticks >= BRAVE_STABLE_TICKS:
+            self.brave_check_timer.setInterval(BRAVE_POLL_SLOW_MS)
+    
+    def find_brave(self):
+        """
+        Return the Brave executable, probing the candidates until one is found.
+        
+        A hit is remembered for the widget's lifetime; a miss is re-probed on
+        the next click in case Brave was installed meanwhile.
+        """
+        if self._brave_exe is None:
+            candidates = [self.trade_config.get("brave_path")] + BRAVE_CANDIDATES
+            self._brave_exe = next((p for p in candidates if p and os.path.exists(p)), None)
+        return self._brave_exe
     
     def launch_brave(self):
         """Launch Brave browser with remote debugging enabled."""
-        # Common Brave paths
-        brave_paths = [
-            r"C:\Program Files\BraveSoftware\Brave-Browser\Application\brave.exe",
-            r"C:\Program Files (x86)\BraveSoftware\Brave-Browser\Application\brave.exe",
-            os.path.expandvars(r"%LOCALAPPDATA%\BraveSoftware\Brave-Browser\Application\brave.exe"),
-        ]
-        
-        brave_exe = None
-        for path in brave_paths:
-            if os.path.exists(path):
-                brave_exe = path
-                break
-        
+        brave_exe = self.find_brave()
         if not brave_exe:
             QMessageBox.warning(
                 self,
@@ -282,25 +457,24 @@ class TradeSniperWidget(QWidget):
             return
         
         # Create profile directory in trade_service folder
-        profile_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 
-                                    "..", "trade_service", "brave-profile")
-        profile_dir = os.path.abspath(profile_dir)
-        os.makedirs(profile_dir, exist_ok=True)
+        os.makedirs(BRAVE_PROFILE_DIR, exist_ok=True)
         
         try:
             # Launch Brave with remote debugging and open trade site
             cmd = [
                 brave_exe,
                 "--remote-debugging-port=9222",
-                f"--user-data-dir={profile_dir}",
+                f"--user-data-dir={BRAVE_PROFILE_DIR}",
                 "https://www.pathofexile.com/trade"
             ]
             
-            # Use subprocess.Popen to launch without blocking
-            subprocess.Popen(cmd, shell=False)
+            # Detached so Brave outlives the app and nothing waits on it
+            started, _ = QProcess.startDetached(cmd[0], cmd[1:])
+            if not started:
+                raise OSError(f"could not start {brave_exe}")
             
             self.brave_status.setText("Brave: Launched (Debug Mode)")
-            self.brave_status.setStyleSheet("color: #66ff66;")
+            self.set_state(self.brave_status, "ok")
             self.log("Brave launched with remote debugging on port 9222")
             self.log("Opening pathofexile.com/trade...")
             self.log("")
@@ -318,10 +492,23 @@ class TradeSniperWidget(QWidget):
             self.log(f"ERROR: Failed to launch Brave: {e}")
     
     def log(self, message: str):
-        self.log_area.append(message)
-        # Auto-scroll to bottom
+        self._log_queue.append(message)
+        if not self._log_timer.isActive():
+            self._log_timer.start(50)
+    
+    def _flush_log(self):
+        """Append all queued lines in a single call."""
+        if not self._log_queue:
+            return
+        
+        # Follow new output only if the user hasn't scrolled up to read
+        # (small slack so a nearly-bottomed scrollbar still counts)
         scrollbar = self.log_area.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        at_bottom = scrollbar.value() >= scrollbar.maximum() - 4
+        self.log_area.appendPlainText("\n".join(self._log_queue))
+        self._log_queue.clear()
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
     
     def on_start_resume_click(self):
         """Handle start/resume button click based on current state."""
@@ -341,7 +528,7 @@ class TradeSniperWidget(QWidget):
         """Handle status changes."""
         if status == "running":
             self.status_label.setText("Status: Running")
-            self.status_label.setStyleSheet("font-size: 14px; color: #66ff66;")
+            self.set_state(self.status_label, "ok")
             self.is_service_running = True
             # Swap to Resume button
             self.start_btn.setText("Resume (Enter)")
@@ -350,7 +537,7 @@ class TradeSniperWidget(QWidget):
             self.stop_btn.setEnabled(True)
         elif status == "stopped":
             self.status_label.setText("Status: Stopped")
-            self.status_label.setStyleSheet("font-size: 14px; color: #ff6666;")
+            self.set_state(self.status_label, "error")
             self.is_service_running = False
             # Swap back to Start button
             self.start_btn.setText("Start Service")
@@ -359,12 +546,27 @@ class TradeSniperWidget(QWidget):
             self.stop_btn.setEnabled(False)
         else:
             self.status_label.setText(f"Status: {status}")
-            self.status_label.setStyleSheet("font-size: 14px; color: #ffaa66;")
+            self.set_state(self.status_label, "warn")
+    
+    def pause_brave_checks(self):
+        """Stop polling Brave while the tool isn't shown."""
+        self.brave_check_timer.stop()
+    
+    def resume_brave_checks(self):
+        """Check Brave now and resume fast polling."""
+        self._brave_stable_ticks = 0
+        self.brave_check_timer.start(BRAVE_POLL_FAST_MS)
+        self.check_brave_status()
     
     def cleanup(self):
         """Clean up resources."""
         if hasattr(self, 'brave_check_timer'):
             self.brave_check_timer.stop()
+        if self.brave_probe:
+            self.brave_probe.wait(1000)
+        if self.npm_process is not None:
+            self.npm_process.kill()
+            self.npm_process.waitForFinished(2000)
         if self.service.is_running:
             self.service.stop()
 
@@ -393,10 +595,12 @@ class TradeSniperTool(BaseTool):
         return self.widget
     
     def on_activated(self):
-        pass
+        if self.widget:
+            self.widget.resume_brave_checks()
     
     def on_deactivated(self):
-        pass
+        if self.widget:
+            self.widget.pause_brave_checks()
     
     def cleanup(self):
         if self.widget:
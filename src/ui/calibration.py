@@ -63,6 +63,38 @@ CALIBRATION_CONFIGS = {
 }
 
 
+def _stash_grid_fields(left: int, top: int, width: int, height: int) -> dict:
+    """Cell size for a 12x12 stash, or 24x24 when that cell size is implausible (quad)."""
+    cell_size_12 = width / 12
+    is_quad = cell_size_12 > 80 or cell_size_12 < 30
+    cell_size = width / 24 if is_quad else cell_size_12
+    return {
+        'cell_size': int(cell_size),
+        'is_quad_calibrated': is_quad,
+        'x_offset': left,
+        'y_offset': top,
+    }
+
+
+def _unique_category_grid_fields(left: int, top: int, width: int, height: int) -> dict:
+    """Unique tab has 2 rows of ~12 category icons."""
+    cols = 12
+    rows = 2
+    return {
+        'cell_width': width // cols,
+        'cell_height': height // rows,
+        'cols': cols,
+        'rows': rows,
+    }
+
+
+# Extra result fields per calibration type, from (left, top, width, height)
+_CALC_BY_TYPE: Dict[CalibrationType, Callable[[int, int, int, int], dict]] = {
+    CalibrationType.STASH_GRID: _stash_grid_fields,
+    CalibrationType.UNIQUE_CATEGORY_GRID: _unique_category_grid_fields,
+}
+
+
 class CalibrationManager:
     """
     Manages calibration workflows for different screen regions.
@@ -187,36 +219,10 @@ class CalibrationManager:
             'y2': bottom,
         }
         
-        # Special handling for stash grid - calculate cell size
-        if self.active_type == CalibrationType.STASH_GRID:
-            # Standard stash is 12x12, quad is 24x24
-            # Detect based on aspect ratio and size
-            cell_size_12 = width / 12
-            cell_size_24 = width / 24
-            
-            # If cell size for 12x12 is reasonable (40-80 pixels), use standard
-            # Otherwise assume quad
-            is_quad = cell_size_12 > 80 or cell_size_12 < 30
-            
-            if is_quad:
-                cell_size = cell_size_24
-            else:
-                cell_size = cell_size_12
-            
-            result['cell_size'] = int(cell_size)
-            result['is_quad_calibrated'] = is_quad
-            result['x_offset'] = left
-            result['y_offset'] = top
-        
-        # Special handling for unique category grid
-        elif self.active_type == CalibrationType.UNIQUE_CATEGORY_GRID:
-            # Unique tab has 2 rows of ~12 category icons
-            cols = 12
-            rows = 2
-            result['cell_width'] = width // cols
-            result['cell_height'] = height // rows
-            result['cols'] = cols
-            result['rows'] = rows
+        # Type-specific fields (cell sizes etc.)
+        extra = _CALC_BY_TYPE.get(self.active_type)
+        if extra:
+            result.update(extra(left, top, width, height))
         
         return result
     
@@ -267,14 +273,23 @@ class CalibrationManager:
     def is_calibrated(self, cal_type: CalibrationType) -> bool:
         """Check if a calibration type has been completed."""
         return self.get_calibration(cal_type) is not None
+    
+    def snapshot_statuses(self) -> Dict[CalibrationType, bool]:
+        """is_calibrated for every type, reading the config sections once."""
+        overlay = self.config.get('overlay', {})
+        calibration = self.config.get('calibration', {})
+        return {
+            cal_type: ('x_offset' in overlay if cal_type == CalibrationType.STASH_GRID
+                       else calibration.get(info.config_key) is not None)
+            for cal_type, info in CALIBRATION_CONFIGS.items()
+        }
 
 
 def get_calibration_status_text(manager: CalibrationManager) -> str:
     """Generate a status string showing calibration state."""
-    lines = []
-    for cal_type in CalibrationType:
-        config = CALIBRATION_CONFIGS[cal_type]
-        status = "Done" if manager.is_calibrated(cal_type) else "Not set"
-        lines.append(f"  {config.name}: {status}")
-    return "\n".join(lines)
+    statuses = manager.snapshot_statuses()
+    return "\n".join(
+        f"  {CALIBRATION_CONFIGS[cal_type].name}: {'Done' if statuses[cal_type] else 'Not set'}"
+        for cal_type in CalibrationType
+    )
 
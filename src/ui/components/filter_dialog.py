@@ -2,14 +2,403 @@
 Filter configuration dialog for Ultimatum tool.
 """
 
+import sys
+
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
-                             QListWidget, QListWidgetItem, QPushButton, QTabWidget, QWidget,
-                             QCheckBox, QAbstractItemView)
-from PyQt6.QtCore import Qt
+                             QPushButton, QTabWidget, QWidget, QAbstractItemView, QListView,
+                             QTableView, QHeaderView, QStyledItemDelegate,
+                             QStyle, QStyleOptionButton, QApplication)
+from PyQt6.QtCore import (Qt, QAbstractListModel, QAbstractTableModel, QModelIndex, QEvent,
+                          QRect, QSize)
+from PyQt6.QtGui import QColor, QFont, QPalette
+
+# Custom roles served by FilterRowModel
+PROFIT_ROLE = Qt.ItemDataRole.UserRole + 1   # float, or None without prices
+EXCLUDE_ROLE = Qt.ItemDataRole.UserRole + 2  # bool
+INCLUDE_ROLE = Qt.ItemDataRole.UserRole + 3  # bool
+
+
+# poe.ninja categories listed on the Currency tab
+CURRENCY_CATEGORIES = frozenset({'Currency', 'Fragment', 'Invitation'})
+
+
+def _intern(name):
+    """sys.intern for names, passing through None (rewards that failed to parse)."""
+    return sys.intern(name) if isinstance(name, str) else name
+
+
+def _normalize_reward(reward):
+    """
+    Reward entry as (reward_name, reward_count, sacrifice_name, sacrifice_count).
+    Older scans stored (name, count) pairs or bare names. Names are interned,
+    so set lookups against the (also interned) filter sets hit on identity.
+    """
+    if isinstance(reward, tuple):
+        if len(reward) == 4:
+            return (_intern(reward[0]), reward[1], _intern(reward[2]), reward[3])
+        if len(reward) == 2:
+            return (_intern(reward[0]), reward[1], None, 0)
+        return (_intern(reward[0]) if reward else 'Unknown', 1, None, 0)
+    return (_intern(reward), 1, None, 0)
+
+
+def _reward_sort_key(row):
+    """Name then count; the sacrifice breaks ties so diffs see one fixed order."""
+    return (row[0], row[1], row[2] or '', row[3])
+
+
+def _removed_runs(old, keep):
+    """(first, last) index runs of old entries not in keep, last run first."""
+    last = None
+    for i in range(len(old) - 1, -1, -1):
+        if old[i] in keep:
+            if last is not None:
+                yield i + 1, last
+                last = None
+        elif last is None:
+            last = i
+    if last is not None:
+        yield 0, last
+
+
+def _added_runs(new, have):
+    """(first, last) index runs of new entries not in have, in order."""
+    first = None
+    for i, entry in enumerate(new):
+        if entry in have:
+            if first is not None:
+                yield first, i - 1
+                first = None
+        elif first is None:
+            first = i
+    if first is not None:
+        yield first, len(new) - 1
+
+
+class TwoStateCheckModel(QAbstractTableModel):
+    """
+    Text rows with Exclude/Include check columns, for the tabs without prices.
+    
+    Like on the reward tabs, the dialog's sets are the state: checking one
+    column clears the other.
+    """
+    
+    HEADERS = ("", "Exclude", "Include")
+    
+    def __init__(self, items, excluded_set, included_set, parent=None):
+        super().__init__(parent)
+        self.items = list(items)
+        self.excluded_set = excluded_set
+        self.included_set = included_set
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.items)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 3
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+    
+    def flags(self, index):
+        if index.column() == 0:
+            return Qt.ItemFlag.ItemIsEnabled
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsUserCheckable
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        text = self.items[index.row()]
+        column = index.column()
+        
+        if column == 0:
+            return str(text) if role == Qt.ItemDataRole.DisplayRole else None
+        if role == Qt.ItemDataRole.CheckStateRole:
+            checked = text in (self.excluded_set if column == 1 else self.included_set)
+            return Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked
+        return None
+    
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or index.column() == 0 or role != Qt.ItemDataRole.CheckStateRole:
+            return False
+        
+        text = self.items[index.row()]
+        own, other = ((self.excluded_set, self.included_set) if index.column() == 1
+                      else (self.included_set, self.excluded_set))
+        if Qt.CheckState(value) == Qt.CheckState.Checked:
+            own.add(text)
+            other.discard(text)
+        else:
+            own.discard(text)
+        
+        self.dataChanged.emit(self.index(index.row(), 1), self.index(index.row(), 2),
+                              [Qt.ItemDataRole.CheckStateRole])
+        return True
+    
+    def set_items(self, items):
+        """Move to a new sorted item list, inserting/removing only what differs."""
+        keep = set(items)
+        for first, last in _removed_runs(self.items, keep):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self.items[first:last + 1]
+            self.endRemoveRows()
+        
+        have = set(self.items)
+        for first, last in _added_runs(items, have):
+            self.beginInsertRows(QModelIndex(), first, last)
+            self.items[first:first] = items[first:last + 1]
+            self.endInsertRows()
+    
+    def refresh_checks(self):
+        """Repaint check states after the sets were changed from outside."""
+        if self.items:
+            self.dataChanged.emit(self.index(0, 1), self.index(len(self.items) - 1, 2),
+                                  [Qt.ItemDataRole.CheckStateRole])
+
+
+class FilterRowModel(QAbstractListModel):
+    """
+    Reward rows (name, count, sacrifice, sacrifice count) with exclude/include state.
+    
+    Check state is read from and written to the dialog's reward sets, so
+    rows sharing a reward name (different counts) always agree. Rows are
+    handed to the view BATCH_SIZE at a time as it scrolls (fetchMore), and
+    a row's profit is only worked out once it is shown. set_rows applies a
+    new scan's rows as inserts/removals, so a reopened dialog keeps its view.
+    """
+    
+    BATCH_SIZE = 50
+    
+    def __init__(self, rows, excluded_set, included_set, price_map=None, parent=None):
+        super().__init__(parent)
+        self.rows = list(rows)
+        self.excluded_set = excluded_set
+        self.included_set = included_set
+        self.price_map = price_map
+        self._loaded = min(self.BATCH_SIZE, len(rows))
+        # Keyed by row tuple, so they survive rows shifting in set_rows
+        self._profit_cache = {}
+        self._display_cache = {}
+    
+    @staticmethod
+    def _profit(row, price_map):
+        """Reward value minus sacrifice value, or None without prices."""
+        if price_map is None:
+            return None
+        reward_name, reward_count, sacrifice_name, sacrifice_count = row
+        reward_total = price_map.get(reward_name, 0.0) * reward_count
+        sacrifice_total = price_map.get(sacrifice_name, 0.0) * sacrifice_count if sacrifice_name else 0
+        return reward_total - sacrifice_total
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+    
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loaded < len(self.rows)
+    
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        end = min(self._loaded + self.BATCH_SIZE, len(self.rows))
+        self.beginInsertRows(QModelIndex(), self._loaded, end - 1)
+        self._loaded = end
+        self.endInsertRows()
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self.rows[index.row()]
+        reward_name = row[0]
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            # Built once per row; the view asks again on every repaint
+            text = self._display_cache.get(row)
+            if text is None:
+                reward_count = row[1]
+                # Display: "Item Name x10" format
+                text = f"{reward_name} x{reward_count}" if reward_count > 1 else reward_name
+                self._display_cache[row] = text
+            return text
+        if role == PROFIT_ROLE:
+            if row not in self._profit_cache:
+                self._profit_cache[row] = self._profit(row, self.price_map)
+            return self._profit_cache[row]
+        if role == EXCLUDE_ROLE:
+            return reward_name in self.excluded_set
+        if role == INCLUDE_ROLE:
+            return reward_name in self.included_set
+        return None
+    
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        """Toggle exclude/include by reward NAME; the two are mutually exclusive."""
+        if not index.isValid() or role not in (EXCLUDE_ROLE, INCLUDE_ROLE):
+            return False
+        
+        name = self.rows[index.row()][0]
+        own, other = ((self.excluded_set, self.included_set) if role == EXCLUDE_ROLE
+                      else (self.included_set, self.excluded_set))
+        if value:
+            own.add(name)
+            other.discard(name)
+        else:
+            own.discard(name)
+        
+        # Other rows with the same name changed too
+        self.refresh_checks()
+        return True
+    
+    def refresh_checks(self):
+        """Repaint check states of the loaded rows after the sets changed."""
+        if self._loaded:
+            self.dataChanged.emit(self.index(0), self.index(self._loaded - 1),
+                                  [EXCLUDE_ROLE, INCLUDE_ROLE])
+    
+    def set_price_map(self, price_map):
+        """Swap in fresh prices; profits are recomputed as rows are shown."""
+        self.price_map = price_map
+        self._profit_cache.clear()
+        if self._loaded:
+            self.dataChanged.emit(self.index(0), self.index(self._loaded - 1), [PROFIT_ROLE])
+    
+    def set_rows(self, rows):
+        """
+        Move to a new sorted row list, inserting/removing only what differs.
+        
+        Only changes inside the loaded range are announced to the view; rows
+        past it are still handed out by fetchMore.
+        """
+        keep = set(rows)
+        for first, last in _removed_runs(self.rows, keep):
+            if first < self._loaded:
+                shown_last = min(last, self._loaded - 1)
+                self.beginRemoveRows(QModelIndex(), first, shown_last)
+                del self.rows[first:last + 1]
+                self._loaded -= shown_last - first + 1
+                self.endRemoveRows()
+            else:
+                del self.rows[first:last + 1]
+        
+        have = set(self.rows)
+        for first, last in _added_runs(rows, have):
+            if first < self._loaded:
+                self.beginInsertRows(QModelIndex(), first, last)
+                self.rows[first:first] = rows[first:last + 1]
+                self._loaded += last - first + 1
+                self.endInsertRows()
+            else:
+                self.rows[first:first] = rows[first:last + 1]
+        
+        # Drop entries for rows that are gone so the caches track the scan
+        for cache in (self._display_cache, self._profit_cache):
+            for row in cache.keys() - keep:
+                del cache[row]
+
+
+class FilterRowDelegate(QStyledItemDelegate):
+    """
+    Paints a reward row (label, profit, Exclude/Include checkboxes) directly.
+    
+    No widgets are created per row; clicks on the painted checkboxes are
+    handled in editorEvent.
+    """
+    
+    ROW_HEIGHT = 28
+    CHECK_WIDTH = 80
+    PROFIT_WIDTH = 80
+    
+    PROFIT_COLOR = QColor("#4CAF50")  # Green
+    LOSS_COLOR = QColor("#F44336")    # Red
+    
+    def __init__(self, color_code_profit=False, parent=None):
+        super().__init__(parent)
+        self.color_code_profit = color_code_profit
+        self._profit_texts = {}  # profit -> formatted text; many rows share a value
+        self._bold_font = None   # Built from the view's font on first paint
+    
+    def _profit_text(self, profit: float) -> str:
+        text = self._profit_texts.get(profit)
+        if text is None:
+            signed = self.color_code_profit and profit >= 0
+            text = self._profit_texts[profit] = f"+{profit:.1f}c" if signed else f"{profit:.1f}c"
+        return text
+    
+    def _rects(self, rect: QRect):
+        """Label, profit, exclude and include areas of a row, right to left."""
+        include = QRect(rect.right() - self.CHECK_WIDTH + 1, rect.top(), self.CHECK_WIDTH, rect.height())
+        exclude = include.translated(-self.CHECK_WIDTH, 0)
+        profit = exclude.translated(-self.PROFIT_WIDTH, 0)
+        label = QRect(rect.left() + 4, rect.top(), profit.left() - rect.left() - 8, rect.height())
+        return label, profit, exclude, include
+    
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.ROW_HEIGHT)
+    
+    def paint(self, painter, option, index):
+        label_rect, profit_rect, exclude_rect, include_rect = self._rects(option.rect)
+        widget = option.widget
+        style = widget.style() if widget else QApplication.style()
+        
+        painter.save()
+        
+        text = index.data(Qt.ItemDataRole.DisplayRole)
+        painter.setPen(option.palette.color(QPalette.ColorRole.Text))
+        painter.drawText(label_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                         option.fontMetrics.elidedText(text, Qt.TextElideMode.ElideRight, label_rect.width()))
+        
+        profit = index.data(PROFIT_ROLE)
+        if profit is not None:
+            if self._bold_font is None:
+                self._bold_font = QFont(option.font)
+                self._bold_font.setBold(True)
+            painter.setFont(self._bold_font)
+            if self.color_code_profit:
+                # Color code: green for profit, red for loss
+                painter.setPen(self.PROFIT_COLOR if profit >= 0 else self.LOSS_COLOR)
+            painter.drawText(profit_rect.adjusted(0, 0, -6, 0),
+                             Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+                             self._profit_text(profit))
+        
+        painter.restore()
+        
+        for rect, caption, role in ((exclude_rect, "Exclude", EXCLUDE_ROLE),
+                                    (include_rect, "Include", INCLUDE_ROLE)):
+            opt = QStyleOptionButton()
+            opt.rect = rect
+            opt.text = caption
+            opt.palette = option.palette
+            opt.fontMetrics = option.fontMetrics
+            opt.state = QStyle.StateFlag.State_Enabled | (
+                QStyle.StateFlag.State_On if index.data(role) else QStyle.StateFlag.State_Off)
+            style.drawControl(QStyle.ControlElement.CE_CheckBox, opt, painter, widget)
+    
+    def editorEvent(self, event, model, option, index):
+        if event.type() not in (QEvent.Type.MouseButtonPress, QEvent.Type.MouseButtonRelease,
+                                QEvent.Type.MouseButtonDblClick):
+            return False
+        if event.button() != Qt.MouseButton.LeftButton:
+            return False
+        
+        _, _, exclude_rect, include_rect = self._rects(option.rect)
+        pos = event.position().toPoint()
+        for rect, role in ((exclude_rect, EXCLUDE_ROLE), (include_rect, INCLUDE_ROLE)):
+            if rect.contains(pos):
+                # Toggle on release only, but swallow press/double-click too
+                if event.type() == QEvent.Type.MouseButtonRelease:
+                    model.setData(index, not index.data(role), role)
+                return True
+        return False
 
 
 class FilterConfigDialog(QDialog):
-    """Dialog for configuring item filters."""
+    """
+    Dialog for configuring item filters.
+    
+    The Ultimatum tool keeps one instance alive; each open calls load_config
+    and update_found_data, which patch the existing tabs rather than
+    building them again.
+    """
     
     def __init__(self, parent=None, found_data=None, current_config=None, price_fetcher=None):
         super().__init__(parent)
@@ -18,70 +407,31 @@ class FilterConfigDialog(QDialog):
         
         # found_data: { 'types': set(), 'rewards': set((name, count, sac_name, sac_count)), 'tiers': set() }
         self.found_data = found_data or {}
-        self.config = current_config or {}
         self.price_fetcher = price_fetcher
         
-        self.excluded_types = set(self.config.get("excluded_types", []))
-        self.included_types = set(self.config.get("included_types", []))
-        
-        self.excluded_rewards = set(self.config.get("excluded_rewards", []))
-        self.included_rewards = set(self.config.get("included_rewards", []))
-        
-        self.excluded_tiers = set(str(x) for x in self.config.get("excluded_tiers", []))
-        self.included_tiers = set(str(x) for x in self.config.get("included_tiers", []))
+        # Created once; load_config refills them in place since the models hold them
+        self.excluded_types = set()
+        self.included_types = set()
+        self.excluded_rewards = set()
+        self.included_rewards = set()
+        self.excluded_tiers = set()
+        self.included_tiers = set()
+        self.load_config(current_config or {})
 
         layout = QVBoxLayout(self)
         
         self.tabs = QTabWidget()
         
-        # Get categories from price fetcher
-        categories = {}
-        if price_fetcher:
-            categories = price_fetcher.categories
+        types, currency_list, div_list, unique_list, tiers, price_map = self._sorted_found_data()
         
         # 1. Encounter Types
         self.type_tab = self.create_list_tab(
             "Encounter Types", 
-            sorted(list(self.found_data.get('types', []))),
+            types,
             self.excluded_types,
             self.included_types
         )
         self.tabs.addTab(self.type_tab, "Encounter Types")
-        
-        # Categorize Rewards - rewards are tuples of (reward_name, reward_count, sacrifice_name, sacrifice_count)
-        currency_list = []
-        div_list = []
-        unique_list = []
-        
-        all_rewards = self.found_data.get('rewards', set())
-        
-        for reward_tuple in all_rewards:
-            # Handle different tuple formats for backwards compatibility
-            if isinstance(reward_tuple, tuple):
-                if len(reward_tuple) == 4:
-                    reward_name, reward_count, sacrifice_name, sacrifice_count = reward_tuple
-                elif len(reward_tuple) == 2:
-                    reward_name, reward_count = reward_tuple
-                    sacrifice_name, sacrifice_count = None, 0
-                else:
-                    reward_name = reward_tuple[0] if reward_tuple else 'Unknown'
-                    reward_count, sacrifice_name, sacrifice_count = 1, None, 0
-            else:
-                reward_name = reward_tuple
-                reward_count, sacrifice_name, sacrifice_count = 1, None, 0
-            
-            cat = categories.get(reward_name, '')
-            if cat in ['Currency', 'Fragment', 'Invitation']:
-                currency_list.append((reward_name, reward_count, sacrifice_name, sacrifice_count))
-            elif cat == 'DivinationCard':
-                div_list.append((reward_name, reward_count, sacrifice_name, sacrifice_count))
-            else:
-                unique_list.append((reward_name, reward_count, sacrifice_name, sacrifice_count))
-        
-        # Sort by name then by count
-        currency_list.sort(key=lambda x: (x[0], x[1]))
-        div_list.sort(key=lambda x: (x[0], x[1]))
-        unique_list.sort(key=lambda x: (x[0], x[1]))
 
         # 2. Currency Tab - show with quantities and profit
         self.curr_tab = self.create_reward_list_tab(
@@ -89,7 +439,7 @@ class FilterConfigDialog(QDialog):
             currency_list,
             self.excluded_rewards,
             self.included_rewards,
-            self.price_fetcher
+            price_map
         )
         self.tabs.addTab(self.curr_tab, "Currency")
 
@@ -99,7 +449,7 @@ class FilterConfigDialog(QDialog):
             div_list,
             self.excluded_rewards,
             self.included_rewards,
-            self.price_fetcher
+            price_map
         )
         self.tabs.addTab(self.div_tab, "Div Cards")
 
@@ -109,19 +459,15 @@ class FilterConfigDialog(QDialog):
             unique_list,
             self.excluded_rewards,
             self.included_rewards,
-            self.price_fetcher,
+            price_map,
             color_code_profit=True
         )
         self.tabs.addTab(self.unique_tab, "Uniques")
         
         # 5. Monster Life
-        tiers = sorted(list(self.found_data.get('tiers', [])), 
-                      key=lambda x: int(x) if isinstance(x, int) else (int(x) if str(x).isdigit() else 0))
-        tier_strs = [str(t) for t in tiers]
-        
         self.life_tab = self.create_list_tab(
             "Monster Life %",
-            tier_strs,
+            tiers,
             self.excluded_tiers,
             self.included_tiers
         )
@@ -141,6 +487,97 @@ class FilterConfigDialog(QDialog):
         
         layout.addLayout(btn_layout)
 
+    def _sorted_found_data(self):
+        """
+        Tab contents for self.found_data: sorted types, the three reward
+        lists, sorted tiers, and the price map for the reward tabs.
+        """
+        # Get categories from price fetcher
+        categories = {}
+        if self.price_fetcher:
+            categories = self.price_fetcher.categories
+        
+        types = sorted(self.found_data.get('types', []))
+        
+        # Categorize Rewards - rewards are tuples of (reward_name, reward_count, sacrifice_name, sacrifice_count)
+        currency_list = []
+        div_list = []
+        unique_list = []
+        
+        # One category lookup per reward, dispatched straight to its list
+        append_by_cat = {cat: currency_list.append for cat in CURRENCY_CATEGORIES}
+        append_by_cat['DivinationCard'] = div_list.append
+        get_cat = categories.get
+        unique_append = unique_list.append
+        
+        # found_data['rewards'] is a set, but legacy shapes can normalise to the same entry
+        rewards = dict.fromkeys(map(_normalize_reward, self.found_data.get('rewards', set())))
+        for reward in rewards:
+            append_by_cat.get(get_cat(reward[0], ''), unique_append)(reward)
+        
+        # Sort by name then by count
+        currency_list.sort(key=_reward_sort_key)
+        div_list.sort(key=_reward_sort_key)
+        unique_list.sort(key=_reward_sort_key)
+        
+        # Every reward and sacrifice price the three reward tabs need, in one call
+        price_map = None
+        if self.price_fetcher:
+            names = set()
+            for reward_name, _, sacrifice_name, _ in currency_list + div_list + unique_list:
+                names.add(reward_name)
+                if sacrifice_name:
+                    names.add(sacrifice_name)
+            price_map = self.price_fetcher.get_prices(names)
+        
+        tiers = sorted({int(t) for t in self.found_data.get('tiers', []) if str(t).isdigit()})
+        return types, currency_list, div_list, unique_list, tiers, price_map
+
+    def load_config(self, config):
+        """Reset the check states to a saved config, e.g. after a cancelled edit."""
+        self.config = config
+        
+        self.excluded_types.clear()
+        self.excluded_types.update(config.get("excluded_types", []))
+        self.included_types.clear()
+        self.included_types.update(config.get("included_types", []))
+        
+        self.excluded_rewards.clear()
+        self.excluded_rewards.update(map(_intern, config.get("excluded_rewards", [])))
+        self.included_rewards.clear()
+        self.included_rewards.update(map(_intern, config.get("included_rewards", [])))
+        
+        # Tiers stay ints end to end; the table model only str()s them for display
+        self.excluded_tiers.clear()
+        self.excluded_tiers.update(int(x) for x in config.get("excluded_tiers", []) if str(x).isdigit())
+        self.included_tiers.clear()
+        self.included_tiers.update(int(x) for x in config.get("included_tiers", []) if str(x).isdigit())
+        
+        for tab in ("type_tab", "curr_tab", "div_tab", "unique_tab", "life_tab"):
+            if hasattr(self, tab):
+                getattr(self, tab).model.refresh_checks()
+
+    def update_found_data(self, found_data, price_fetcher=None):
+        """
+        Bring the tabs up to date with a new scan's found_data.
+        
+        Each model gets only the rows that appeared or disappeared, so
+        reopening after a rescan costs the size of the change, not the
+        size of the data.
+        """
+        self.found_data = found_data or {}
+        if price_fetcher is not None:
+            self.price_fetcher = price_fetcher
+        
+        types, currency_list, div_list, unique_list, tiers, price_map = self._sorted_found_data()
+        
+        self.type_tab.model.set_items(types)
+        self.life_tab.model.set_items(tiers)
+        for tab, rows in ((self.curr_tab, currency_list), (self.div_tab, div_list),
+                          (self.unique_tab, unique_list)):
+            tab.model.set_rows(rows)
+            tab.model.set_price_map(price_map)
+
     def create_list_tab(self, label, items, excluded_set, included_set):
         """Create a simple list tab for encounter types and monster life (no prices)."""
         widget = QWidget()
@@ -148,42 +585,22 @@ class FilterConfigDialog(QDialog):
         
         layout.addWidget(QLabel(f"Available {label}:"))
         
-        list_widget = QListWidget()
-        list_widget.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
-        
-        for item_text in items:
-            item = QListWidgetItem(list_widget)
-            
-            row_widget = QWidget()
-            row_layout = QHBoxLayout(row_widget)
-            row_layout.setContentsMargins(2, 2, 2, 2)
-            
-            chk_exclude = QCheckBox("Exclude")
-            chk_exclude.setChecked(item_text in excluded_set)
-            
-            chk_include = QCheckBox("Include")
-            chk_include.setChecked(item_text in included_set)
-            
-            chk_exclude.toggled.connect(
-                lambda c, t=item_text, o=chk_include: self.on_check(t, c, o, "exclude", label))
-            chk_include.toggled.connect(
-                lambda c, t=item_text, o=chk_exclude: self.on_check(t, c, o, "include", label))
-            
-            lbl = QLabel(str(item_text))
-            lbl.setWordWrap(True)
-            row_layout.addWidget(lbl, stretch=1) 
-            
-            row_layout.addWidget(chk_exclude)
-            row_layout.addWidget(chk_include)
-            
-            item.setSizeHint(row_widget.sizeHint())
-            list_widget.setItemWidget(item, row_widget)
-            
-        layout.addWidget(list_widget)
+        view = QTableView()
+        widget.model = TwoStateCheckModel(items, excluded_set, included_set, view)
+        view.setModel(widget.model)
+        view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        view.setShowGrid(False)
+        view.verticalHeader().setVisible(False)
+        header = view.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
+        
+        layout.addWidget(view)
         return widget
 
     def create_reward_list_tab(self, label, reward_tuples, excluded_set, included_set, 
-                                price_source=None, color_code_profit=False):
+                                price_map=None, color_code_profit=False):
         """
         Create a reward list tab that shows rewards with quantities and PROFIT values.
         reward_tuples: list of (reward_name, reward_count, sacrifice_name, sacrifice_count) tuples
@@ -195,110 +612,26 @@ class FilterConfigDialog(QDialog):
         
         layout.addWidget(QLabel(f"Available {label}:"))
         
-        list_widget = QListWidget()
-        list_widget.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
-        
-        for reward_name, reward_count, sacrifice_name, sacrifice_count in reward_tuples:
-            item = QListWidgetItem(list_widget)
-            
-            row_widget = QWidget()
-            row_layout = QHBoxLayout(row_widget)
-            row_layout.setContentsMargins(2, 2, 2, 2)
-            
-            # Checkboxes filter by NAME only
-            chk_exclude = QCheckBox("Exclude")
-            chk_exclude.setChecked(reward_name in excluded_set)
-            
-            chk_include = QCheckBox("Include")
-            chk_include.setChecked(reward_name in included_set)
-            
-            chk_exclude.toggled.connect(
-                lambda c, t=reward_name, o=chk_include: self.on_check(t, c, o, "exclude", label))
-            chk_include.toggled.connect(
-                lambda c, t=reward_name, o=chk_exclude: self.on_check(t, c, o, "include", label))
-            
-            # Display: "Item Name x10" format
-            if reward_count > 1:
-                display_text = f"{reward_name} x{reward_count}"
-            else:
-                display_text = reward_name
-            
-            lbl = QLabel(display_text)
-            lbl.setWordWrap(True)
-            row_layout.addWidget(lbl, stretch=1) 
-            
-            # Profit Label - show PROFIT (reward_value - sacrifice_value)
-            if price_source:
-                reward_unit_price = price_source.get_price(reward_name)
-                reward_total = reward_unit_price * reward_count
-                
-                sacrifice_unit_price = price_source.get_price(sacrifice_name) if sacrifice_name else 0
-                sacrifice_total = sacrifice_unit_price * sacrifice_count
-                
-                profit = reward_total - sacrifice_total
-                
-                if color_code_profit:
-                    # Color code: green for profit, red for loss
-                    if profit >= 0:
-                        color = "#4CAF50"  # Green
-                        profit_text = f"+{profit:.1f}c"
-                    else:
-                        color = "#F44336"  # Red
-                        profit_text = f"{profit:.1f}c"
-                    style = f"font-weight: bold; color: {color};"
-                else:
-                    profit_text = f"{profit:.1f}c"
-                    style = "font-weight: bold;"
-                
-                price_lbl = QLabel(profit_text)
-                price_lbl.setFixedWidth(80)
-                price_lbl.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-                price_lbl.setStyleSheet(style)
-                row_layout.addWidget(price_lbl)
-            
-            row_layout.addWidget(chk_exclude)
-            row_layout.addWidget(chk_include)
-            
-            item.setSizeHint(row_widget.sizeHint())
-            list_widget.setItemWidget(item, row_widget)
-            
-        layout.addWidget(list_widget)
+        view = QListView()
+        view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        # Fixed-height rows laid out in batches; the model also loads lazily
+        view.setUniformItemSizes(True)
+        view.setLayoutMode(QListView.LayoutMode.Batched)
+        view.setBatchSize(FilterRowModel.BATCH_SIZE)
+        view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        widget.model = FilterRowModel(reward_tuples, excluded_set, included_set, price_map, view)
+        view.setModel(widget.model)
+        view.setItemDelegate(FilterRowDelegate(color_code_profit, view))
+        
+        layout.addWidget(view)
         return widget
 
-    def on_check(self, text, checked, other_checkbox, mode, category):
-        if checked:
-            other_checkbox.setChecked(False)
-            
-        if category == "Encounter Types":
-            ex_set = self.excluded_types
-            in_set = self.included_types
-        elif category in ["Currency", "Div Cards", "Uniques"]:
-            # All reward tabs share the same sets
-            ex_set = self.excluded_rewards
-            in_set = self.included_rewards
-        else:  # Monster Life %
-            ex_set = self.excluded_tiers
-            in_set = self.included_tiers
-            
-        if mode == "exclude":
-            if checked:
-                ex_set.add(text)
-                in_set.discard(text)
-            else:
-                ex_set.discard(text)
-        else:  # include
-            if checked:
-                in_set.add(text)
-                ex_set.discard(text)
-            else:
-                in_set.discard(text)
-
     def get_config_updates(self):
         return {
             "excluded_types": list(self.excluded_types),
             "included_types": list(self.included_types),
             "excluded_rewards": list(self.excluded_rewards),
             "included_rewards": list(self.included_rewards),
-            "excluded_tiers": [int(x) for x in self.excluded_tiers if str(x).isdigit()],
-            "included_tiers": [int(x) for x in self.included_tiers if str(x).isdigit()]
+            "excluded_tiers": list(self.excluded_tiers),
+            "included_tiers": list(self.included_tiers)
         }
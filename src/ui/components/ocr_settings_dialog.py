@@ -3,7 +3,10 @@ from PyQt6.QtWidgets import (
     QSlider, QDoubleSpinBox, QComboBox, QCheckBox, 
     QDialogButtonBox, QWidget, QGroupBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+
+# Changes within this window are coalesced into one settings_changed emit
+EMIT_DEBOUNCE_MS = 50
 
 class OCRSettingsDialog(QDialog):
     """Dialog for tuning OCR settings in real-time."""
@@ -16,6 +19,12 @@ class OCRSettingsDialog(QDialog):
         self.setMinimumWidth(400)
         self.settings = current_settings.copy()
         
+        # Each emit re-runs OCR, so a slider drag only emits once it pauses
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(EMIT_DEBOUNCE_MS)
+        self._emit_timer.timeout.connect(self._emit_now)
+        
         layout = QVBoxLayout(self)
         
         # --- Preprocessing Group ---
@@ -29,7 +38,7 @@ class OCRSettingsDialog(QDialog):
         self.scale_spin.setRange(1.0, 5.0)
         self.scale_spin.setSingleStep(0.5)
         self.scale_spin.setValue(self.settings.get('scale_factor', 3.0))
-        self.scale_spin.valueChanged.connect(self._on_change)
+        self.scale_spin.valueChanged.connect(lambda v: self._on_change(scale_factor=v))
         scale_layout.addWidget(self.scale_spin)
         prep_layout.addLayout(scale_layout)
         
@@ -51,7 +60,7 @@ class OCRSettingsDialog(QDialog):
         # Invert
         self.invert_check = QCheckBox("Invert Image (Light text on Dark bg)")
         self.invert_check.setChecked(self.settings.get('invert', True))
-        self.invert_check.stateChanged.connect(self._on_change)
+        self.invert_check.toggled.connect(lambda on: self._on_change(invert=on))
         prep_layout.addWidget(self.invert_check)
         
         prep_group.setLayout(prep_layout)
@@ -74,14 +83,17 @@ class OCRSettingsDialog(QDialog):
             "11 - Sparse text": 11,
             "13 - Raw line": 13
         }
-        for name, val in self.psm_map.items():
-            self.psm_combo.addItem(name, val)
+        # One batched insert, then attach each mode number as item data
+        self.psm_combo.addItems(list(self.psm_map))
+        for i, val in enumerate(self.psm_map.values()):
+            self.psm_combo.setItemData(i, val)
             
         current_psm = self.settings.get('psm', 0)
         index = self.psm_combo.findData(current_psm)
         if index >= 0:
             self.psm_combo.setCurrentIndex(index)
-        self.psm_combo.currentIndexChanged.connect(self._on_change)
+        self.psm_combo.currentIndexChanged.connect(
+            lambda i: self._on_change(psm=self.psm_combo.itemData(i)))
         psm_layout.addWidget(self.psm_combo)
         tess_layout.addLayout(psm_layout)
         
@@ -121,12 +133,13 @@ class OCRSettingsDialog(QDialog):
 
     def _on_thresh_change(self, value):
         self.thresh_val_label.setText(str(value))
-        self._on_change()
+        self._on_change(threshold=value)
 
-    def _on_change(self):
-        self.settings['threshold'] = self.thresh_slider.value()
-        self.settings['scale_factor'] = self.scale_spin.value()
-        self.settings['invert'] = self.invert_check.isChecked()
-        self.settings['psm'] = self.psm_combo.currentData()
-        
+    def _on_change(self, **changes):
+        """Record the values a control just reported and schedule an emit."""
+        self.settings.update(changes)
+        # Restarting the timer means the last change in the window wins
+        self._emit_timer.start()
+
+    def _emit_now(self):
         self.settings_changed.emit(self.settings)
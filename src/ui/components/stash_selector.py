@@ -4,7 +4,30 @@ Stash tab selection widget.
 
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
                              QScrollArea, QFrame, QGridLayout, QLabel, QLineEdit)
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
+
+# Keystrokes closer together than this are filtered as one
+FILTER_DEBOUNCE_MS = 120
+
+# Shared by every tab button; load_tabs appends one colour rule per distinct tab colour
+STASH_TAB_QSS = """
+    QPushButton[stashTab="true"] {
+        border: 1px solid #555;
+        border-radius: 4px;
+        padding: 4px;
+    }
+    QPushButton[stashTab="true"]:checked {
+        border: 2px solid #FFF;
+        font-weight: bold;
+    }
+"""
+
+STASH_COLOUR_QSS = """
+    QPushButton[stashColour="{key}"] {{
+        background-color: rgb({r}, {g}, {b});
+        color: {text_color};
+    }}
+"""
 
 
 class StashTabButton(QPushButton):
@@ -21,26 +44,19 @@ class StashTabButton(QPushButton):
         self.setCheckable(True)
         self.setFixedHeight(30)
         
-        r = self.color_data.get('r', 100)
-        g = self.color_data.get('g', 100)
-        b = self.color_data.get('b', 100)
+        color = self.color_data
+        r, g, b = color.get('r', 100), color.get('g', 100), color.get('b', 100)
         
-        lum = (0.299 * r + 0.587 * g + 0.114 * b)
+        # Integer Rec. 601 luma: weights 77/150/29 out of 256
+        lum = (r * 77 + g * 150 + b * 29) >> 8
         text_color = "black" if lum > 128 else "white"
         
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: rgb({r}, {g}, {b});
-                color: {text_color};
-                border: 1px solid #555;
-                border-radius: 4px;
-                padding: 4px;
-            }}
-            QPushButton:checked {{
-                border: 2px solid #FFF;
-                font-weight: bold;
-            }}
-        """)
+        # Styled by the selector's shared sheet, matched on these properties
+        self.colour_key = f"{r}_{g}_{b}"
+        self.colour_rule = STASH_COLOUR_QSS.format(key=self.colour_key, r=r, g=g, b=b,
+                                                   text_color=text_color)
+        self.setProperty("stashTab", True)
+        self.setProperty("stashColour", self.colour_key)
 
 
 class StashTabSelector(QWidget):
@@ -51,6 +67,11 @@ class StashTabSelector(QWidget):
         self.selected_indices = set()
         self.buttons = {}
         self.tabs_list = []
+        self._tab_name_lower = {}     # tab index -> lowercased name, in tab order
+        self._last_filter_text = None
+        self._trigrams = {}           # 3-char substring of a lowercased name -> tab indices
+        self._visible = set()         # tab indices currently shown
+        self._grid_pos = {}           # tab index -> (row, col) while in the grid
         
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(0, 0, 0, 0)
@@ -59,7 +80,12 @@ class StashTabSelector(QWidget):
         filter_layout = QHBoxLayout()
         self.filter_input = QLineEdit()
         self.filter_input.setPlaceholderText("Filter tabs (e.g. 'Ult')...")
-        self.filter_input.textChanged.connect(self.apply_filter)
+        # Restarting the single-shot timer on each keystroke lays the grid out once per burst
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(FILTER_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self.apply_filter)
+        self.filter_input.textChanged.connect(lambda _text: self._filter_timer.start())
         filter_layout.addWidget(self.filter_input)
         
         self.sel_all_btn = QPushButton("All")
@@ -93,6 +119,16 @@ class StashTabSelector(QWidget):
     def load_tabs(self, tabs_list, preselected_indices=None):
         """Populates the grid with tab buttons."""
         self.tabs_list = tabs_list
+        # Lowercased once here instead of on every keystroke
+        self._tab_name_lower = {tab['i']: (tab.get('n') or '').lower() for tab in tabs_list or ()}
+        self._last_filter_text = None
+        self._visible = set()
+        self._grid_pos = {}
+        
+        self._trigrams = {}
+        for idx, name in self._tab_name_lower.items():
+            for i in range(len(name) - 2):
+                self._trigrams.setdefault(name[i:i + 3], set()).add(idx)
         
         self.clear_grid()
         self.buttons.clear()
@@ -114,6 +150,10 @@ class StashTabSelector(QWidget):
                 self.selected_indices.add(tab['i'])
                 
             self.buttons[tab['i']] = btn
+        
+        # One sheet parse for all buttons, with a rule per colour rather than per tab
+        colour_rules = {btn.colour_key: btn.colour_rule for btn in self.buttons.values()}
+        self.scroll_content.setStyleSheet(STASH_TAB_QSS + "".join(colour_rules.values()))
 
         self.apply_filter()
         self.update_status()
@@ -126,20 +166,76 @@ class StashTabSelector(QWidget):
 
     def apply_filter(self):
         text = self.filter_input.text().lower()
-        self.clear_grid()
+        prev = self._last_filter_text
+        if text == prev:
+            return
+        self._last_filter_text = text
+        
+        if prev is not None and prev in text:
+            # Narrowed: only tabs shown now can still match
+            self._visible = self._matching(text, self._visible)
+        else:
+            candidates = self._trigram_candidates(text)
+            if candidates is None:
+                candidates = self._tab_name_lower.keys()
+            if prev is not None and text in prev:
+                # Widened: everything shown still matches, re-check the hidden ones
+                self._visible |= self._matching(text, candidates - self._visible)
+            else:
+                self._visible = self._matching(text, candidates)
         
-        visible_buttons = []
-        for tab in self.tabs_list:
-            if text in tab.get('n', '').lower():
-                if tab['i'] in self.buttons:
-                    visible_buttons.append(self.buttons[tab['i']])
+        self._place_buttons()
+
+    def _matching(self, text, indices):
+        """The tabs among indices whose lowercased name contains text."""
+        names = self._tab_name_lower
+        return {idx for idx in indices if text in names[idx]}
+
+    def _trigram_candidates(self, text):
+        """
+        Tabs whose names contain every 3-char piece of text, or None when
+        text is too short to index. A superset of the matches; the substring
+        test still decides.
+        """
+        if len(text) < 3:
+            return None
+        postings = []
+        for i in range(len(text) - 2):
+            posting = self._trigrams.get(text[i:i + 3])
+            if not posting:
+                return set()
+            postings.append(posting)
+        postings.sort(key=len)
+        return set.intersection(*postings)
+
+    def _place_buttons(self):
+        """
+        Pack the visible buttons into the grid in tab order.
         
+        Buttons stay parented to the grid's widget; only those whose cell
+        changed are moved, and filtered-out ones are taken out of the grid
+        and hidden.
+        """
         cols = 4
-        for i, btn in enumerate(visible_buttons):
-            row = i // cols
-            col = i % cols
-            self.grid.addWidget(btn, row, col)
-            btn.setVisible(True)
+        slot = 0
+        for idx in self._tab_name_lower:
+            btn = self.buttons[idx]
+            pos = self._grid_pos.get(idx)
+            if idx in self._visible:
+                cell = divmod(slot, cols)
+                slot += 1
+                if pos == cell:
+                    continue
+                if pos is not None:
+                    self.grid.removeWidget(btn)
+                self.grid.addWidget(btn, *cell)
+                self._grid_pos[idx] = cell
+                if pos is None:
+                    btn.setVisible(True)
+            elif pos is not None:
+                self.grid.removeWidget(btn)
+                btn.setVisible(False)
+                del self._grid_pos[idx]
 
     def bulk_select(self, select: bool):
         for i in range(self.grid.count()):
@@ -0,0 +1,88 @@
+"""
+Global hotkeys via Win32 RegisterHotKey.
+"""
+
+import sys
+import ctypes
+from PyQt6.QtCore import QObject, QAbstractNativeEventFilter, QCoreApplication, pyqtSignal
+
+if sys.platform == "win32":
+    from ctypes import wintypes
+    _user32 = ctypes.windll.user32
+    HAS_HOTKEYS = True
+else:
+    HAS_HOTKEYS = False
+
+WM_HOTKEY = 0x0312
+
+MOD_ALT = 0x0001
+MOD_CONTROL = 0x0002
+MOD_SHIFT = 0x0004
+MOD_NOREPEAT = 0x4000
+
+VK_ESCAPE = 0x1B
+
+
+class _HotkeyEventFilter(QAbstractNativeEventFilter):
+    """Forwards WM_HOTKEY messages for a single hotkey id to a callback."""
+
+    def __init__(self, hotkey_id: int, callback):
+        super().__init__()
+        self.hotkey_id = hotkey_id
+        self.callback = callback
+
+    def nativeEventFilter(self, event_type, message):
+        if bytes(event_type) == b"windows_generic_MSG":
+            msg = wintypes.MSG.from_address(int(message))
+            if msg.message == WM_HOTKEY and msg.wParam == self.hotkey_id:
+                self.callback()
+                return True, 0
+        return False, 0
+
+
+class GlobalHotkey(QObject):
+    """
+    System-wide hotkey dispatched by the OS.
+
+    Unlike a low-level keyboard hook, Windows only notifies us when the
+    combination is pressed, and the message arrives on the GUI thread.
+    Register and unregister from the GUI thread.
+    """
+
+    activated = pyqtSignal()
+
+    _next_id = 1
+
+    def __init__(self, modifiers: int, vk: int, parent=None):
+        super().__init__(parent)
+        self.modifiers = modifiers
+        self.vk = vk
+        self.hotkey_id = GlobalHotkey._next_id
+        GlobalHotkey._next_id += 1
+        self._filter = None
+
+    def is_registered(self) -> bool:
+        return self._filter is not None
+
+    def register(self) -> bool:
+        """Register the hotkey. Returns False if unsupported or already taken."""
+        if self._filter is not None:
+            return True
+        if not HAS_HOTKEYS:
+            return False
+
+        if not _user32.RegisterHotKey(None, self.hotkey_id, self.modifiers | MOD_NOREPEAT, self.vk):
+            return False
+
+        self._filter = _HotkeyEventFilter(self.hotkey_id, self.activated.emit)
+        QCoreApplication.instance().installNativeEventFilter(self._filter)
+        return True
+
+    def unregister(self):
+        """Release the hotkey if registered."""
+        if self._filter is None:
+            return
+
+        _user32.UnregisterHotKey(None, self.hotkey_id)
+        QCoreApplication.instance().removeNativeEventFilter(self._filter)
+        self._filter = None
@@ -10,17 +10,18 @@ class DebugLogger:
     """Simple file-based debug logger."""
     
     LOG_FILE = "debug.log"
-    _enabled = False
+    # Public so hot loops can skip building the message: `if DebugLogger.enabled:`
+    enabled = False
 
     @classmethod
     def set_enabled(cls, enabled: bool):
-        cls._enabled = enabled
+        cls.enabled = enabled
         if enabled:
             cls.log("--- Debug Session Started ---")
 
     @classmethod
     def log(cls, message: str, component: str = "System"):
-        if not cls._enabled:
+        if not cls.enabled:
             return
         
         timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
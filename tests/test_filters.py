@@ -0,0 +1,35 @@
+"""
+Tests for ScanColumns.mask.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from core.filters import ScanColumns, read_filter_config
+
+
+def _item(type_, reward, tier, profit):
+    return {'type': type_, 'reward': reward, 'monster_life_pct': tier, '_net_profit_chaos': profit}
+
+
+ITEMS = [
+    _item('Survive', 'Divine Orb', 30, 100.0),
+    _item('Defeat Waves', 'Chaos Orb', 60, 50.0),
+    _item('Stand Stones', 'Mirror', 60, 5.0),
+    _item('Survive', 'Exalted Orb', 90, 25.0),
+]
+
+
+@pytest.mark.parametrize("cfg, expected", [
+    ({}, [True, True, False, True]),
+    ({'excluded_tiers': [60]}, [True, False, False, True]),
+    ({'included_tiers': [60]}, [True, True, True, True]),
+    ({'excluded_tiers': [60], 'included_tiers': [90], 'min_profit': 60}, [True, False, False, True]),
+    ({'excluded_types': ['Survive'], 'included_rewards': ['Mirror']}, [False, True, True, False]),
+])
+def test_mask_accepts_read_filter_config(cfg, expected):
+    columns = ScanColumns(ITEMS)
+    assert columns.mask(read_filter_config(cfg)).tolist() == expected
+    # The widget passes the raw config lists
+    assert columns.mask(cfg).tolist() == expected
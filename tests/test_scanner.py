@@ -0,0 +1,23 @@
+"""
+Tests for ScannerWorker construction.
+"""
+
+import pytest
+
+pytest.importorskip("PyQt6.QtCore")
+pytest.importorskip("cv2")
+pytest.importorskip("mss")
+pytest.importorskip("pytesseract")
+
+from tools.league_vision.scanner import ScannerWorker
+
+
+def test_missing_tesseract_warning_is_queued(tmp_path):
+    missing = str(tmp_path / "tesseract.exe")
+    worker = ScannerWorker({"tesseract_path": missing})
+    
+    batches = []
+    worker.status_batch_signal.connect(batches.append)
+    worker.flush_status(force=True)
+    
+    assert batches == [[f"WARNING: Tesseract not found at {missing}"]]